@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite driving scripted stress scenarios through Game
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+# Run without a window or audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import pygame
+from settings import *
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+WARMUP_FRAMES = 30
+ALLOC_FRAMES = 30
+# Differences below these floors are treated as noise
+NOISE_FLOOR = {'update_ms': 0.25, 'render_ms': 0.25, 'alloc_kb': 16.0}
+
+
+@dataclass
+class Scenario:
+    """A scripted stress scenario"""
+    name: str
+    description: str
+    setup: Callable
+    step: Optional[Callable] = None  # Called before every frame
+    seed: int = 1234
+
+
+def _start_play(game) -> None:
+    """Skip the instructions and launch every ball"""
+    game.show_instructions = False
+    game.lives = 10 ** 6  # Never reach game over mid-run
+    for ball in game.balls:
+        ball.launch()
+
+
+def _top_up_balls(game, count: int) -> None:
+    """Use the MULTI power-up until at least `count` balls are in play"""
+    if not game.balls:
+        game.create_ball(is_original=True).launch()
+    while len(game.balls) < count:
+        game._apply_powerup("MULTI")
+
+
+def setup_multiball(game) -> None:
+    """Start with 200 balls in play"""
+    _start_play(game)
+    _top_up_balls(game, 200)
+
+
+def step_multiball(game) -> None:
+    """Replace lost balls so 200 stay in play"""
+    _top_up_balls(game, 200)
+
+
+def setup_dense_level(game) -> None:
+    """Fill the screen with 7-hit bricks and 20 balls"""
+    _start_play(game)
+    columns = SCREEN_WIDTH // (BRICK_WIDTH + BRICK_PADDING)
+    game.load_layout(["7" * columns] * 8)
+    _top_up_balls(game, 20)
+
+
+def step_dense_level(game) -> None:
+    """Keep 20 balls in play"""
+    _top_up_balls(game, 20)
+
+
+def setup_particle_storm(game) -> None:
+    """Start play with the default level"""
+    _start_play(game)
+
+
+def step_particle_storm(game) -> None:
+    """Emit ten 30-particle bursts"""
+    for _ in range(10):
+        game._add_particles(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT),
+                            random.choice([RED, GREEN, BLUE, YELLOW]), 30)
+
+
+def setup_constant_shake(game) -> None:
+    """Start play with the default level"""
+    _start_play(game)
+
+
+def step_constant_shake(game) -> None:
+    """Keep the screen shaking"""
+    game.shake_amount = 3
+    game.shake_time = pygame.time.get_ticks() + 100
+
+
+def setup_falling_powerups(game) -> None:
+    """Start play with 50 power-ups falling"""
+    _start_play(game)
+    step_falling_powerups(game)
+
+
+def step_falling_powerups(game) -> None:
+    """Keep 50 power-ups falling"""
+    # Spawn away from the paddle so none are collected
+    lanes = [x for x in range(POWERUP_SIZE, SCREEN_WIDTH - POWERUP_SIZE, POWERUP_SIZE)
+             if abs(x - game.paddle.rect.centerx) > WIDE_PADDLE_WIDTH]
+    while len(game.powerups) < 50:
+        powerup = game.powerup_pool.acquire(random.choice(lanes), random.randint(0, SCREEN_HEIGHT // 2),
+                                            random.choice(list(POWERUPS.keys())))
+        game.powerups.add(powerup)
+
+
+def _ball_collision_scenario(count: int) -> Scenario:
+    """Keep `count` balls in play with ball-to-ball collisions on"""
+    def setup(game) -> None:
+        _start_play(game)
+        game.ball_collisions = True
+        _top_up_balls(game, count)
+
+    def step(game) -> None:
+        _top_up_balls(game, count)
+
+    return Scenario(f"ball_collisions_{count}", f"{count} colliding balls", setup, step)
+
+
+def setup_autopilot(game) -> None:
+    """Let the autopilot play the default level"""
+    _start_play(game)
+    game.autopilot.enabled = True
+
+
+def setup_huge_level(game) -> None:
+    """Let the autopilot play a level 60 bricks wide and 60 rows tall"""
+    _start_play(game)
+    rng = random.Random(60)
+    game.load_layout(["".join(rng.choice("1234567 ") for _ in range(60)) for _ in range(60)])
+    game.autopilot.enabled = True
+
+
+def setup_endless(game) -> None:
+    """Stream endless rows under 20 balls"""
+    _start_play(game)
+    game.endless.enabled = True
+    game.load_endless()
+    _top_up_balls(game, 20)
+
+
+def step_endless(game) -> None:
+    """Scroll fast enough to recycle a row every few frames and keep 20 balls in play"""
+    game.endless.update(game.bricks, game.brick_grid, 8.0)
+    _top_up_balls(game, 20)
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("multiball_200", "200 simultaneous balls via MULTI", setup_multiball, step_multiball),
+    Scenario("dense_level", "Full screen of 7-hit bricks with 20 balls",
+             setup_dense_level, step_dense_level),
+    Scenario("particle_storm", "300 new particles per frame", setup_particle_storm,
+             step_particle_storm),
+    Scenario("constant_shake", "Screen shake on every frame", setup_constant_shake,
+             step_constant_shake),
+    Scenario("falling_powerups", "50 falling power-ups", setup_falling_powerups,
+             step_falling_powerups),
+    Scenario("autopilot", "Regular play driven by the autopilot", setup_autopilot),
+    Scenario("huge_level", "Autopilot on a 60x60 level under a scrolling camera", setup_huge_level),
+    Scenario("endless", "Endless rows recycled every few frames with 20 balls",
+             setup_endless, step_endless),
+    _ball_collision_scenario(10),
+    _ball_collision_scenario(100),
+    _ball_collision_scenario(500),
+    _ball_collision_scenario(1000),
+]
+
+
+def _make_game(screen: pygame.Surface, scenario: Scenario, gc_policy: bool = True):
+    """Create a fresh, seeded game for a scenario"""
+    from game import Game
+    random.seed(scenario.seed)
+    game = Game(screen)
+    if not gc_policy:
+        game.gc_policy.toggle()
+    game.font = pygame.font.Font(None, FONT_SIZE)
+    scenario.setup(game)
+    return game
+
+
+def _frame(game, scenario: Scenario) -> None:
+    """Advance the scenario by one untimed frame"""
+    if scenario.step:
+        scenario.step(game)
+    game.update()
+    game.render()
+
+
+def run_scenario(screen: pygame.Surface, scenario: Scenario, frames: int,
+                 gc_policy: bool = True) -> Dict[str, float]:
+    """Run one scenario and return its per-frame metrics"""
+    game = _make_game(screen, scenario, gc_policy)
+    for _ in range(WARMUP_FRAMES):
+        _frame(game, scenario)
+    game.gc_policy.pauses.clear()
+
+    # Timing pass
+    update_times = []
+    render_times = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        if scenario.step:
+            scenario.step(game)
+        t0 = time.perf_counter()
+        game.update()
+        t1 = time.perf_counter()
+        game.render()
+        t2 = time.perf_counter()
+        update_times.append((t1 - t0) * 1000)
+        render_times.append((t2 - t1) * 1000)
+    elapsed = time.perf_counter() - start
+    gc_stats = game.gc_policy.stats()
+
+    # Allocation pass, kept separate so tracing doesn't skew the timings
+    tracemalloc.start()
+    alloc_sizes = []
+    for _ in range(ALLOC_FRAMES):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        _frame(game, scenario)
+        alloc_sizes.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    tracemalloc.stop()
+
+    return {
+        'update_ms': statistics.mean(update_times),
+        'update_p95_ms': sorted(update_times)[int(0.95 * len(update_times))],
+        'render_ms': statistics.mean(render_times),
+        'render_p95_ms': sorted(render_times)[int(0.95 * len(render_times))],
+        'alloc_kb': statistics.mean(alloc_sizes),
+        'fps': frames / elapsed,
+        'gc_max_ms': gc_stats['max_ms'],
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Return a message for every metric that regressed beyond the tolerance,
+    and for every scenario the baseline doesn't cover"""
+    regressions = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            regressions.append(f"{name}: no baseline (run with --update-baseline)")
+            continue
+        for metric, floor in NOISE_FLOOR.items():
+            old = baseline[name].get(metric)
+            new = metrics[metric]
+            if old is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append(f"{name}.{metric}: {old:.2f} -> {new:.2f}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--frames', type=int, default=300, help="timed frames per scenario")
+    parser.add_argument('--scenario', action='append', help="run only the named scenario(s)")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed slowdown against the baseline (0.5 = 50%%)")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    parser.add_argument('--no-gc-policy', action='store_true',
+                        help="run with CPython's default collector to compare GC pauses")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = {}
+    print(f"{'scenario':<20}{'update ms':>10}{'render ms':>10}{'alloc KB':>10}{'fps':>9}"
+          f"{'gc max ms':>10}")
+    for scenario in scenarios:
+        metrics = run_scenario(screen, scenario, args.frames, gc_policy=not args.no_gc_policy)
+        results[scenario.name] = metrics
+        print(f"{scenario.name:<20}{metrics['update_ms']:>10.2f}{metrics['render_ms']:>10.2f}"
+              f"{metrics['alloc_kb']:>10.1f}{metrics['fps']:>9.0f}{metrics['gc_max_ms']:>10.2f}")
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("No baseline found; run with --update-baseline to create one.")
+        return 0
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nPERFORMANCE REGRESSION against baseline:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Per-frame allocation, Surface-count and GC tracking
+"""
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from types import FrameType
+from typing import Deque, Dict, List, Optional
+import pygame
+from settings import *
+
+_original_surface = pygame.Surface
+_original_rotate = pygame.transform.rotate
+_original_scale = pygame.transform.scale
+
+
+class TrackedSurface(pygame.Surface):
+    """Surface subclass that reports every construction to the active tracker"""
+    tracker: Optional['AllocationTracker'] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        tracker = TrackedSurface.tracker
+        if tracker is not None:
+            tracker.record_surface(sys._getframe(1), self)
+
+
+def _tracked_rotate(surface: pygame.Surface, angle: float) -> pygame.Surface:
+    """pygame.transform.rotate that reports the new Surface"""
+    result = _original_rotate(surface, angle)
+    if TrackedSurface.tracker is not None:
+        TrackedSurface.tracker.record_surface(sys._getframe(1), result)
+    return result
+
+
+def _tracked_scale(surface: pygame.Surface, size, *args, **kwargs) -> pygame.Surface:
+    """pygame.transform.scale that reports the new Surface (scaling into a given one allocates none)"""
+    result = _original_scale(surface, size, *args, **kwargs)
+    if TrackedSurface.tracker is not None and not args and kwargs.get('dest_surface') is None:
+        TrackedSurface.tracker.record_surface(sys._getframe(1), result)
+    return result
+
+
+def _call_site(frame: FrameType) -> str:
+    """Return a `file:line (function)` label for a frame"""
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} ({name})"
+
+
+class AllocationTracker:
+    """Counts Surfaces, traced bytes and GC collections per frame.
+
+    The hooks are process-wide, so with a pipelined loop Surfaces made on the
+    simulation thread count towards the frame being rendered; a lock keeps
+    the counters consistent between the two threads.
+    """
+
+    def __init__(self, history: int = FRAME_TIMER_HISTORY, output_dir: str = PROFILE_DIR) -> None:
+        """Initialize a disabled tracker"""
+        self.enabled = False
+        self.output_dir = output_dir
+        self._lock = threading.RLock()  # Re-entered by GC callbacks during a locked allocation
+        self.history: Deque[Dict[str, float]] = deque(maxlen=history)
+
+        # Current frame counters
+        self.frame_surfaces = 0
+        self.frame_surface_bytes = 0
+        self.frame_collections = 0
+        self._frame_start_bytes = 0
+
+        # Session totals
+        self.frames = 0
+        self.site_counts: Counter = Counter()
+        self.site_bytes: Counter = Counter()
+        self.total_collections = 0
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        """Install the Surface hooks and start tracing"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.history.clear()
+        self.frames = 0
+        self.site_counts.clear()
+        self.site_bytes.clear()
+        self.total_collections = 0
+
+        TrackedSurface.tracker = self
+        pygame.Surface = TrackedSurface
+        pygame.transform.rotate = _tracked_rotate
+        pygame.transform.scale = _tracked_scale
+        gc.callbacks.append(self._on_gc)
+        tracemalloc.start()
+        self._start_snapshot = tracemalloc.take_snapshot()
+        print("Allocation tracking started")
+
+    def stop(self) -> Optional[str]:
+        """Remove the hooks, stop tracing and write the session report"""
+        if not self.enabled:
+            return None
+        end_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        gc.callbacks.remove(self._on_gc)
+        pygame.Surface = _original_surface
+        pygame.transform.rotate = _original_rotate
+        pygame.transform.scale = _original_scale
+        TrackedSurface.tracker = None
+        self.enabled = False
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"alloc-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, 'w') as f:
+            json.dump(self.report(end_snapshot), f, indent=2)
+        print(f"Allocation tracking stopped: report written to {path}")
+        return path
+
+    def toggle(self) -> None:
+        """Start tracking if stopped, otherwise stop and write the report"""
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+
+    def record_surface(self, frame: FrameType, surface: pygame.Surface) -> None:
+        """Count a newly created Surface against its call site"""
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        site = _call_site(frame)
+        with self._lock:
+            self.frame_surfaces += 1
+            self.frame_surface_bytes += size
+            self.site_counts[site] += 1
+            self.site_bytes[site] += size
+
+    def _on_gc(self, phase: str, info: Dict) -> None:
+        """gc callback counting finished collections"""
+        if phase == 'stop':
+            with self._lock:
+                self.frame_collections += 1
+                self.total_collections += 1
+
+    def begin_frame(self) -> None:
+        """Reset the per-frame counters"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.frame_surfaces = 0
+            self.frame_surface_bytes = 0
+            self.frame_collections = 0
+            tracemalloc.reset_peak()
+            self._frame_start_bytes = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self) -> None:
+        """Store the counters for the frame that just finished"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.frames += 1
+            self.history.append({
+                'surfaces': self.frame_surfaces,
+                'surface_kb': self.frame_surface_bytes / 1024,
+                'python_kb': (tracemalloc.get_traced_memory()[1] - self._frame_start_bytes) / 1024,
+                'collections': self.frame_collections,
+            })
+
+    def averages(self) -> Dict[str, float]:
+        """Return the mean of every per-frame counter over the recent history"""
+        if not self.history:
+            return {'surfaces': 0, 'surface_kb': 0, 'python_kb': 0, 'collections': 0}
+        return {key: sum(frame[key] for frame in self.history) / len(self.history)
+                for key in self.history[0]}
+
+    def overlay_lines(self) -> List[str]:
+        """Return text lines for the debug overlay"""
+        if not self.enabled:
+            return []
+        with self._lock:
+            avg = self.averages()
+            top_sites = self.site_counts.most_common(3)
+        lines = [f"surfaces/frame {avg['surfaces']:5.1f}  {avg['surface_kb']:7.1f} KB",
+                 f"python KB/frame {avg['python_kb']:6.1f}  gc/frame {avg['collections']:4.2f}"]
+        for site, count in top_sites:
+            lines.append(f"  {count / max(1, self.frames):5.1f}/f {site}")
+        return lines
+
+    def report(self, end_snapshot: Optional[tracemalloc.Snapshot] = None) -> Dict:
+        """Build the per-session report"""
+        frames = max(1, self.frames)
+        with self._lock:
+            data = {
+                'frames': self.frames,
+                'recent_averages': self.averages(),
+                'gc_collections': self.total_collections,
+                'surface_sites': [
+                    {'site': site, 'per_frame': count / frames,
+                     'kb_per_frame': self.site_bytes[site] / frames / 1024}
+                    for site, count in self.site_counts.most_common()
+                ],
+            }
+        if end_snapshot is not None and self._start_snapshot is not None:
+            growth = end_snapshot.compare_to(self._start_snapshot, 'lineno')
+            data['python_growth_sites'] = [
+                {'site': str(stat.traceback), 'kb': stat.size_diff / 1024, 'blocks': stat.count_diff}
+                for stat in growth[:10]
+            ]
+        return data
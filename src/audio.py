@@ -0,0 +1,119 @@
+"""
+Voice-limited sound mixer: reserved channel pools, rate limits and priorities
+"""
+import os
+from typing import Dict, List, Optional, Tuple
+import pygame
+from settings import *
+
+
+class Mixer:
+    """Plays the game's sounds on a fixed set of reserved channels.
+
+    Each category in SOUND_CHANNEL_POOLS owns its own channels, so a storm of
+    impacts can never take the channel a power-up or game over sound needs.
+    A sound that starts again within its min_interval is dropped, and when
+    its pool is full it cuts off the pool's oldest voice of lower or equal
+    priority, or is dropped if every voice outranks it. The number of voices
+    and the work per frame therefore stay bounded however many balls hit
+    something at once.
+
+    pygame decodes a sound and converts it to the mixer's output format when
+    it's loaded; with predecode on that happens for every sound at startup,
+    otherwise on each sound's first play.
+    """
+
+    def __init__(self, pools: Dict[str, int] = SOUND_CHANNEL_POOLS,
+                 mix: Dict[str, SoundMix] = SOUND_MIX, predecode: bool = SOUND_PREDECODE) -> None:
+        """Initialize a mixer with no sounds; load() reserves the channels and finds the files"""
+        self.pool_sizes = dict(pools)
+        self.mix = dict(mix)
+        self.predecode = predecode
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}  # Decoded sounds
+        self.paths: Dict[str, str] = {}  # Sounds found but not decoded yet
+        self.pools: Dict[str, List[int]] = {}  # Category -> reserved channel numbers
+        self.dropped = 0  # Plays skipped by the rate limit or a full pool
+        self._channels: List[pygame.mixer.Channel] = []
+        self._voices: List[Tuple[int, int]] = []  # (priority, start time) last started on each channel
+        self._last_played: Dict[str, int] = {}
+
+    def load(self, sounds: Dict[str, str], directory: str) -> None:
+        """Reserve the channel pools and load `sounds` (name -> file in `directory`)"""
+        if not pygame.mixer.get_init():
+            print("Sound system not available. Running without sound.")
+            return
+        self._reserve_channels()
+        for name, file in sounds.items():
+            path = os.path.join(directory, file)
+            if not os.path.exists(path):
+                print(f"Warning: Sound file not found: {path}")
+                continue
+            self.paths[name] = path
+            if self.predecode:
+                self._sound(name)
+
+    def _reserve_channels(self) -> None:
+        """Keep the pools' channels out of pygame's automatic channel allocation"""
+        total = sum(self.pool_sizes.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self._channels = [pygame.mixer.Channel(i) for i in range(total)]
+        self._voices = [(0, 0)] * total
+        self.pools = {}
+        first = 0
+        for category, size in self.pool_sizes.items():
+            self.pools[category] = list(range(first, first + size))
+            first += size
+
+    def _sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Return a decoded sound, decoding it now if needed"""
+        sound = self.sounds.get(name)
+        if sound is None and name in self.paths:
+            path = self.paths.pop(name)
+            try:
+                sound = self.sounds[name] = pygame.mixer.Sound(path)
+            except pygame.error as e:
+                print(f"Warning: Could not load sound {os.path.basename(path)}: {e}")
+        return sound
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a sound is available to play"""
+        return name in self.sounds or name in self.paths
+
+    def play(self, name: str, now: Optional[int] = None) -> bool:
+        """Start a sound unless it's rate limited or outranked; returns True if it started"""
+        if name not in self or not self._channels:
+            return False
+        now = pygame.time.get_ticks() if now is None else now
+        mix = self.mix.get(name) or SoundMix(next(iter(self.pools)), 0, 0)
+
+        # Repeats too close together add nothing but mixer work
+        last = self._last_played.get(name)
+        if last is not None and now - last < mix.min_interval:
+            self.dropped += 1
+            return False
+
+        channel = self._free_voice(self.pools[mix.category], mix.priority)
+        sound = self._sound(name)
+        if channel is None or sound is None:
+            self.dropped += 1
+            return False
+        try:
+            self._channels[channel].play(sound)
+        except pygame.error:
+            return False  # Silently fail if sound can't be played
+        self._voices[channel] = (mix.priority, now)
+        self._last_played[name] = now
+        return True
+
+    def _free_voice(self, pool: List[int], priority: int) -> Optional[int]:
+        """Return an idle channel in `pool`, else the one to cut off, else None"""
+        for channel in pool:
+            if not self._channels[channel].get_busy():
+                return channel
+        # Steal the lowest-priority voice, the oldest among equals
+        channel = min(pool, key=self._voices.__getitem__)
+        if self._voices[channel][0] > priority:
+            return None
+        return channel
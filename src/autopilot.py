@@ -0,0 +1,110 @@
+"""
+Autopilot paddle controller that predicts ball landings analytically
+"""
+import math
+from typing import Collection, Dict, Hashable, Optional, Tuple
+from settings import *
+from sprites import Ball, Paddle
+from brick_grid import BrickGrid
+from trajectory import trace_path
+
+
+class Autopilot:
+    """Steers the paddle under the lowest descending ball without reading the keyboard.
+
+    A landing point is traced once per straight segment of a ball's path and
+    reused until the ball bounces, changes speed or the bricks break or move,
+    so most frames only pick a ball and compare a cache key.
+    """
+
+    def __init__(self, aim: bool = AUTOPILOT_AIM) -> None:
+        """Initialize a disabled autopilot"""
+        self.enabled = False
+        self.aim = aim  # Also pick a paddle offset that sends the ball at a brick
+        self.target_x: Optional[float] = None  # Paddle centre the autopilot steers to
+        self._plans: Dict[Ball, Tuple[Hashable, Optional[float], float]] = {}
+
+    def toggle(self) -> None:
+        """Enable or disable the autopilot"""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget cached landing predictions"""
+        self._plans.clear()
+        self.target_x = None
+
+    @staticmethod
+    def step_velocity(ball: Ball) -> Tuple[int, int]:
+        """Return the pixels the ball actually moves per frame.
+
+        Ball.update adds float steps to an integer Rect, which rounds them half
+        up, so predictions use the rounded step to stay on the real path.
+        """
+        factor = (ball.speed * 0.5 if ball.is_slow else ball.speed) / BALL_SPEED
+        return math.floor(ball.dx * factor + 0.5), math.floor(ball.dy * factor + 0.5)
+
+    def plan(self, paddle: Paddle, balls: Collection[Ball], grid: BrickGrid,
+             brick_count: int) -> float:
+        """Choose where the paddle centre should go this frame"""
+        # The lowest falling ball is the next one to catch
+        lowest = None
+        for ball in balls:
+            if (ball.is_active and not ball.is_stuck and ball.dy > 0 and
+                    (lowest is None or ball.rect.centery > lowest.rect.centery)):
+                lowest = ball
+        if lowest is None:
+            # Nothing falling: hold still
+            self.target_x = paddle.rect.centerx
+            return self.target_x
+
+        velocity = self.step_velocity(lowest)
+        landing_y = paddle.rect.top - lowest.radius
+        # vy * x - vx * y stays constant while the ball keeps to one straight segment
+        x, y = lowest.rect.center
+        key = (velocity, velocity[1] * x - velocity[0] * y, paddle.width, brick_count, grid.origin)
+        cached = self._plans.get(lowest)
+        # A ball that runs past its predicted first bounce only grazed a corner: replan
+        if cached is not None and cached[0] == key and y <= cached[2] + velocity[1]:
+            target = cached[1]
+        else:
+            path = trace_path(grid, (x, y), velocity, lowest.radius, AUTOPILOT_BOUNCES,
+                              floor_y=landing_y, width=paddle.world.right)
+            end = path[-1]
+            if end.kind != "floor":
+                # Too many bounces ahead to predict: shadow the ball until it settles
+                target = None
+            else:
+                offset = (self._aim_offset(grid, end.x, landing_y, math.hypot(*velocity), paddle.world.right,
+                                            paddle.world.bottom + BALL_RADIUS)
+                          if self.aim else 0.0)
+                target = end.x - offset * paddle.width / 2
+            # Drop plans for balls that have since bounced up or left play
+            self._plans = {ball: plan for ball, plan in self._plans.items()
+                           if ball.dy > 0 and ball in balls}
+            self._plans[lowest] = (key, target, path[1].y)
+        self.target_x = lowest.rect.centerx if target is None else target
+        return self.target_x
+
+    @staticmethod
+    def _aim_offset(grid: BrickGrid, x: float, y: float, step: float,
+                    width: float = SCREEN_WIDTH, floor_y: float = SCREEN_HEIGHT + BALL_RADIUS) -> float:
+        """Return the paddle hit offset (-1..1 of its half-width) that reaches a breakable brick.
+
+        Mirrors Ball.check_paddle_collision: the offset maps linearly to up to
+        60 degrees off vertical, and `step` is the ball's speed in pixels per
+        frame. `width` and `floor_y` bound the playfield the path is traced
+        in. Offsets nearest the centre are tried first so the catch keeps a
+        safety margin.
+        """
+        for offset in AUTOPILOT_AIM_OFFSETS:
+            angle = offset * (math.pi / 3)
+            # Follow wall bounces too, so bricks in corners can be reached
+            velocity = (math.floor(math.sin(angle) * step + 0.5),
+                        math.floor(-math.cos(angle) * step + 0.5))
+            path = trace_path(grid, (x, y), velocity, BALL_RADIUS, AUTOPILOT_AIM_BOUNCES,
+                              floor_y=floor_y, width=width)
+            brick = next((point.brick for point in path if point.kind == "brick"), None)
+            if brick is not None and brick.is_breakable:
+                return offset
+        return 0.0
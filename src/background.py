@@ -0,0 +1,120 @@
+"""
+Parallax background layers built from pre-rendered nebula and meteor images
+"""
+import math
+import random
+from typing import Dict, Hashable, Iterator, List, Tuple
+import pygame
+from settings import *
+
+# A background sprite: cache key, image, and top-left in logical coordinates
+BackgroundSprite = Tuple[Hashable, pygame.Surface, float, float]
+
+
+class ParallaxBackground:
+    """Drifting nebulas and falling meteors drawn with one blit each.
+
+    Nebula polygons are rendered once into alpha images and every meteor
+    shares a pre-rendered streak per size and heading, so a frame costs a
+    handful of blits instead of polygon fills and per-point trail circles.
+    """
+
+    def __init__(self, meteors: List[Dict], nebulas: List[Dict]) -> None:
+        """Take the meteor and nebula dicts made by Game._create_meteors/_create_nebulas"""
+        self.meteors = meteors
+        self.nebulas = nebulas
+        self._nebula_images = [self._render_nebula(nebula) for nebula in nebulas]
+        self._streaks: Dict[Hashable, pygame.Surface] = {}
+        self._scaled: Dict[Tuple[Hashable, float], pygame.Surface] = {}
+
+    @staticmethod
+    def _render_nebula(nebula: Dict) -> pygame.Surface:
+        """Fill a nebula's polygon into its own translucent image"""
+        radius = int(nebula['size'] * 0.65) + 1  # Points lie within 0.5 * 1.3 of the size
+        *color, alpha = nebula['color']
+        points = [(radius + x, radius + y) for x, y in nebula['points']]
+
+        # One colour at one alpha: a colour key plus surface alpha blits much
+        # faster (RLE) than a per-pixel alpha image
+        image = pygame.Surface((radius * 2, radius * 2))
+        image.fill(BLACK)
+        pygame.draw.polygon(image, color, points)
+        image.set_colorkey(BLACK, pygame.RLEACCEL)
+        image.set_alpha(alpha, pygame.RLEACCEL)
+        return image
+
+    def _streak(self, meteor: Dict) -> Tuple[Hashable, pygame.Surface, float]:
+        """Return the shared streak for a meteor's size, speed and heading, and the
+        distance from the image centre to the streak's head"""
+        # Speeds are bucketed to half a pixel and headings to a degree so meteors share images
+        size = meteor['size']
+        speed = round(meteor['speed'] * 2) / 2
+        degrees = round(math.degrees(meteor['angle']))
+        key = ('meteor', size, speed, degrees)
+        length = int(speed * METEOR_TRAIL_LENGTH) + size * 2
+        image = self._streaks.get(key)
+        if image is None:
+            streak = pygame.Surface((length, size * 2), pygame.SRCALPHA)
+            # Fading trail dots along +x, head at the right end
+            for i in range(METEOR_TRAIL_LENGTH):
+                fraction = (i + 1) / METEOR_TRAIL_LENGTH
+                x = size + int((length - size * 2) * fraction)
+                pygame.draw.circle(streak, (255, 220, 180, int(150 * fraction)), (x, size),
+                                   max(1, int(size * fraction)))
+            pygame.draw.circle(streak, (255, 255, 255, 255), (length - size, size), size)
+            # pygame rotates counter-clockwise; turn the streak onto the meteor's heading
+            image = self._streaks[key] = pygame.transform.rotate(streak, -degrees)
+        return key, image, length / 2 - size
+
+    def update(self) -> None:
+        """Move meteors and drift nebulas by one frame"""
+        for meteor in self.meteors:
+            meteor['x'] += math.cos(meteor['angle']) * meteor['speed']
+            meteor['y'] += math.sin(meteor['angle']) * meteor['speed']
+
+            # Respawn above the screen once it leaves
+            if (meteor['y'] > SCREEN_HEIGHT + 50 or
+                    meteor['x'] < -50 or
+                    meteor['x'] > SCREEN_WIDTH + 50):
+                meteor['x'] = random.randint(-100, SCREEN_WIDTH + 100)
+                meteor['y'] = random.randint(-100, -20)
+
+        for nebula in self.nebulas:
+            nebula['x'] += nebula['drift_x']
+            nebula['y'] += nebula['drift_y']
+
+            # Wrap around screen
+            if nebula['x'] < -nebula['size']:
+                nebula['x'] = SCREEN_WIDTH + nebula['size']
+            elif nebula['x'] > SCREEN_WIDTH + nebula['size']:
+                nebula['x'] = -nebula['size']
+            if nebula['y'] < -nebula['size']:
+                nebula['y'] = SCREEN_HEIGHT + nebula['size']
+            elif nebula['y'] > SCREEN_HEIGHT + nebula['size']:
+                nebula['y'] = -nebula['size']
+
+    def sprites(self, view_x: float = 0, view_y: float = 0) -> Iterator[BackgroundSprite]:
+        """Yield far-to-near sprites; each layer shifts by its depth times the view offset"""
+        for index, (nebula, image) in enumerate(zip(self.nebulas, self._nebula_images)):
+            half = image.get_width() / 2
+            yield (('nebula', index), image,
+                   nebula['x'] - half - view_x * NEBULA_PARALLAX, nebula['y'] - half - view_y * NEBULA_PARALLAX)
+
+        for meteor in self.meteors:
+            key, image, head = self._streak(meteor)
+            # Place the rotated streak so its head sits on the meteor
+            x = meteor['x'] - image.get_width() / 2 - math.cos(meteor['angle']) * head
+            y = meteor['y'] - image.get_height() / 2 - math.sin(meteor['angle']) * head
+            yield key, image, x - view_x * METEOR_PARALLAX, y - view_y * METEOR_PARALLAX
+
+    def draw(self, surface: pygame.Surface, view_x: float = 0, view_y: float = 0,
+             scale: float = 1) -> None:
+        """Blit every layer onto `surface`"""
+        for key, image, x, y in self.sprites(view_x, view_y):
+            if scale != 1:
+                cached = self._scaled.get((key, scale))
+                if cached is None:
+                    size = max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale))
+                    cached = self._scaled[(key, scale)] = pygame.transform.scale(image, size)
+                image = cached
+            surface.blit(image, (int(x * scale), int(y * scale)))
@@ -0,0 +1,136 @@
+"""
+Ball-to-ball collisions with a spatial hash broadphase
+"""
+import math
+from typing import Dict, Iterable, List, Tuple
+from settings import *
+from sprites import Ball
+
+Cell = Tuple[int, int]
+Entry = Tuple[Ball, int, int]  # A ball and its centre
+
+# Half of the neighbourhood: with the home cell, every adjacent pair of cells is visited once
+FORWARD_NEIGHBOURS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class SpatialHash:
+    """Buckets balls by the grid cell holding their centre, rebuilt every step.
+
+    With cells one ball diameter wide, touching balls are always in the same
+    or adjacent cells, so candidate pairs grow with local density rather than
+    with the square of the ball count.
+    """
+
+    def __init__(self, cell_size: int = BALL_RADIUS * 2) -> None:
+        """Initialize an empty hash"""
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, List[Entry]] = {}
+
+    def rebuild(self, balls: Iterable[Ball]) -> None:
+        """Re-bucket every moving ball with its centre at the start of the step"""
+        cells = self.cells
+        cells.clear()
+        size = self.cell_size
+        for ball in balls:
+            if not ball.is_active or ball.is_stuck:
+                continue
+            x, y = ball.rect.center
+            key = (x // size, y // size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(ball, x, y)]
+            else:
+                bucket.append((ball, x, y))
+
+    def pairs(self, reach: float = BALL_RADIUS * 2) -> List[Tuple[Ball, Ball]]:
+        """Return the pairs of balls whose centres are closer than `reach`, each once"""
+        reach_sq = reach * reach
+        cells = self.cells
+        result = []
+        for (col, row), bucket in cells.items():
+            # Pairs within the cell
+            for i, (a, ax, ay) in enumerate(bucket):
+                for b, bx, by in bucket[i + 1:]:
+                    if (bx - ax) * (bx - ax) + (by - ay) * (by - ay) < reach_sq:
+                        result.append((a, b))
+            # Pairs with the forward neighbours
+            for dc, dr in FORWARD_NEIGHBOURS:
+                other = cells.get((col + dc, row + dr))
+                if other is None:
+                    continue
+                for a, ax, ay in bucket:
+                    for b, bx, by in other:
+                        if (bx - ax) * (bx - ax) + (by - ay) * (by - ay) < reach_sq:
+                            result.append((a, b))
+        return result
+
+
+def collide_pair(a: Ball, b: Ball) -> bool:
+    """Separate two overlapping balls and bounce them apart; returns True on contact.
+
+    The velocity components along the line of centres are exchanged, as in
+    an elastic collision of equal masses. Each ball then keeps its own speed,
+    like every other bounce in the game.
+    """
+    ax, ay = a.rect.center
+    bx, by = b.rect.center
+    nx = bx - ax
+    ny = by - ay
+    reach = a.radius + b.radius
+    distance_sq = nx * nx + ny * ny
+    if distance_sq >= reach * reach:
+        return False
+
+    if distance_sq == 0:
+        # Spawned on the same spot (MULTI): push apart sideways
+        nx, ny, distance = 1.0, 0.0, 1.0
+    else:
+        distance = math.sqrt(distance_sq)
+    nx /= distance
+    ny /= distance
+
+    # Move each ball half the overlap out along the normal
+    push = (reach - distance) / 2
+    a.rect.centerx = round(ax - nx * push)
+    a.rect.centery = round(ay - ny * push)
+    b.rect.centerx = round(bx + nx * push)
+    b.rect.centery = round(by + ny * push)
+
+    # Only balls that are closing get their velocities exchanged
+    closing = (a.dx - b.dx) * nx + (a.dy - b.dy) * ny
+    if closing <= 0:
+        return True
+    a_speed = math.hypot(a.dx, a.dy)
+    b_speed = math.hypot(b.dx, b.dy)
+    a.dx -= closing * nx
+    a.dy -= closing * ny
+    b.dx += closing * nx
+    b.dy += closing * ny
+    _rescale(a, a_speed, -nx, -ny)
+    _rescale(b, b_speed, nx, ny)
+    return True
+
+
+def _rescale(ball: Ball, speed: float, away_x: float, away_y: float) -> None:
+    """Scale a ball's velocity back to `speed`, keeping its new heading.
+
+    A ball left at rest (it gave all its motion to the other) moves off along
+    (away_x, away_y) instead.
+    """
+    magnitude = math.hypot(ball.dx, ball.dy)
+    if magnitude < 1e-9:
+        ball.dx, ball.dy = away_x * speed, away_y * speed
+    else:
+        ball.dx *= speed / magnitude
+        ball.dy *= speed / magnitude
+
+
+def collide_balls(balls: Iterable[Ball], spatial_hash: SpatialHash) -> int:
+    """Resolve this step's ball-to-ball contacts; returns how many there were"""
+    spatial_hash.rebuild(balls)
+    contacts = 0
+    for a, b in spatial_hash.pairs(BALL_RADIUS * 2):
+        # Earlier pushes this step may already have separated the pair
+        if collide_pair(a, b):
+            contacts += 1
+    return contacts
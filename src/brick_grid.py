@@ -0,0 +1,239 @@
+"""
+Brick layout grid: bricks indexed by cell, with exposed-face tracking and ray casts
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+import pygame
+from settings import *
+from sprites import Brick, FACE_LEFT, FACE_RIGHT, FACE_TOP, FACE_BOTTOM, ALL_FACES
+
+Cell = Tuple[int, int]
+
+# Neighbour offset for each face, and the face the neighbour shows back
+NEIGHBOURS = (
+    (FACE_LEFT, (-1, 0), FACE_RIGHT),
+    (FACE_RIGHT, (1, 0), FACE_LEFT),
+    (FACE_TOP, (0, -1), FACE_BOTTOM),
+    (FACE_BOTTOM, (0, 1), FACE_TOP),
+)
+
+
+def layout_width(columns: int) -> int:
+    """Return the width of a layout `columns` bricks wide"""
+    return columns * (BRICK_WIDTH + BRICK_PADDING) - BRICK_PADDING
+
+
+def layout_position(col: int, row: int, columns: int, width: int = SCREEN_WIDTH) -> Tuple[int, int]:
+    """Return the top-left of a layout cell, for a layout `columns` bricks wide centred in `width`"""
+    start_x = (width - layout_width(columns)) // 2
+    return (start_x + col * (BRICK_WIDTH + BRICK_PADDING),
+            row * (BRICK_HEIGHT + BRICK_PADDING) + BRICK_PADDING + 50)
+
+
+class BrickGrid:
+    """Indexes bricks by layout cell so each brick knows which faces a ball can reach.
+
+    A face shared with a neighbouring brick sits behind a gap narrower than the
+    ball and can never be the first contact, so collisions skip it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty grid"""
+        self.cells: Dict[Cell, Brick] = {}
+        self.origin = (0, 0)  # Top-left of cell (0, 0)
+        self._extent = (0, -1, 0, -1)  # Occupied min/max column and row
+        self.pitch = (BRICK_WIDTH + BRICK_PADDING, BRICK_HEIGHT + BRICK_PADDING)
+        # Gaps the ball fits through hide nothing
+        self.enabled = BRICK_PADDING < BALL_RADIUS * 2
+
+    def clear(self) -> None:
+        """Forget every brick"""
+        self.cells.clear()
+
+    def build(self, bricks: Iterable[Brick], origin: Optional[Tuple[int, int]] = None) -> None:
+        """Index `bricks` and compute every brick's exposed faces.
+
+        The cell lattice starts at `origin`, or at the top-left brick if none is given.
+        """
+        bricks = list(bricks)
+        self.cells.clear()
+        if origin is not None:
+            self.origin = origin
+        elif bricks:
+            self.origin = (min(b.rect.x for b in bricks), min(b.rect.y for b in bricks))
+        for brick in bricks:
+            cell = self.cell_of(brick)
+            if cell is not None:
+                self.cells[cell] = brick
+        for brick in bricks:
+            self._refresh(brick)
+        if self.cells:
+            cols = [col for col, _ in self.cells]
+            rows = [row for _, row in self.cells]
+            self._extent = (min(cols), max(cols), min(rows), max(rows))
+
+    def shift(self, dx: int, dy: int) -> None:
+        """Follow every indexed brick having moved by (dx, dy)"""
+        self.origin = (self.origin[0] + dx, self.origin[1] + dy)
+
+    def cell_of(self, brick: Brick) -> Optional[Cell]:
+        """Return the cell a brick occupies, or None if it's off the grid pitch"""
+        col, x_rest = divmod(brick.rect.x - self.origin[0], self.pitch[0])
+        row, y_rest = divmod(brick.rect.y - self.origin[1], self.pitch[1])
+        if x_rest or y_rest:
+            return None
+        return col, row
+
+    def _refresh(self, brick: Brick) -> None:
+        """Recompute one brick's exposed faces from its neighbours"""
+        cell = self.cell_of(brick)
+        if not self.enabled or cell is None or self.cells.get(cell) is not brick:
+            brick.exposed_faces = ALL_FACES
+            return
+        faces = 0
+        for face, (dx, dy), _ in NEIGHBOURS:
+            if (cell[0] + dx, cell[1] + dy) not in self.cells:
+                faces |= face
+        brick.exposed_faces = faces
+
+    def add(self, brick: Brick) -> None:
+        """Index a brick and cover the faces its neighbours turn towards it"""
+        cell = self.cell_of(brick)
+        if cell is None:
+            brick.exposed_faces = ALL_FACES
+            return
+        if self.cells.get(cell) is brick:
+            return
+        self.cells[cell] = brick
+        if len(self.cells) == 1:
+            self._extent = (cell[0], cell[0], cell[1], cell[1])
+        else:
+            min_col, max_col, min_row, max_row = self._extent
+            self._extent = (min(min_col, cell[0]), max(max_col, cell[0]),
+                            min(min_row, cell[1]), max(max_row, cell[1]))
+        self._refresh(brick)
+        if not self.enabled:
+            return
+        for _, (dx, dy), back in NEIGHBOURS:
+            neighbour = self.cells.get((cell[0] + dx, cell[1] + dy))
+            if neighbour is not None:
+                neighbour.exposed_faces &= ~back
+
+    def remove(self, brick: Brick) -> None:
+        """Drop a broken brick and expose the faces its neighbours turned towards it"""
+        cell = self.cell_of(brick)
+        if cell is None or self.cells.get(cell) is not brick:
+            return
+        del self.cells[cell]
+        for _, (dx, dy), back in NEIGHBOURS:
+            neighbour = self.cells.get((cell[0] + dx, cell[1] + dy))
+            if neighbour is not None:
+                neighbour.exposed_faces |= back
+
+    def query(self, rect: pygame.Rect) -> List[Brick]:
+        """Return the indexed bricks whose cells overlap `rect`, row by row"""
+        if not self.cells:
+            return []
+        pitch_x, pitch_y = self.pitch
+        origin_x, origin_y = self.origin
+        min_col, max_col, min_row, max_row = self._extent
+        first_col = max(min_col, (rect.left - origin_x) // pitch_x)
+        last_col = min(max_col, (rect.right - 1 - origin_x) // pitch_x)
+        first_row = max(min_row, (rect.top - origin_y) // pitch_y)
+        last_row = min(max_row, (rect.bottom - 1 - origin_y) // pitch_y)
+        cells = self.cells
+        found = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                brick = cells.get((col, row))
+                if brick is not None:
+                    found.append(brick)
+        return found
+
+    def raycast(self, origin: Tuple[float, float], direction: Tuple[float, float],
+                radius: float, max_t: float = math.inf) -> Optional[Tuple[float, int, Brick]]:
+        """Sweep a circle from `origin` along `direction` (per unit t) through the grid.
+
+        Walks the cells on the ray with a DDA and tests the bricks in and around
+        each one, inflated by `radius`. Returns (t, face hit, brick) for the first
+        contact before `max_t`, or None.
+        """
+        if not self.cells or (direction[0] == 0 and direction[1] == 0):
+            return None
+        x, y = origin
+        dx, dy = direction
+        pitch_x, pitch_y = self.pitch
+        min_col, max_col, min_row, max_row = self._extent
+
+        # Current cell and the ray parameter at its next vertical/horizontal boundary
+        fx = (x - self.origin[0]) / pitch_x
+        fy = (y - self.origin[1]) / pitch_y
+        col, row = math.floor(fx), math.floor(fy)
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+        next_x = (col + (dx > 0) - fx) * pitch_x / dx if dx else math.inf
+        next_y = (row + (dy > 0) - fy) * pitch_y / dy if dy else math.inf
+        delta_x = pitch_x / abs(dx) if dx else math.inf
+        delta_y = pitch_y / abs(dy) if dy else math.inf
+
+        best: Optional[Tuple[float, int, Brick]] = None
+        best_t = max_t
+        tested = set()
+        t = 0.0
+        while t <= best_t:
+            # An inflated brick reaches at most one cell into its neighbours
+            if min_col - 1 <= col <= max_col + 1 and min_row - 1 <= row <= max_row + 1:
+                for nc in (col - 1, col, col + 1):
+                    for nr in (row - 1, row, row + 1):
+                        brick = self.cells.get((nc, nr))
+                        if brick is None or brick in tested:
+                            continue
+                        tested.add(brick)
+                        hit = _sweep_rect(x, y, dx, dy, radius, brick.rect)
+                        if hit is not None and hit[0] <= best_t:
+                            best_t = hit[0]
+                            best = (hit[0], hit[1], brick)
+            elif ((col < min_col - 1 and dx <= 0) or (col > max_col + 1 and dx >= 0) or
+                  (row < min_row - 1 and dy <= 0) or (row > max_row + 1 and dy >= 0)):
+                break  # Leaving the grid for good
+
+            # Step into the next cell
+            if next_x < next_y:
+                t = next_x
+                next_x += delta_x
+                col += step_col
+            else:
+                t = next_y
+                next_y += delta_y
+                row += step_row
+        return best
+
+
+def _sweep_rect(x: float, y: float, dx: float, dy: float, radius: float,
+                rect: pygame.Rect) -> Optional[Tuple[float, int]]:
+    """Slab test of a ray against `rect` grown by `radius`; returns (t, face) on entry"""
+    if dx:
+        t1 = (rect.left - radius - x) / dx
+        t2 = (rect.right + radius - x) / dx
+        tx_enter, tx_exit = (t1, t2) if t1 < t2 else (t2, t1)
+    elif rect.left - radius <= x <= rect.right + radius:
+        tx_enter, tx_exit = -math.inf, math.inf
+    else:
+        return None
+    if dy:
+        t1 = (rect.top - radius - y) / dy
+        t2 = (rect.bottom + radius - y) / dy
+        ty_enter, ty_exit = (t1, t2) if t1 < t2 else (t2, t1)
+    elif rect.top - radius <= y <= rect.bottom + radius:
+        ty_enter, ty_exit = -math.inf, math.inf
+    else:
+        return None
+
+    t_enter = max(tx_enter, ty_enter)
+    t_exit = min(tx_exit, ty_exit)
+    # Already inside (or only grazing) counts as no hit, so a reflected ray can leave
+    if t_enter > t_exit or t_enter < -1e-9 or t_exit <= 1e-9:
+        return None
+    if tx_enter > ty_enter:
+        return t_enter, FACE_LEFT if dx > 0 else FACE_RIGHT
+    return t_enter, FACE_TOP if dy > 0 else FACE_BOTTOM
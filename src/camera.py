@@ -0,0 +1,66 @@
+"""
+Camera that scrolls the view over levels larger than the screen
+"""
+from typing import Iterable, Tuple
+import pygame
+from settings import *
+from sprites import Ball, Paddle
+
+
+def visible_area(offset: Tuple[int, int]) -> pygame.Rect:
+    """Return the culling area of a view drawn at the camera `offset`"""
+    return pygame.Rect(-offset[0] - CULL_MARGIN, -offset[1] - CULL_MARGIN,
+                       SCREEN_WIDTH + CULL_MARGIN * 2, SCREEN_HEIGHT + CULL_MARGIN * 2)
+
+
+class Camera:
+    """Screen-sized window onto the world, eased towards the balls in play.
+
+    While the world is no bigger than the screen the view stays at the origin
+    and follow() costs nothing. `visible` is the view grown by CULL_MARGIN:
+    bricks and particles outside it aren't drawn and bursts outside it make
+    no particles. Particles that leave the world are dropped.
+    """
+
+    def __init__(self, ease: float = CAMERA_EASE) -> None:
+        """Initialize a camera over a screen-sized world"""
+        self.ease = ease
+        self.world = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.view = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.visible = self.view.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+        self._x = 0.0  # Unrounded view position, so easing can creep by subpixels
+        self._y = 0.0
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Return what to add to world coordinates to get screen coordinates"""
+        return -self.view.x, -self.view.y
+
+    def set_world(self, world: pygame.Rect, focus: Tuple[int, int]) -> None:
+        """Switch to a new world and jump straight to `focus`"""
+        self.world = world
+        self._move_to(*focus, ease=1.0)
+
+    def follow(self, balls: Iterable[Ball], paddle: Paddle) -> None:
+        """Ease the view towards the moving balls, or the paddle while none are moving"""
+        if self.world.width <= SCREEN_WIDTH and self.world.height <= SCREEN_HEIGHT:
+            return
+        total_x = total_y = count = 0
+        for ball in balls:
+            if ball.is_active and not ball.is_stuck:
+                total_x += ball.rect.centerx
+                total_y += ball.rect.centery
+                count += 1
+        if count:
+            self._move_to(total_x / count, total_y / count, self.ease)
+        else:
+            self._move_to(paddle.rect.centerx, paddle.rect.top, self.ease)
+
+    def _move_to(self, x: float, y: float, ease: float) -> None:
+        """Move the view centre `ease` of the way to (x, y), staying inside the world"""
+        target_x = min(max(x - SCREEN_WIDTH / 2, self.world.left), self.world.right - SCREEN_WIDTH)
+        target_y = min(max(y - SCREEN_HEIGHT / 2, self.world.top), self.world.bottom - SCREEN_HEIGHT)
+        self._x += (target_x - self._x) * ease
+        self._y += (target_y - self._y) * ease
+        self.view.topleft = (round(self._x), round(self._y))
+        self.visible.center = self.view.center
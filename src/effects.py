@@ -0,0 +1,71 @@
+"""
+Per-frame queue of collision side effects: particles, screen shake and sounds
+"""
+from typing import Dict, List, Tuple
+from settings import *
+
+Burst = Tuple[int, int, Tuple[int, int, int], int]  # x, y, color, particle count
+
+
+class EffectQueue:
+    """Side effects requested during a step, applied together once it ends.
+
+    Collisions only append to flat lists here, so the physics loop never
+    spawns particles or touches the mixer. At the end of the step the game
+    drains the queue: the strongest shake wins, each sound plays at most
+    once, and the bursts are scaled down to fit the particle budget. A
+    frame full of multiball hits therefore costs no more effect work than
+    the budget allows.
+    """
+
+    def __init__(self, particle_budget: int = EFFECT_PARTICLE_BUDGET) -> None:
+        """Initialize an empty queue"""
+        self.particle_budget = particle_budget
+        self.bursts: List[Burst] = []
+        self.sounds: Dict[str, None] = {}  # Insertion-ordered set of sound names
+        self.shake_amount = 0
+        self.shake_duration = 0  # Milliseconds
+        self._particles = 0  # Particles asked for by the queued bursts
+
+    def burst(self, x: int, y: int, color: Tuple[int, int, int], count: int) -> None:
+        """Queue a burst of `count` particles at (x, y)"""
+        self.bursts.append((x, y, color, count))
+        self._particles += count
+
+    def sound(self, sound_name: str) -> None:
+        """Queue a sound; repeats within the same step merge into one"""
+        self.sounds[sound_name] = None
+
+    def shake(self, amount: int, duration: int) -> None:
+        """Queue a screen shake; the strongest and longest of the step is kept"""
+        self.shake_amount = max(self.shake_amount, amount)
+        self.shake_duration = max(self.shake_duration, duration)
+
+    def coalesced_bursts(self) -> List[Burst]:
+        """Return the queued bursts, thinned out to spend at most the particle budget"""
+        if self._particles <= self.particle_budget:
+            return self.bursts
+        # Every burst keeps the same share of its particles (at least one),
+        # until the budget runs out
+        scale = self.particle_budget / self._particles
+        bursts = []
+        spent = 0
+        for x, y, color, count in self.bursts:
+            if spent >= self.particle_budget:
+                break
+            count = max(1, int(count * scale))
+            bursts.append((x, y, color, count))
+            spent += count
+        return bursts
+
+    def clear(self) -> None:
+        """Drop everything queued"""
+        self.bursts.clear()
+        self.sounds.clear()
+        self.shake_amount = 0
+        self.shake_duration = 0
+        self._particles = 0
+
+    def __bool__(self) -> bool:
+        """Return True if anything is queued"""
+        return bool(self.bursts or self.sounds or self.shake_amount)
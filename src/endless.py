@@ -0,0 +1,144 @@
+"""
+Endless mode: seeded procedural brick rows that scroll down and are recycled
+"""
+import math
+import random
+from typing import Dict, List, Tuple
+from settings import *
+from sprites import Brick
+from entities import EntityStore
+from brick_grid import BrickGrid, layout_position
+
+# Breakable types from weakest to toughest; rows unlock them tier by tier
+BREAKABLE_TYPES = sorted((t.id for t in BRICK_TYPES.values() if t.hits > 0),
+                         key=lambda type_id: BRICK_TYPES[type_id].hits)
+UNBREAKABLE_TYPE = next(t.id for t in BRICK_TYPES.values() if t.hits < 0)
+
+
+class EndlessField:
+    """A fixed ring of brick rows that scrolls down the screen forever.
+
+    Each row has a serial number and its bricks are generated from the seed
+    and that serial alone, so the same seed always plays out the same rows.
+    Row `serial` lives in slot serial % rows; when the lowest row scrolls
+    below the floor its slot's bricks are reset as the next row at the top,
+    so memory and per-frame work stay the same however long the game runs.
+    Every position follows from `scroll`, which lets rewind restore the field
+    from two numbers.
+    """
+
+    def __init__(self, seed: int = ENDLESS_SEED, rows: int = ENDLESS_ROWS,
+                 columns: int = BRICK_COLS) -> None:
+        """Initialize a disabled field; start() fills it"""
+        self.enabled = False
+        self.seed = seed
+        self.rows = rows
+        self.columns = columns
+        self.scroll = 0.0  # Pixels scrolled since the start
+        self.bottom = 0  # Serial of the lowest row in play
+        self.rows_cleared = 0
+        self.serials = [-1] * rows  # Row serial held by each slot
+        self.remaining = [0] * rows  # Breakable bricks left in each slot
+        self.bricks: List[Brick] = []  # Every brick, slot by slot, in play or not
+        self._slot_of: Dict[Brick, int] = {}
+        self._random = random.Random()
+        self._pitch = BRICK_HEIGHT + BRICK_PADDING
+        # The first row sits where the last row of a level would
+        self._base_y = layout_position(0, BRICK_ROWS - 1, columns)[1]
+
+    def row_y(self, serial: int) -> int:
+        """Return the top of row `serial` at the current scroll"""
+        return self._base_y + int(self.scroll) - serial * self._pitch
+
+    def origin(self) -> Tuple[int, int]:
+        """Return the top-left of the lowest row's first cell, a point on the grid lattice"""
+        return layout_position(0, 0, self.columns)[0], self.row_y(self.bottom)
+
+    def start(self, bricks: EntityStore, grid: BrickGrid) -> None:
+        """Fill the field with its first rows, reusing the bricks of an earlier run"""
+        if not self.bricks:
+            self.bricks = [Brick(layout_position(i % self.columns, 0, self.columns)[0], 0,
+                                 BREAKABLE_TYPES[0]) for i in range(self.rows * self.columns)]
+            self._slot_of = {brick: i // self.columns for i, brick in enumerate(self.bricks)}
+        self.scroll = 0.0
+        self.bottom = 0
+        self.rows_cleared = 0
+        self.serials = [-1] * self.rows
+        self._fill(bricks, grid)
+
+    def update(self, bricks: EntityStore, grid: BrickGrid, speed: float = ENDLESS_SCROLL_SPEED) -> None:
+        """Scroll the rows down and recycle the ones that passed the floor"""
+        moved = int(self.scroll + speed) - int(self.scroll)
+        self.scroll += speed
+        if not moved:
+            return
+        for brick in self.bricks:
+            brick.rect.y += moved
+        grid.shift(0, moved)
+        if self.row_y(self.bottom) > ENDLESS_FLOOR_Y:
+            self.bottom = self._bottom_at(self.scroll)
+            self._fill(bricks, grid)
+
+    def brick_broken(self, brick: Brick) -> int:
+        """Count a broken brick against its row; returns the bonus for clearing the row"""
+        slot = self._slot_of.get(brick)
+        if slot is None or not brick.is_breakable:
+            return 0
+        self.remaining[slot] -= 1
+        if self.remaining[slot] == 0:
+            self.rows_cleared += 1
+            return ENDLESS_ROW_BONUS
+        return 0
+
+    def restore(self, bricks: EntityStore, grid: BrickGrid, scroll: float, rows_cleared: int) -> None:
+        """Put the rows back where they were at `scroll` (for rewind)"""
+        self.scroll = scroll
+        self.rows_cleared = rows_cleared
+        self.bottom = self._bottom_at(scroll)
+        self._fill(bricks, grid)
+
+    def recount(self, bricks: EntityStore) -> None:
+        """Recompute each row's breakable bricks left after bricks were put back"""
+        remaining = [0] * self.rows
+        for brick in self.bricks:
+            if brick.is_breakable and bricks.has(brick):
+                remaining[self._slot_of[brick]] += 1
+        self.remaining = remaining
+
+    def _bottom_at(self, scroll: float) -> int:
+        """Return the serial of the lowest row still above the floor at `scroll`"""
+        overshoot = self._base_y + int(scroll) - ENDLESS_FLOOR_Y
+        return max(0, math.ceil(overshoot / self._pitch))
+
+    def _fill(self, bricks: EntityStore, grid: BrickGrid) -> None:
+        """Generate the rows that changed slot, place every row and re-index the grid"""
+        for serial in range(self.bottom, self.bottom + self.rows):
+            slot = serial % self.rows
+            if self.serials[slot] != serial:
+                self._generate(slot, serial, bricks)
+            y = self.row_y(serial)
+            for brick in self.bricks[slot * self.columns:(slot + 1) * self.columns]:
+                brick.rect.y = y
+        grid.build((brick for brick in self.bricks if bricks.has(brick)), self.origin())
+
+    def _generate(self, slot: int, serial: int, bricks: EntityStore) -> None:
+        """Reset a slot's bricks as row `serial`, drawn from the seed"""
+        rng = self._random
+        rng.seed(f"{self.seed}:{serial}")
+        # Tougher brick types join every few rows
+        tier = min(len(BREAKABLE_TYPES), 1 + serial // ENDLESS_ROWS_PER_TIER)
+        remaining = 0
+        for col in range(self.columns):
+            brick = self.bricks[slot * self.columns + col]
+            if rng.random() < ENDLESS_FILL:
+                if rng.random() < ENDLESS_UNBREAKABLE_CHANCE:
+                    brick_type = UNBREAKABLE_TYPE
+                else:
+                    brick_type = rng.choice(BREAKABLE_TYPES[:tier])
+                    remaining += 1
+                brick.reset(layout_position(col, 0, self.columns)[0], 0, brick_type)
+                bricks.add(brick)
+            else:
+                bricks.remove(brick)
+        self.serials[slot] = serial
+        self.remaining[slot] = remaining
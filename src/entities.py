@@ -0,0 +1,91 @@
+"""
+Dense entity storage with swap-remove and removal deferred to the end of a step
+"""
+from itertools import islice
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Set, TypeVar
+
+T = TypeVar('T')
+
+
+class EntityStore(Generic[T]):
+    """Game objects of one kind in a flat list, replacing pygame.sprite.Group.
+
+    Removal only marks an entity dead; flush() (run once at the end of
+    Game.update) swaps each dead entity with the last one and pops it. Live
+    entities keep their slots for the whole step, so iteration needs no copy
+    and can't be disturbed by removals, and entities added mid-iteration wait
+    for the next pass. Unlike a Group, an entity removed ahead of the cursor
+    is skipped by the pass already under way; membership and len() account
+    for pending removals straight away too.
+    """
+
+    def __init__(self, entities: Iterable[T] = ()) -> None:
+        """Initialize the store with `entities`"""
+        self._items: List[T] = []
+        self._index: Dict[T, int] = {}
+        self._dead: Set[T] = set()
+        self.add(*entities)
+
+    def add(self, *entities: T) -> None:
+        """Add entities (or revive ones removed this step)"""
+        for entity in entities:
+            if entity in self._index:
+                self._dead.discard(entity)
+                continue
+            self._index[entity] = len(self._items)
+            self._items.append(entity)
+
+    def remove(self, *entities: T) -> None:
+        """Remove entities at the next flush(); they stop counting as members now"""
+        for entity in entities:
+            if entity in self._index:
+                self._dead.add(entity)
+
+    def flush(self) -> None:
+        """Apply pending removals, moving the last entity into each freed slot"""
+        if not self._dead:
+            return
+        items = self._items
+        index = self._index
+        for entity in self._dead:
+            slot = index.pop(entity)
+            last = items.pop()
+            if last is not entity:
+                items[slot] = last
+                index[last] = slot
+        self._dead.clear()
+
+    def empty(self) -> None:
+        """Remove every entity immediately"""
+        self._items.clear()
+        self._index.clear()
+        self._dead.clear()
+
+    def has(self, entity: T) -> bool:
+        """Return True if `entity` is a live member"""
+        return entity in self._index and entity not in self._dead
+
+    __contains__ = has
+
+    def first(self) -> Optional[T]:
+        """Return the first live entity, or None"""
+        for entity in self:
+            return entity
+        return None
+
+    def sprites(self) -> List[T]:
+        """Return the live entities as a new list"""
+        return list(self)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the entities present when iteration starts that are still live when reached"""
+        dead = self._dead  # Checked as the pass goes, so removals made during it count
+        return (entity for entity in islice(self._items, len(self._items)) if entity not in dead)
+
+    def __len__(self) -> int:
+        """Return the number of live entities"""
+        return len(self._items) - len(self._dead)
+
+    def __bool__(self) -> bool:
+        """Return True if any entity is live"""
+        return len(self._items) > len(self._dead)
@@ -0,0 +1,146 @@
+"""
+Per-phase frame-time instrumentation with an on-screen overlay
+"""
+import json
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+import pygame
+from settings import *
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Return the sample at the given fraction of a sorted list"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+class FrameTimer:
+    """Lap-based timer that attributes each frame's milliseconds to named phases"""
+
+    def __init__(self, history: int = FRAME_TIMER_HISTORY) -> None:
+        """Initialize a disabled timer keeping `history` frames of samples"""
+        self.enabled = False
+        self.history = history
+        self.phases: Dict[str, Deque[float]] = {}
+        self.frame_times: Deque[float] = deque(maxlen=history)
+        self._current: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._last = 0.0
+
+        # Callables returning extra overlay lines from other instruments
+        self.overlay_sources: List[Callable[[], List[str]]] = []
+
+        # Overlay text is only re-rendered every few frames
+        self._font: Optional[pygame.font.Font] = None
+        self._lines: List[pygame.Surface] = []
+        self._frames_since_refresh = FRAME_TIMER_REFRESH
+
+    def toggle(self) -> None:
+        """Enable or disable timing (and the overlay with it)"""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all collected samples"""
+        self.phases.clear()
+        self.frame_times.clear()
+        self._current = {}
+        self._lines = []
+        self._frames_since_refresh = FRAME_TIMER_REFRESH
+
+    def begin_frame(self) -> None:
+        """Mark the start of a frame"""
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        self._current = {}
+
+    def lap(self, phase: str) -> None:
+        """Attribute the time since the previous lap to `phase`"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self) -> None:
+        """Close the frame and store its samples"""
+        if not self.enabled:
+            return
+        self.frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+        for phase, ms in self._current.items():
+            if phase not in self.phases:
+                self.phases[phase] = deque(maxlen=self.history)
+            self.phases[phase].append(ms)
+        self._frames_since_refresh += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return p50/p95/p99/max in milliseconds for the frame and every phase"""
+        result = {}
+        for name, samples in [('frame', self.frame_times), *self.phases.items()]:
+            ordered = sorted(samples)
+            result[name] = {
+                'p50': percentile(ordered, 0.50),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0,
+            }
+        return result
+
+    def export_json(self, path: str) -> None:
+        """Write the percentile summary and raw frame times to a JSON file"""
+        data = {
+            'frames': len(self.frame_times),
+            'budget_ms': 1000 / FPS,
+            'stats': self.stats(),
+            'frame_times': list(self.frame_times),
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"Frame times written to {path}")
+
+    def draw_overlay(self, surface: pygame.Surface) -> None:
+        """Draw rolling percentiles and a frame-time graph"""
+        if not self.enabled:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        # Refresh the cached text lines a few times per second
+        if self._frames_since_refresh >= FRAME_TIMER_REFRESH:
+            self._frames_since_refresh = 0
+            self._lines = [self._font.render("phase        p50    p95    p99  (ms)", True, WHITE)]
+            for name, values in self.stats().items():
+                text = f"{name:<12} {values['p50']:5.2f}  {values['p95']:5.2f}  {values['p99']:5.2f}"
+                self._lines.append(self._font.render(text, True, WHITE))
+            for source in self.overlay_sources:
+                for text in source():
+                    self._lines.append(self._font.render(text, True, YELLOW))
+
+        x, y = 10, 60
+        panel_height = len(self._lines) * 16 + FRAME_TIMER_GRAPH_HEIGHT + 16
+        panel_width = max([300] + [line.get_width() + 10 for line in self._lines])
+        panel = pygame.Rect(x - 5, y - 5, panel_width, panel_height)
+        pygame.draw.rect(surface, (0, 0, 0), panel)
+        for line in self._lines:
+            surface.blit(line, (x, y))
+            y += 16
+
+        self._draw_graph(surface, pygame.Rect(x, y + 5, 290, FRAME_TIMER_GRAPH_HEIGHT))
+
+    def _draw_graph(self, surface: pygame.Surface, area: pygame.Rect) -> None:
+        """Draw recent frame times as a line graph with the frame budget marked"""
+        budget = 1000 / FPS
+        scale = area.height / (budget * 2)
+        budget_y = area.bottom - int(budget * scale)
+        pygame.draw.line(surface, (80, 80, 80), (area.left, budget_y), (area.right, budget_y))
+
+        if len(self.frame_times) < 2:
+            return
+        step = area.width / (self.history - 1)
+        points = [(area.left + int(i * step), area.bottom - int(min(ms, budget * 2) * scale))
+                  for i, ms in enumerate(self.frame_times)]
+        pygame.draw.lines(surface, GREEN, False, points)
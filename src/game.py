@@ -7,24 +7,65 @@ import random
 import os
 import math
 import time
-from typing import List, Dict, Tuple, Optional
+from itertools import islice
+from typing import List, Dict, Iterable, Tuple, Optional, Union
 from settings import *
-from sprites import Paddle, Ball, Brick, PowerUp
+from sprites import Paddle, Ball, Brick, PowerUp, Particle, draw_balls
+from rewind import RewindBuffer
+from frame_timer import FrameTimer
+from profiler import SamplingProfiler
+from alloc_tracker import AllocationTracker
+from gc_policy import GCPolicy
+from quality import QualityGovernor
+from background import ParallaxBackground
+from brick_grid import BrickGrid, layout_position, layout_width
+from trajectory import path_dots, trace_path
+from autopilot import Autopilot
+from endless import EndlessField
+from camera import Camera, visible_area
+from level_watcher import LevelWatcher, level_path
+from entities import EntityStore
+from pools import Pool
+from ball_collisions import SpatialHash, collide_balls
+from effects import EffectQueue
+from audio import Mixer
+from scheduler import Scheduler
+from render_scale import ScaledTarget, internal_size, scale_rect
+from pipeline import FrameSnapshot
 
 class Game:
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, render_scale: float = RENDER_SCALE,
+                 native_hud: bool = NATIVE_HUD) -> None:
         """Initialize the game"""
-        self.screen = screen
+        self._setup_render_targets(screen, render_scale, native_hud)
         self.running = True
         self.paused = False
         
         # Game objects
         self.paddle = Paddle()
-        self.balls = pygame.sprite.Group()
-        self.bricks = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
+        self.balls = EntityStore()
+        self.bricks = EntityStore()
+        self.level_bricks = []  # Every brick loaded for the level, broken or not
+        self.level_layout: List[str] = []  # Rows the level was built from
+        self._layout_cells: Dict[Tuple[int, int], Brick] = {}  # (row, column) -> brick
+        self.brick_grid = BrickGrid()  # Layout cells and exposed brick faces
+        self.powerups = EntityStore()
         self.particles = []  # Particle effects
         
+        # Playfield, which may be larger than the screen, and the view onto it
+        self.world = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.camera = Camera()
+        
+        # Balls, power-ups and particles are recycled instead of rebuilt
+        self.ball_pool = Pool(Ball, BALL_POOL_SIZE)
+        self.powerup_pool = Pool(lambda: PowerUp(0, 0, next(iter(POWERUPS))), POWERUP_POOL_SIZE)
+        self.particle_pool = Pool(Particle, PARTICLE_POOL_SIZE)
+        # Particles draw from their own generator so skipping or thinning them
+        # never changes the gameplay random sequence
+        self.particle_random = random.Random(random.random())
+        # ...and so does the screen shake, which is rolled per rendered frame
+        self.shake_random = random.Random(random.random())
+        
         # Game state
         self.score = 0
         self.lives = INITIAL_LIVES
@@ -38,9 +79,12 @@ class Game:
         self.shake_amount = 0
         self.shake_time = 0
         self.background_stars = self._create_stars(STAR_COUNT)
+        self.meteors = self._create_meteors(METEOR_COUNT)
+        self.nebulas = self._create_nebulas(NEBULA_COUNT)
+        self.background = ParallaxBackground(self.meteors, self.nebulas)
         
-        # Load sounds
-        self.sounds = {}
+        # Load sounds into the voice-limited mixer
+        self.audio = Mixer()
         self._load_sounds()
         
         # Load font
@@ -49,12 +93,95 @@ class Game:
         # Show instructions at start
         self.show_instructions = True
         
+        # Dotted launch path for balls waiting on the paddle (toggle with A)
+        self.aim_preview = AIM_PREVIEW
+        
+        # Balls bounce off each other when on (toggle with C); MULTI adds this many balls
+        self.ball_collisions = BALL_COLLISIONS
+        self.ball_hash = SpatialHash()
+        self.multi_ball_count = MULTI_BALL_COUNT
+        
+        # Updates per displayed frame (cycle with T); effects only run on the shown one
+        self.turbo = TURBO
+        self.effects = True
+        
+        # Simulation clock that ends power-ups; it only runs while the game steps
+        self.timers = Scheduler()
+        
+        # Particles, shake and sounds requested by collisions, applied once per step
+        self.effect_queue = EffectQueue()
+        
+        # Reloads level files edited while the game runs (see watch_levels)
+        self.level_watcher: Optional[LevelWatcher] = None
+        
+        # Procedural rows that scroll down forever instead of levels (toggle with E)
+        self.endless = EndlessField()
+        self.endless.enabled = ENDLESS
+        
+        # Computer-controlled paddle for soak runs and benchmarks (toggle with O)
+        self.autopilot = Autopilot()
+        self.autopilot.enabled = AUTOPILOT
+        
+        # Rewind history (hold BACKSPACE to rewind)
+        self.rewind = RewindBuffer()
+        self.rewinding = False
+        
+        # Per-phase frame timing (toggle with F3, export with F4); updates lap
+        # their own timer when the simulation runs on another thread
+        self.frame_timer = FrameTimer()
+        self.update_timer = self.frame_timer
+        
+        # Sampling profiler (toggle with F9)
+        self.profiler = SamplingProfiler()
+        
+        # Per-frame Surface/allocation tracking (toggle with F6)
+        self.alloc_tracker = AllocationTracker()
+        self.frame_timer.overlay_sources.append(self.alloc_tracker.overlay_lines)
+        
+        # Garbage-collector policy (toggle with F7 to compare pause times)
+        self.gc_policy = GCPolicy()
+        self.frame_timer.overlay_sources.append(self.gc_policy.overlay_lines)
+        
+        # Effects quality adapts to the frame budget
+        self.quality = QualityGovernor()
+        self.frame_timer.overlay_sources.append(self.quality.overlay_lines)
+        
         # Create initial ball and position it
         self.create_ball(is_original=True)
         self._position_ball_on_paddle()
         
         # Load first level
         self._load_level_bricks(self.level)
+        self.gc_policy.freeze()
+    
+    def _setup_render_targets(self, display: pygame.Surface, render_scale: float,
+                              native_hud: bool) -> None:
+        """Choose the surfaces the scene and the HUD are drawn onto"""
+        self.display = display
+        self.render_scale = render_scale
+        size = internal_size(render_scale)
+        
+        # The scene is drawn at the internal size; a display that already has
+        # that size (e.g. a pygame.SCALED window) is drawn into directly
+        if render_scale == 1 or display.get_size() == size:
+            self.screen = display
+        else:
+            self.screen = pygame.Surface(size, 0, display)
+        
+        # HUD text goes to the display at native resolution, or onto the scene
+        self.ui_native = native_hud and self.screen is not display
+        if self.ui_native or render_scale == 1:
+            self.ui_screen = display if self.ui_native else self.screen
+        else:
+            self.ui_screen = ScaledTarget(self.screen, render_scale)
+        self.ui_surface = display if self.ui_native else self.screen
+        
+        # Prompts go over the finished frame; an internal-size display needs them scaled down
+        self.prompt_screen = self.ui_screen if self.screen is display else display
+        self._dim_overlays = {}  # (size, alpha) -> cached overlay surface
+        self._prompt_surfaces = {}  # (font id, text) -> rendered prompt
+        self._idle_frame = None  # Composed frame reused while a state screen is frozen
+        self._idle_key = None
     
     def _create_stars(self, count: int) -> List[Tuple[int, int, int, float]]:
         """Create a starfield background"""
@@ -126,21 +253,9 @@ class Game:
     
     def _load_sounds(self) -> None:
         """Load game sound effects"""
-        # Check if mixer is initialized
-        if not pygame.mixer.get_init():
-            print("Sound system not available. Running without sound.")
-            return
-            
-        for name, file in SOUNDS.items():
-            try:
-                # Use absolute path from project root
-                sound_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'sounds', file)
-                if os.path.exists(sound_path):
-                    self.sounds[name] = pygame.mixer.Sound(sound_path)
-                else:
-                    print(f"Warning: Sound file not found: {sound_path}")
-            except pygame.error as e:
-                print(f"Warning: Could not load sound {file}: {e}")
+        # Use absolute path from project root
+        sound_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'sounds')
+        self.audio.load(SOUNDS, sound_dir)
     
     def _load_font(self) -> None:
         """Load game font"""
@@ -159,7 +274,7 @@ class Game:
     
     def create_ball(self, x: int = None, y: int = None, is_original: bool = False) -> Ball:
         """Create a new ball and add it to the balls group"""
-        ball = Ball(x, y)
+        ball = self.ball_pool.acquire(x, y)
         self.balls.add(ball)
         
         # If this is the original ball, track it
@@ -170,7 +285,7 @@ class Game:
     
     def _position_ball_on_paddle(self) -> None:
         """Position the ball on the paddle"""
-        if len(self.balls.sprites()) > 0 and self.paddle:
+        if self.balls and self.paddle:
             for ball in self.balls:
                 if not ball.is_active:  # Only position inactive balls
                     ball.rect.centerx = self.paddle.rect.centerx
@@ -178,224 +293,439 @@ class Game:
     
     def _load_level_bricks(self, level_index: int) -> None:
         """Load bricks for a level from JSON file"""
+        if self.endless.enabled:
+            # Endless mode streams generated rows instead
+            self.load_endless()
+            return
+            
         if level_index >= len(LEVEL_FILES):
             # Game completed - show victory screen
             self.level_complete = True
             return
             
-        # Clear existing bricks
+        # Clear existing bricks and rewind history
         self.bricks.empty()
+        self.level_bricks = []
+        self.level_layout = []
+        self._layout_cells = {}
+        self.brick_grid.clear()
+        self.rewind.clear()
         
         try:
             # Load level data from JSON file with absolute path
-            level_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), LEVEL_FILES[level_index])
-            if not os.path.exists(level_path):
-                print(f"Warning: Level file not found: {level_path}")
+            path = level_path(level_index)
+            if not os.path.exists(path):
+                print(f"Warning: Level file not found: {path}")
                 self._create_default_level()
                 return
                 
-            with open(level_path, 'r') as f:
+            with open(path, 'r') as f:
                 level_data = json.load(f)
                 
             # Create bricks based on layout
-            layout = level_data.get('layout', [])
-            
-            # Calculate the total width of the level
-            max_row_length = max(len(row) for row in layout)
-            level_width = max_row_length * (BRICK_WIDTH + BRICK_PADDING) - BRICK_PADDING
-            
-            # Calculate the starting x position to center the level
-            start_x = (SCREEN_WIDTH - level_width) // 2
-            
-            for row_idx, row in enumerate(layout):
-                for col_idx, brick_type in enumerate(row):
-                    if brick_type.strip():  # Skip empty spaces
-                        x = start_x + col_idx * (BRICK_WIDTH + BRICK_PADDING)
-                        y = row_idx * (BRICK_HEIGHT + BRICK_PADDING) + BRICK_PADDING + 50
-                        if brick_type in BRICK_TYPES:
-                            brick = Brick(x, y, brick_type)
-                            self.bricks.add(brick)
+            self.load_layout(level_data.get('layout', []))
                         
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading level {level_index}: {e}")
             # Create a default level if loading fails
             self._create_default_level()
     
-    def _create_default_level(self) -> None:
-        """Create a default level if loading fails"""
-        # Calculate the total width of the level
-        level_width = BRICK_COLS * (BRICK_WIDTH + BRICK_PADDING) - BRICK_PADDING
+    def load_layout(self, layout: List[str]) -> None:
+        """Replace the brick field with bricks built from a layout of rows"""
+        self.bricks.empty()
+        self.level_bricks = []
+        self.level_layout = list(layout)
+        self._layout_cells = {}
+        self.brick_grid.clear()
+        self.rewind.clear()
+        if not layout:
+            return
+        
+        # Rows are centred on the widest one
+        max_row_length = max(len(row) for row in layout)
         
-        # Calculate the starting x position to center the level
-        start_x = (SCREEN_WIDTH - level_width) // 2
+        # Levels too big for the screen get a larger playfield and a scrolling camera
+        self._set_world(*self._layout_world_size(layout))
         
+        for row_idx, row in enumerate(layout):
+            for col_idx, brick_type in enumerate(row):
+                if brick_type.strip():  # Skip empty spaces
+                    x, y = layout_position(col_idx, row_idx, max_row_length, self.world.width)
+                    if brick_type in BRICK_TYPES:
+                        brick = Brick(x, y, brick_type)
+                        self.bricks.add(brick)
+                        self.level_bricks.append(brick)
+                        self._layout_cells[(row_idx, col_idx)] = brick
+        self.brick_grid.build(self.level_bricks)
+    
+    @staticmethod
+    def _layout_world_size(layout: List[str]) -> Tuple[int, int]:
+        """Return the playfield size a layout needs: the screen, or more for big levels"""
+        max_row_length = max(len(row) for row in layout)
+        _, last_row_top = layout_position(0, len(layout) - 1, max_row_length)
+        return (max(SCREEN_WIDTH, layout_width(max_row_length) + WORLD_MARGIN * 2),
+                max(SCREEN_HEIGHT, last_row_top + BRICK_HEIGHT + WORLD_CLEARANCE))
+    
+    def reload_layout(self, layout: List[str]) -> None:
+        """Apply an edited layout to the live brick field, touching only the cells that changed.
+        
+        Cells the edit left alone keep their bricks as they are, damaged or
+        broken, and balls, power-ups and score carry on. An edit that resizes
+        the level moves every brick, so it rebuilds the field instead.
+        """
+        old = self.level_layout
+        if (not layout or not old or max(map(len, layout)) != max(map(len, old))
+                or self._layout_world_size(layout) != self.world.size):
+            self.load_layout(layout)
+            return
+        
+        columns = max(map(len, layout))
+        removed = set()
+        for row_idx in range(max(len(layout), len(old))):
+            new_row = layout[row_idx] if row_idx < len(layout) else ""
+            old_row = old[row_idx] if row_idx < len(old) else ""
+            if new_row == old_row:
+                continue
+            for col_idx in range(max(len(new_row), len(old_row))):
+                new_type = new_row[col_idx] if col_idx < len(new_row) else " "
+                old_type = old_row[col_idx] if col_idx < len(old_row) else " "
+                if new_type == old_type:
+                    continue
+                
+                # Take the old brick out, then reuse it (or build one) for the new type
+                brick = self._layout_cells.pop((row_idx, col_idx), None)
+                if brick is not None:
+                    self.bricks.remove(brick)
+                    self.brick_grid.remove(brick)
+                if new_type not in BRICK_TYPES:
+                    if brick is not None:
+                        removed.add(brick)
+                    continue
+                x, y = layout_position(col_idx, row_idx, columns, self.world.width)
+                if brick is None:
+                    brick = Brick(x, y, new_type)
+                    self.level_bricks.append(brick)
+                else:
+                    brick.reset(x, y, new_type)
+                self._layout_cells[(row_idx, col_idx)] = brick
+                self.bricks.add(brick)
+                self.brick_grid.add(brick)
+        
+        if removed:
+            self.level_bricks = [brick for brick in self.level_bricks if brick not in removed]
+        self.level_layout = list(layout)
+        # Recorded states no longer line up with the level's bricks
+        self.rewind.clear()
+    
+    def watch_levels(self) -> None:
+        """Start reloading level files when they are edited"""
+        if self.level_watcher is None:
+            self.level_watcher = LevelWatcher([level_path(i) for i in range(len(LEVEL_FILES))])
+            self.level_watcher.start()
+    
+    def _apply_level_edits(self) -> None:
+        """Reload the current level if its file was edited since the last step"""
+        for level_index, layout in self.level_watcher.pending():
+            if level_index == self.level and not self.endless.enabled:
+                self.reload_layout(layout)
+    
+    def load_endless(self) -> None:
+        """Replace the brick field with the first rows of the endless field"""
+        self.bricks.empty()
+        self.brick_grid.clear()
+        self.rewind.clear()
+        self._set_world(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.endless.start(self.bricks, self.brick_grid)
+        self.level_bricks = self.endless.bricks
+    
+    def _set_world(self, width: int, height: int) -> None:
+        """Resize the playfield, moving the paddle to its bottom and the camera onto the paddle"""
+        self.world = pygame.Rect(0, 0, width, height)
+        self.paddle.place(self.world)
+        self._position_ball_on_paddle()
+        self.camera.set_world(self.world, (self.paddle.rect.centerx, self.paddle.rect.top))
+    
+    @property
+    def camera_offset(self) -> Tuple[int, int]:
+        """Offset from world to screen coordinates"""
+        return self.camera.offset
+    
+    def visible_bricks(self) -> Iterable[Brick]:
+        """Return the bricks in view, plus the cull margin"""
+        return self._bricks_near(self.camera.visible)
+    
+    def _bricks_near(self, rect: pygame.Rect) -> Iterable[Brick]:
+        """Return the bricks that may overlap `rect`, through the grid when it indexes every brick"""
+        if len(self.brick_grid.cells) == len(self.bricks):
+            return self.brick_grid.query(rect)
+        return self.bricks
+    
+    @property
+    def rows_cleared(self) -> Optional[int]:
+        """Rows cleared in endless mode, or None when playing levels"""
+        return self.endless.rows_cleared if self.endless.enabled else None
+    
+    def _create_default_level(self) -> None:
+        """Create a default level if loading fails"""
+        self._set_world(SCREEN_WIDTH, SCREEN_HEIGHT)
         for row in range(BRICK_ROWS):
             for col in range(BRICK_COLS):
-                x = start_x + col * (BRICK_WIDTH + BRICK_PADDING)
-                y = row * (BRICK_HEIGHT + BRICK_PADDING) + BRICK_PADDING + 50
+                x, y = layout_position(col, row, BRICK_COLS)
                 brick_type = str(row + 1)  # Use row number + 1 for brick type (1-5)
                 if brick_type in BRICK_TYPES:
                     brick = Brick(x, y, brick_type)
                     self.bricks.add(brick)
+                    self.level_bricks.append(brick)
+        self.brick_grid.build(self.level_bricks)
     
     def _add_particles(self, x: int, y: int, color: Tuple[int, int, int], count: int = 10) -> None:
         """Add particle effects at the given position"""
+        # Bursts out of view would die before the camera got there
+        if not self.effects or not self.camera.visible.collidepoint(x, y):
+            return
+        rng = self.particle_random
+        count = max(1, int(count * self.quality.particle_scale))
         for _ in range(count):
             # Random velocity
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, 3)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
             # Random size and lifetime
-            size = random.randint(2, 5)
-            lifetime = random.randint(20, 40)
+            size = rng.randint(2, 5)
+            lifetime = rng.randint(20, 40)
             
             # Add particle
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': vx,
-                'vy': vy,
-                'size': size,
-                'color': color,
-                'lifetime': lifetime
-            })
+            particle = self.particle_pool.acquire(x, y, vx, vy, size, color, lifetime)
+            self.particles.append(particle)
+    
+    def _apply_effects(self) -> None:
+        """Apply the effects queued this step, coalesced, and empty the queue"""
+        queue = self.effect_queue
+        if not queue:
+            return
+        # Skipped turbo updates are never drawn, so their effects are dropped
+        if self.effects:
+            for x, y, color, count in queue.coalesced_bursts():
+                self._add_particles(x, y, color, count)
+            if queue.shake_amount:
+                self.shake_amount = queue.shake_amount
+                self.shake_time = pygame.time.get_ticks() + queue.shake_duration
+            for sound_name in queue.sounds:
+                self._play_sound(sound_name)
+        queue.clear()
     
     def _update_particles(self) -> None:
         """Update particle effects"""
-        # Update existing particles
-        for particle in self.particles[:]:
+        # Update existing particles, compacting the survivors to the front
+        particles = self.particles
+        world = self.world
+        alive = 0
+        for particle in particles:
             # Update position
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
+            particle.x += particle.vx
+            particle.y += particle.vy
             
             # Apply gravity
-            particle['vy'] += 0.05
+            particle.vy += 0.05
             
             # Decrease lifetime
-            particle['lifetime'] -= 1
+            particle.lifetime -= 1
             
-            # Remove if lifetime is over
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+            # Recycle if lifetime is over or it has left the world
+            if particle.lifetime > 0 and world.collidepoint(particle.x, particle.y):
+                particles[alive] = particle
+                alive += 1
+            else:
+                self.particle_pool.release(particle)
+        del particles[alive:]
     
-    def _draw_particles(self) -> None:
-        """Draw particle effects"""
-        for particle in self.particles:
+    def _draw_particles(self, particles: Optional[List[Particle]] = None,
+                        offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw particle effects, shifted by the camera `offset`"""
+        scale = self.render_scale
+        ox, oy = offset
+        visible = visible_area(offset)
+        for particle in self.particles if particles is None else particles:
+            if not visible.collidepoint(particle.x, particle.y):
+                continue
+            
             # Calculate alpha based on remaining lifetime
-            alpha = int(255 * (particle['lifetime'] / 40))
+            alpha = int(255 * (particle.lifetime / 40))
             
             # Create a surface with alpha
-            surf = pygame.Surface((particle['size'], particle['size']))
+            size = max(1, int(particle.size * scale))
+            surf = pygame.Surface((size, size))
             surf.set_alpha(alpha)
-            surf.fill(particle['color'])
+            surf.fill(particle.color)
             
             # Draw the particle
-            self.screen.blit(surf, (particle['x'] - particle['size'] // 2, 
-                                   particle['y'] - particle['size'] // 2))
+            self.screen.blit(surf, ((particle.x + ox) * scale - size // 2, 
+                                   (particle.y + oy) * scale - size // 2))
     
     def _draw_starfield(self) -> None:
         """Draw the starfield background"""
-        for x, y, size, brightness in self.background_stars:
+        scale = self.render_scale
+        stars = islice(self.background_stars, 0, None, self.quality.star_stride)
+        for x, y, size, brightness in stars:
             # Twinkle effect
             current_brightness = brightness * (0.8 + 0.2 * math.sin(time.time() * 2 + x * y))
             color = (int(255 * current_brightness),) * 3  # White with varying brightness
-            pygame.draw.circle(self.screen, color, (x, y), size)
+            pygame.draw.circle(self.screen, color, (x * scale, y * scale), max(1, size * scale))
     
-    def _apply_screen_shake(self) -> None:
-        """Apply screen shake effect"""
-        if self.shake_amount > 0:
+    def _shake_offset(self, view: Optional[FrameSnapshot] = None) -> Tuple[int, int]:
+        """Return this frame's screen shake offset in logical pixels"""
+        view = view or self
+        if view.shake_amount > 0:
             # Decrease shake amount over time
             current_time = pygame.time.get_ticks()
-            if current_time > self.shake_time:
-                self.shake_amount = 0
+            if current_time > view.shake_time:
+                if view is self:
+                    self.shake_amount = 0
             else:
                 # Calculate shake offset
-                dx = random.randint(-self.shake_amount, self.shake_amount)
-                dy = random.randint(-self.shake_amount, self.shake_amount)
-                
-                # Create a copy of the screen
-                screen_copy = self.screen.copy()
-                
-                # Clear the screen
-                self.screen.fill(BG_COLOR)
-                
-                # Draw the copy with offset
-                self.screen.blit(screen_copy, (dx, dy))
+                rng = self.shake_random
+                return (rng.randint(-view.shake_amount, view.shake_amount),
+                        rng.randint(-view.shake_amount, view.shake_amount))
+        return 0, 0
+    
+    def _apply_screen_shake(self, view: Optional[FrameSnapshot] = None) -> None:
+        """Apply screen shake effect"""
+        dx, dy = self._shake_offset(view)
+        if dx or dy:
+            # Create a copy of the screen
+            screen_copy = self.screen.copy()
+            
+            # Clear the screen
+            self.screen.fill(BG_COLOR)
+            
+            # Draw the copy with offset
+            self.screen.blit(screen_copy, (dx * self.render_scale, dy * self.render_scale))
     
     def update(self) -> None:
         """Update game state"""
+        self._step()
+        
+        # Apply the step's removals in one pass
+        self.balls.flush()
+        self.bricks.flush()
+        self.powerups.flush()
+    
+    def _step(self) -> None:
+        """Advance the game by one frame"""
+        # Only collect garbage while nothing is moving
+        self.gc_policy.step(not (self.paused or self.show_instructions
+                                 or self.game_over or self.level_complete))
+        
         # Don't update if paused, game over, or showing instructions
         if self.paused or self.show_instructions:
             return
+        
+        # Pick up edited level files
+        if self.level_watcher is not None:
+            self._apply_level_edits()
+        
+        # Rewind one frame per update while BACKSPACE is held
+        if self.rewinding and self.rewind.step_back(self):
+            return
             
         if self.game_over:
             # Only handle rendering when game is over
             return
+        
+        # The autopilot moves on by itself once a level is cleared
+        if self.level_complete and self.autopilot.enabled:
+            self.next_level()
             
-        # Update paddle
-        self.paddle.update()
+        timer = self.update_timer
+        timer.lap('update_setup')
+        
+        # Tick the simulation clock, ending power-ups that ran out
+        self.timers.advance()
+        
+        # Update paddle, steered by the autopilot when it's on
+        target_x = None
+        if self.autopilot.enabled:
+            for ball in self.balls:
+                ball.launch()
+            target_x = self.autopilot.plan(self.paddle, self.balls, self.brick_grid, len(self.bricks))
+        self.paddle.update(target_x)
         
         # Update ball positions on paddle if not active
         self._position_ball_on_paddle()
+        timer.lap('paddle')
+        
+        # Scroll the endless rows
+        if self.endless.enabled:
+            self.endless.update(self.bricks, self.brick_grid)
+            timer.lap('endless')
         
         # Check if any balls are active
         any_active_balls = False
         original_ball_active = False
         
-        # Update balls
+        # Update balls; their side effects are queued for _apply_effects()
+        fx = self.effect_queue
+        trail_length = self.quality.trail_length
+        if len(self.balls) > CROWD_BALL_COUNT:
+            trail_length = min(trail_length, CROWD_TRAIL_LENGTH)
         for ball in self.balls:
+            ball.trail_length = trail_length
+            
             # Update ball position
-            wall_collision = ball.update(self.paddle)
+            wall_collision = ball.update(self.paddle, self.world)
             
             # Check for wall collision sound
-            if wall_collision and 'bounce' in self.sounds:
-                self._play_sound('bounce')
+            if wall_collision and 'bounce' in self.audio:
+                fx.sound('bounce')
             
             # Check for paddle collision
-            if ball.check_paddle_collision(self.paddle) and 'bounce' in self.sounds:
-                self._play_sound('bounce')
+            if ball.check_paddle_collision(self.paddle) and 'bounce' in self.audio:
+                fx.sound('bounce')
                 # Add particles for visual effect
-                self._add_particles(ball.rect.centerx, ball.rect.bottom, WHITE, 5)
+                fx.burst(ball.rect.centerx, ball.rect.bottom, WHITE, 5)
+            timer.lap('ball_move')
             
-            # Check for brick collisions
-            for brick in self.bricks:
+            # Check for brick collisions; a hit can push the ball up to a brick's length
+            for brick in self._bricks_near(ball.rect.inflate(BRICK_WIDTH * 2, BRICK_WIDTH * 2)):
                 if ball.check_brick_collision(brick):
                     if brick.is_breakable:
                         if brick.hit():
                             # Brick broken
                             self.score += brick.points
                             self.bricks.remove(brick)
+                            self.brick_grid.remove(brick)
+                            if self.endless.enabled:
+                                self.score += self.endless.brick_broken(brick)
                             
                             # Visual effects
-                            self._add_particles(brick.rect.centerx, brick.rect.centery, 
-                                              brick.brick_type.color, 15)
-                            self.shake_amount = 3
-                            self.shake_time = pygame.time.get_ticks() + 100
+                            fx.burst(brick.rect.centerx, brick.rect.centery, brick.brick_type.color, 15)
+                            fx.shake(3, 100)
                             
                             # Play sound
-                            self._play_sound('brick_break')
+                            fx.sound('brick_break')
                             
                             # Chance to spawn power-up
                             if random.random() < POWERUP_DROP_CHANCE:
                                 self._spawn_powerup(brick.rect.centerx, brick.rect.centery)
                         else:
                             # Brick hit but not broken
-                            self._play_sound('bounce')
+                            fx.sound('bounce')
                             # Add fewer particles for a hit
-                            self._add_particles(brick.rect.centerx, brick.rect.centery, 
-                                              brick.brick_type.color, 5)
+                            fx.burst(brick.rect.centerx, brick.rect.centery, brick.brick_type.color, 5)
                     else:
                         # Unbreakable brick
-                        self._play_sound('bounce')
+                        fx.sound('bounce')
+            timer.lap('brick_collision')
             
             # Check if ball is below screen
-            if ball.rect.top > SCREEN_HEIGHT:
+            if ball.rect.top > self.world.bottom:
                 # Only count as a lost ball if it was active
                 if ball.is_active:
                     # Remove the ball
                     self.balls.remove(ball)
+                    self.ball_pool.release(ball)
                     
                     # Track if this was the original ball
                     if ball == self.original_ball:
@@ -406,22 +736,30 @@ class Game:
                     if ball == self.original_ball:
                         original_ball_active = True
         
+        # Bounce balls off each other
+        if self.ball_collisions:
+            timer.lap('ball_move')
+            collide_balls(self.balls, self.ball_hash)
+            timer.lap('ball_collisions')
+        
         # Check if all balls are lost
         if len(self.balls) == 0:
             # Only lose a life when all balls are gone
             self.lives -= 1
             if self.lives <= 0:
                 self.game_over = True
-                self._play_sound('game_over')
+                fx.sound('game_over')
                 # Add lots of particles for game over
+                view = self.camera.view
                 for _ in range(5):
-                    self._add_particles(random.randint(0, SCREEN_WIDTH),
-                                      random.randint(0, SCREEN_HEIGHT),
-                                      (255, 100, 100), 20)
+                    fx.burst(random.randint(view.left, view.right),
+                             random.randint(view.top, view.bottom),
+                             (255, 100, 100), 20)
             else:
                 # Create a new original ball if we still have lives
                 self.original_ball = self.create_ball(is_original=True)
                 self._position_ball_on_paddle()
+        timer.lap('ball_move')
         
         # Update power-ups
         for powerup in self.powerups:
@@ -430,31 +768,58 @@ class Game:
             # Check for paddle collision
             if powerup.rect.colliderect(self.paddle.rect):
                 self._apply_powerup(powerup.type)
-                self.powerups.remove(powerup)
-                self._play_sound('powerup')
+                fx.sound('powerup')
                 # Add particles for power-up collection
-                self._add_particles(powerup.rect.centerx, powerup.rect.centery, 
-                                  powerup.color, 15)
+                fx.burst(powerup.rect.centerx, powerup.rect.centery, powerup.color, 15)
+                self.powerups.remove(powerup)
+                self.powerup_pool.release(powerup)
             
             # Remove if below screen
-            if powerup.rect.top > SCREEN_HEIGHT:
+            elif powerup.rect.top > self.world.bottom:
                 self.powerups.remove(powerup)
+                self.powerup_pool.release(powerup)
+        timer.lap('powerups')
+        
+        # Spawn the step's particles, shake and sounds in one batch
+        self._apply_effects()
+        timer.lap('effects')
         
         # Update particles
         self._update_particles()
+        timer.lap('particles')
+        
+        # Keep the balls in view
+        self.camera.follow(self.balls, self.paddle)
         
-        # Check for level completion
-        if len(self.bricks) == 0 or all(not brick.is_breakable for brick in self.bricks):
+        # Move meteors and nebulas
+        self.background.update()
+        timer.lap('background_update')
+        
+        # Check for level completion (endless mode counts rows one by one instead)
+        if not self.level_complete and not self.endless.enabled and (
+                len(self.bricks) == 0 or all(not brick.is_breakable for brick in self.bricks)):
             self.level_complete = True
             self._play_sound('level_complete')
+        
+        # Record this frame for rewinding
+        self.rewind.record(self)
+        timer.lap('rewind')
+    
+    def advance(self, steps: Optional[int] = None) -> None:
+        """Run `steps` updates (default: the turbo factor) for one displayed frame.
+        
+        Only the last update, the one that gets drawn, makes particles, sounds
+        and screen shake.
+        """
+        steps = self.turbo if steps is None else steps
+        for step in range(steps - 1, -1, -1):
+            self.effects = step == 0
+            self.update()
     
     def _play_sound(self, sound_name: str) -> None:
-        """Play a sound if available"""
-        if sound_name in self.sounds and pygame.mixer.get_init():
-            try:
-                self.sounds[sound_name].play()
-            except:
-                pass  # Silently fail if sound can't be played
+        """Play a sound if available and the mixer has a voice for it"""
+        if self.effects:
+            self.audio.play(sound_name)
     
     def _spawn_powerup(self, x: int, y: int) -> None:
         """Spawn a random power-up at the given position"""
@@ -469,104 +834,229 @@ class Game:
             powerup_type = random.choices(powerup_types, weights=normalized_chances, k=1)[0]
             
             # Create and add the power-up
-            powerup = PowerUp(x, y, powerup_type)
+            powerup = self.powerup_pool.acquire(x, y, powerup_type)
             self.powerups.add(powerup)
     
     def _apply_powerup(self, powerup_type: str) -> None:
         """Apply a power-up effect"""
         if powerup_type == "WIDE" or powerup_type == "STICKY":
             self.paddle.apply_powerup(powerup_type)
+            self.time_powerup(self.paddle, powerup_type)
         elif powerup_type == "MULTI":
-            # Create two additional balls
-            for _ in range(2):
+            # Create additional balls (two, or many more in chaos mode)
+            for _ in range(self.multi_ball_count):
                 if self.balls:
                     # Get position of an existing ball
-                    existing_ball = self.balls.sprites()[0]
-                    new_ball = Ball(existing_ball.rect.centerx, existing_ball.rect.centery)
+                    existing_ball = self.balls.first()
+                    new_ball = self.ball_pool.acquire(existing_ball.rect.centerx, existing_ball.rect.centery)
                     new_ball.is_active = True
                     self.balls.add(new_ball)
         elif powerup_type == "SLOW":
             # Apply slow-motion to all balls
             for ball in self.balls:
                 ball.apply_powerup(powerup_type)
+                self.time_powerup(ball, powerup_type)
+    
+    def time_powerup(self, target: Union[Paddle, Ball], powerup_type: str,
+                     duration: Optional[float] = None) -> None:
+        """End `target`'s power-up after `duration` simulated ms (default: its full duration)"""
+        if duration is None:
+            duration = POWERUP_DURATION[powerup_type]
+        self.timers.schedule((target, powerup_type), duration, target.end_powerup, powerup_type)
     
-    def render(self) -> None:
-        """Render game objects"""
-        # Draw background
+    def render(self, snapshot: Optional[FrameSnapshot] = None) -> None:
+        """Render game objects, from a frame snapshot if given"""
+        # Snapshots carry the same attribute names as the game itself
+        view = self if snapshot is None else snapshot
+        timer = self.frame_timer
+        timer.lap('update')
+        
+        # Frozen screens reuse the frame composed on entry; only the prompt animates
+        idle = self.idle_screen(view)
+        idle_key = (idle, view.score, view.lives, view.level) if idle else None
+        if idle_key is not None and idle_key == self._idle_key:
+            self.display.blit(self._idle_frame, (0, 0))
+            self._draw_prompt(view, self.prompt_screen)
+            timer.lap('idle_frame')
+            timer.draw_overlay(self.display)
+            timer.lap('debug_overlay')
+            return
+        self._idle_key = None
+        
+        # World objects are drawn shifted by the camera
+        offset = view.camera_offset
+        ox, oy = offset
+        
+        # Draw background; its layers shift with the paddle for a parallax effect
         self.screen.fill(BG_COLOR)
         self._draw_starfield()
+        self.background.draw(self.screen, view.paddle.rect.centerx + ox - SCREEN_WIDTH // 2, 0, self.render_scale)
+        timer.lap('background')
         
         # Draw paddle with shadow
-        shadow_surf = pygame.Surface((self.paddle.width, self.paddle.height))
-        shadow_surf.fill(BLACK)
-        shadow_surf.set_alpha(100)
-        self.screen.blit(shadow_surf, (self.paddle.rect.x + 5, self.paddle.rect.y + 5))
-        self.paddle.draw(self.screen)
+        scale = self.render_scale
+        shadows = self.quality.shadows
+        if shadows:
+            shadow_rect = scale_rect(view.paddle.rect.move(ox + 5, oy + 5), scale)
+            shadow_surf = pygame.Surface(shadow_rect.size)
+            shadow_surf.fill(BLACK)
+            shadow_surf.set_alpha(100)
+            self.screen.blit(shadow_surf, shadow_rect)
+        view.paddle.draw(self.screen, scale, offset)
+        timer.lap('paddle_draw')
         
         # Draw balls with glow effect
-        for ball in self.balls:
-            ball.draw(self.screen)
+        glow = self.quality.glow
+        draw_balls(self.screen, view.balls, glow, scale, offset)
+        for x, y in self.aim_dots() if snapshot is None else view.aim_preview_dots:
+            pygame.draw.circle(self.screen, AIM_DOT_COLOR, ((x + ox) * scale, (y + oy) * scale), max(1, 2 * scale))
+        timer.lap('balls')
         
-        # Draw bricks with shadow
-        for brick in self.bricks:
+        # Draw bricks with shadow; only those in view (snapshots hold just those)
+        for brick in self.visible_bricks() if snapshot is None else view.bricks:
             # Draw shadow
-            shadow_surf = pygame.Surface((brick.width, brick.height))
-            shadow_surf.fill(BLACK)
-            shadow_surf.set_alpha(50)
-            self.screen.blit(shadow_surf, (brick.rect.x + 3, brick.rect.y + 3))
-            brick.draw(self.screen)
+            if shadows:
+                shadow_rect = scale_rect(brick.rect.move(ox + 3, oy + 3), scale)
+                shadow_surf = pygame.Surface(shadow_rect.size)
+                shadow_surf.fill(BLACK)
+                shadow_surf.set_alpha(50)
+                self.screen.blit(shadow_surf, shadow_rect)
+            brick.draw(self.screen, scale, offset)
+        timer.lap('bricks')
         
         # Draw power-ups
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
+        for powerup in view.powerups:
+            powerup.draw(self.screen, glow, scale, offset)
+        timer.lap('powerup_draw')
         
         # Draw particles
-        self._draw_particles()
+        self._draw_particles(view.particles, offset)
+        timer.lap('particle_draw')
+        
+        # HUD and state screens share the scene unless they render natively
+        if not self.ui_native:
+            self._draw_ui(view, prompt=idle is None)
+        
+        # Apply screen shake
+        self._apply_screen_shake(view)
+        timer.lap('shake')
+        
+        # Upscale the scene to the display with a single scaled blit
+        if self.screen is not self.display:
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
+            timer.lap('upscale')
+        
+        if self.ui_native:
+            self._draw_ui(view, prompt=idle is None)
+        
+        # Keep the frozen frame (once any shake has settled) and add the prompt on top
+        if idle_key is not None:
+            if view.shake_amount == 0 or pygame.time.get_ticks() > view.shake_time:
+                if self._idle_frame is None:
+                    self._idle_frame = self.display.copy()
+                else:
+                    self._idle_frame.blit(self.display, (0, 0))
+                self._idle_key = idle_key
+            self._draw_prompt(view, self.prompt_screen)
+        
+        # Debug overlay is drawn last so it never shakes
+        timer.draw_overlay(self.display)
+        timer.lap('debug_overlay')
+    
+    def aim_dots(self) -> List[Tuple[int, int]]:
+        """Return the dotted launch paths of balls waiting on the paddle, if previewing"""
+        if not self.aim_preview:
+            return []
+        dots = []
+        for ball in self.balls:
+            if ball.is_active and not ball.is_stuck:
+                continue
+            velocity = (math.sin(ball.launch_angle), -math.cos(ball.launch_angle))
+            path = trace_path(self.brick_grid, ball.rect.center, velocity, ball.radius,
+                              AIM_PREVIEW_BOUNCES, self.paddle.rect,
+                              floor_y=self.paddle.world.bottom + ball.radius, width=self.paddle.world.right)
+            dots.extend(path_dots(path, AIM_DOT_SPACING))
+        return dots
+    
+    def idle_screen(self, view: Optional[FrameSnapshot] = None) -> Optional[str]:
+        """Name the frozen screen being shown, or None while the game is running"""
+        view = view or self
+        if view.show_instructions:
+            return "instructions"
+        if view.game_over:
+            return "game_over"
+        if view.paused:
+            return "paused"
+        return None
+    
+    def _draw_ui(self, view: Optional[FrameSnapshot] = None, prompt: bool = True) -> None:
+        """Draw the HUD and the current state screen"""
+        view = view or self
+        timer = self.frame_timer
         
         # Draw HUD
-        self._draw_hud()
+        self._draw_hud(view)
+        timer.lap('hud')
         
         # Draw game state screens
-        if self.show_instructions:
+        if view.show_instructions:
             self._draw_instructions()
-        elif self.game_over:
+        elif view.game_over:
             self._draw_game_over()
-        elif self.level_complete:
+        elif view.level_complete:
             self._draw_level_complete()
-        
-        # Apply screen shake
-        self._apply_screen_shake()
+        if prompt:
+            self._draw_prompt(view)
+        timer.lap('overlays')
+    
+    def _draw_dim(self, alpha: int) -> None:
+        """Darken everything drawn so far with a cached translucent overlay"""
+        key = (self.ui_surface.get_size(), alpha)
+        overlay = self._dim_overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(key[0], pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            self._dim_overlays[key] = overlay
+        self.ui_surface.blit(overlay, (0, 0))
     
-    def _draw_hud(self) -> None:
+    def _draw_hud(self, view: Optional[FrameSnapshot] = None) -> None:
         """Draw heads-up display (score, lives)"""
+        view = view or self
+        
         # Draw score with shadow
-        score_text = f"SCORE: {self.score}"
+        score_text = f"SCORE: {view.score}"
         shadow_surf = self.font.render(score_text, True, BLACK)
         score_surf = self.font.render(score_text, True, WHITE)
-        self.screen.blit(shadow_surf, (22, 22))
-        self.screen.blit(score_surf, (20, 20))
+        self.ui_screen.blit(shadow_surf, (22, 22))
+        self.ui_screen.blit(score_surf, (20, 20))
         
         # Draw lives (ensure it's never negative)
-        lives_display = max(0, self.lives)
+        lives_display = max(0, view.lives)
         lives_text = f"LIVES: {lives_display}"
         shadow_surf = self.font.render(lives_text, True, BLACK)
         lives_surf = self.font.render(lives_text, True, WHITE)
-        self.screen.blit(shadow_surf, (SCREEN_WIDTH - lives_surf.get_width() - 18, 22))
-        self.screen.blit(lives_surf, (SCREEN_WIDTH - lives_surf.get_width() - 20, 20))
+        self.ui_screen.blit(shadow_surf, (SCREEN_WIDTH - lives_surf.get_width() - 18, 22))
+        self.ui_screen.blit(lives_surf, (SCREEN_WIDTH - lives_surf.get_width() - 20, 20))
         
-        # Draw level
-        level_text = f"LEVEL: {self.level + 1}"
+        # Draw level, or rows cleared in endless mode
+        if view.rows_cleared is not None:
+            level_text = f"ROWS: {view.rows_cleared}"
+        else:
+            level_text = f"LEVEL: {view.level + 1}"
         shadow_surf = self.font.render(level_text, True, BLACK)
         level_surf = self.font.render(level_text, True, WHITE)
-        self.screen.blit(shadow_surf, (SCREEN_WIDTH // 2 - level_surf.get_width() // 2 + 2, 22))
-        self.screen.blit(level_surf, (SCREEN_WIDTH // 2 - level_surf.get_width() // 2, 20))
+        self.ui_screen.blit(shadow_surf, (SCREEN_WIDTH // 2 - level_surf.get_width() // 2 + 2, 22))
+        self.ui_screen.blit(level_surf, (SCREEN_WIDTH // 2 - level_surf.get_width() // 2, 20))
+        
+        # Draw turbo factor
+        if view.turbo > 1:
+            turbo_surf = self.font.render(f"TURBO x{view.turbo}", True, YELLOW)
+            self.ui_screen.blit(turbo_surf, (SCREEN_WIDTH // 2 - turbo_surf.get_width() // 2, 50))
     
     def _draw_game_over(self) -> None:
         """Draw game over message"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        # Darken the scene with a semi-transparent overlay
+        self._draw_dim(150)
         
         # Draw game over text with glow
         game_over_text = "GAME OVER"
@@ -576,33 +1066,17 @@ class Game:
             glow_surf = self.font.render(game_over_text, True, (128, 0, 0))
             glow_rect = glow_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
             glow_surf.set_alpha(50)
-            self.screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
+            self.ui_screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
         
         # Draw main text
         game_over_surf = self.font.render(game_over_text, True, (255, 100, 100))
         game_over_rect = game_over_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-        self.screen.blit(game_over_surf, game_over_rect)
-        
-        # Draw restart text with animation
-        restart_text = "Press R to restart"
-        restart_surf = self.font.render(restart_text, True, WHITE)
-        restart_rect = restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-        
-        # Pulsating effect
-        scale = 1.0 + 0.1 * math.sin(time.time() * 4)
-        scaled_width = int(restart_surf.get_width() * scale)
-        scaled_height = int(restart_surf.get_height() * scale)
-        scaled_surf = pygame.transform.scale(restart_surf, (scaled_width, scaled_height))
-        scaled_rect = scaled_surf.get_rect(center=restart_rect.center)
-        
-        self.screen.blit(scaled_surf, scaled_rect)
+        self.ui_screen.blit(game_over_surf, game_over_rect)
     
     def _draw_level_complete(self) -> None:
         """Draw level complete message"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
+        # Darken the scene with a semi-transparent overlay
+        self._draw_dim(100)
         
         # Draw level complete text with glow
         level_complete_text = "LEVEL COMPLETE!"
@@ -612,33 +1086,17 @@ class Game:
             glow_surf = self.font.render(level_complete_text, True, (0, 128, 0))
             glow_rect = glow_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
             glow_surf.set_alpha(50)
-            self.screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
+            self.ui_screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
         
         # Draw main text
         level_complete_surf = self.font.render(level_complete_text, True, (100, 255, 100))
         level_complete_rect = level_complete_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-        self.screen.blit(level_complete_surf, level_complete_rect)
-        
-        # Draw next level text with animation
-        next_text = "Press SPACE to continue"
-        next_surf = self.font.render(next_text, True, WHITE)
-        next_rect = next_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-        
-        # Pulsating effect
-        scale = 1.0 + 0.1 * math.sin(time.time() * 4)
-        scaled_width = int(next_surf.get_width() * scale)
-        scaled_height = int(next_surf.get_height() * scale)
-        scaled_surf = pygame.transform.scale(next_surf, (scaled_width, scaled_height))
-        scaled_rect = scaled_surf.get_rect(center=next_rect.center)
-        
-        self.screen.blit(scaled_surf, scaled_rect)
+        self.ui_screen.blit(level_complete_surf, level_complete_rect)
     
     def _draw_instructions(self) -> None:
         """Draw game instructions"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
+        # Darken the scene with a semi-transparent overlay
+        self._draw_dim(100)
         
         # Draw title with glow
         title_text = "BRICK BREAKER"
@@ -648,12 +1106,12 @@ class Game:
             glow_surf = self.font.render(title_text, True, (128, 128, 0))
             glow_rect = glow_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
             glow_surf.set_alpha(50)
-            self.screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
+            self.ui_screen.blit(glow_surf, (glow_rect.x - i, glow_rect.y - i))
         
         # Draw main title
         title_surf = self.font.render(title_text, True, (255, 255, 100))
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        self.screen.blit(title_surf, title_rect)
+        self.ui_screen.blit(title_surf, title_rect)
         
         # Draw instructions
         instructions = [
@@ -671,26 +1129,46 @@ class Game:
             # Add shadow
             shadow_surf = self.font.render(line, True, BLACK)
             shadow_rect = shadow_surf.get_rect(center=(SCREEN_WIDTH // 2 + 2, SCREEN_HEIGHT // 2 - 30 + i * 30 + 2))
-            self.screen.blit(shadow_surf, shadow_rect)
+            self.ui_screen.blit(shadow_surf, shadow_rect)
             
-            self.screen.blit(text_surf, text_rect)
+            self.ui_screen.blit(text_surf, text_rect)
+    
+    def _draw_prompt(self, view: Optional[FrameSnapshot] = None, target=None) -> None:
+        """Draw the pulsating key prompt of the current state screen"""
+        view = view or self
+        if view.show_instructions:
+            prompt = "Press SPACE to start"
+            center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90)
+        elif view.game_over:
+            prompt = "Press R to restart"
+            center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)
+        elif view.level_complete:
+            prompt = "Press SPACE to continue"
+            center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)
+        else:
+            return
         
-        # Draw animated "Press SPACE" text
-        if instructions[-1] == "Press SPACE to start":
-            space_surf = self.font.render(instructions[-1], True, WHITE)
-            space_rect = space_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30 + (len(instructions) - 1) * 30))
-            
-            # Pulsating effect
-            scale = 1.0 + 0.1 * math.sin(time.time() * 4)
-            scaled_width = int(space_surf.get_width() * scale)
-            scaled_height = int(space_surf.get_height() * scale)
-            scaled_surf = pygame.transform.scale(space_surf, (scaled_width, scaled_height))
-            scaled_rect = scaled_surf.get_rect(center=space_rect.center)
-            
-            self.screen.blit(scaled_surf, scaled_rect)
+        # The text only changes with the font; scaling it is the animation
+        key = (id(self.font), prompt)
+        prompt_surf = self._prompt_surfaces.get(key)
+        if prompt_surf is None:
+            prompt_surf = self._prompt_surfaces[key] = self.font.render(prompt, True, WHITE)
+        
+        # Pulsating effect
+        scale = 1.0 + 0.1 * math.sin(time.time() * 4)
+        scaled_width = int(prompt_surf.get_width() * scale)
+        scaled_height = int(prompt_surf.get_height() * scale)
+        scaled_surf = pygame.transform.scale(prompt_surf, (scaled_width, scaled_height))
+        scaled_rect = scaled_surf.get_rect(center=center)
+        
+        (target or self.ui_screen).blit(scaled_surf, scaled_rect)
     
     def handle_events(self, event: pygame.event.Event) -> None:
         """Handle game events"""
+        if event.type == pygame.KEYUP and event.key == pygame.K_BACKSPACE:
+            self.rewinding = False
+            return
+            
         if event.type == pygame.KEYDOWN:
             # Show instructions screen
             if self.show_instructions and event.key == pygame.K_SPACE:
@@ -705,6 +1183,10 @@ class Game:
                     for ball in self.balls:
                         ball.launch()
             
+            # Hold BACKSPACE to rewind
+            elif event.key == pygame.K_BACKSPACE:
+                self.rewinding = True
+            
             # Pause game with P
             elif event.key == pygame.K_p:
                 self.paused = not self.paused
@@ -712,6 +1194,46 @@ class Game:
             # Restart game with R
             elif event.key == pygame.K_r:
                 self.reset()
+            
+            # Toggle frame timing overlay with F3, export it with F4
+            elif event.key == pygame.K_F3:
+                self.frame_timer.toggle()
+            elif event.key == pygame.K_F4 and self.frame_timer.enabled:
+                self.frame_timer.export_json(FRAME_TIMES_FILE)
+            
+            # Start/stop the sampling profiler with F9
+            elif event.key == pygame.K_F9:
+                self.profiler.toggle()
+            
+            # Start/stop allocation tracking with F6
+            elif event.key == pygame.K_F6:
+                self.alloc_tracker.toggle()
+            
+            # Toggle the GC policy with F7
+            elif event.key == pygame.K_F7:
+                self.gc_policy.toggle()
+            
+            # Toggle the aim preview with A
+            elif event.key == pygame.K_a:
+                self.aim_preview = not self.aim_preview
+            
+            # Toggle the autopilot with O
+            elif event.key == pygame.K_o:
+                self.autopilot.toggle()
+            
+            # Toggle ball-to-ball collisions with C
+            elif event.key == pygame.K_c:
+                self.ball_collisions = not self.ball_collisions
+            
+            # Switch between levels and endless mode with E (restarts the game)
+            elif event.key == pygame.K_e:
+                self.endless.enabled = not self.endless.enabled
+                self.reset()
+            
+            # Cycle turbo speeds with T
+            elif event.key == pygame.K_t:
+                index = TURBO_LEVELS.index(self.turbo) + 1 if self.turbo in TURBO_LEVELS else 0
+                self.turbo = TURBO_LEVELS[index % len(TURBO_LEVELS)]
     
     def next_level(self) -> None:
         """Advance to the next level"""
@@ -722,17 +1244,25 @@ class Game:
         
         # Reset level state
         self.level_complete = False
-        self.powerups.empty()
-        self.particles = []
+        self._clear_entities()
         self.ball_was_active = False
         
         # Reset balls
-        self.balls.empty()
         self.original_ball = self.create_ball(is_original=True)
         self._position_ball_on_paddle()
         
         # Load new level bricks
         self._load_level_bricks(self.level)
+        self.gc_policy.freeze()
+    
+    def _clear_entities(self) -> None:
+        """Return every ball, power-up and particle to its pool"""
+        self.ball_pool.release_all(self.balls)
+        self.balls.empty()
+        self.powerup_pool.release_all(self.powerups)
+        self.powerups.empty()
+        self.particle_pool.release_all(self.particles)
+        self.particles.clear()
     
     def reset(self) -> None:
         """Reset the game state"""
@@ -745,13 +1275,14 @@ class Game:
         self.show_instructions = False  # Skip instructions on restart
         self.paused = False
         self.ball_was_active = False
-        self.particles = []
         self.shake_amount = 0
         
         # Reset game objects
+        self.timers.clear()
         self.paddle = Paddle()
-        self.balls.empty()
-        self.powerups.empty()
+        self.paddle.place(self.world)
+        self.autopilot.reset()
+        self._clear_entities()
         
         # Create a new ball
         self.original_ball = self.create_ball(is_original=True)
@@ -759,3 +1290,4 @@ class Game:
         
         # Load the first level bricks
         self._load_level_bricks(self.level)
+        self.gc_policy.freeze()
@@ -0,0 +1,112 @@
+"""
+Garbage-collector pause management for gameplay
+"""
+import gc
+import time
+from collections import deque
+from typing import Deque, Dict, List
+from settings import *
+
+
+class GCPauseMonitor:
+    """Measures how long every collection pauses the game"""
+
+    def __init__(self) -> None:
+        """Initialize the monitor; call install() to start measuring"""
+        self.pending_ms = 0.0  # Pause time not yet claimed by a frame
+        self.pending_collections = 0
+        self._start = 0.0
+        self._installed = False
+
+    def install(self) -> None:
+        """Register the gc callback once per process"""
+        if not self._installed:
+            gc.callbacks.append(self._on_gc)
+            self._installed = True
+
+    def _on_gc(self, phase: str, info: Dict) -> None:
+        """gc callback timing each collection"""
+        if phase == 'start':
+            self._start = time.perf_counter()
+        else:
+            self.pending_ms += (time.perf_counter() - self._start) * 1000
+            self.pending_collections += 1
+
+    def claim(self) -> float:
+        """Return and reset the pause time accumulated since the last claim"""
+        ms = self.pending_ms
+        self.pending_ms = 0.0
+        self.pending_collections = 0
+        return ms
+
+
+PAUSE_MONITOR = GCPauseMonitor()
+
+
+class GCPolicy:
+    """Defers collections during active play and runs them on idle screens"""
+
+    def __init__(self, enabled: bool = GC_POLICY_ENABLED, history: int = FRAME_TIMER_HISTORY) -> None:
+        """Initialize the policy"""
+        self.enabled = enabled
+        self.pauses: Deque[float] = deque(maxlen=history)  # GC ms per frame
+        self.deferred = False  # Automatic collection is currently off
+        self._idle_collected = False
+        PAUSE_MONITOR.install()
+
+    def freeze(self) -> None:
+        """Collect once and move every surviving object out of the GC's reach"""
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+
+    def step(self, active: bool) -> None:
+        """Apply the policy for one frame; `active` is True during live play"""
+        self.pauses.append(PAUSE_MONITOR.claim())
+        if not self.enabled:
+            return
+
+        if active:
+            self._idle_collected = False
+            if not self.deferred:
+                gc.disable()
+                self.deferred = True
+            # Safety valve: young collections are short, full ones wait for idle
+            if gc.get_count()[0] > GC_YOUNG_LIMIT:
+                gc.collect(0)
+        elif not self._idle_collected:
+            # Nothing is moving, so a full collection can't be seen
+            gc.collect()
+            gc.freeze()
+            self._idle_collected = True
+            if self.deferred:
+                gc.enable()
+                self.deferred = False
+
+    def toggle(self) -> None:
+        """Switch between the policy and CPython's default behaviour"""
+        self.enabled = not self.enabled
+        self.pauses.clear()
+        if not self.enabled:
+            gc.unfreeze()
+            gc.enable()
+            self.deferred = False
+        print(f"GC policy {'enabled' if self.enabled else 'disabled'}")
+
+    def stats(self) -> Dict[str, float]:
+        """Return mean and worst GC pause per frame over the recent history"""
+        if not self.pauses:
+            return {'mean_ms': 0.0, 'max_ms': 0.0, 'frames_with_gc': 0}
+        return {
+            'mean_ms': sum(self.pauses) / len(self.pauses),
+            'max_ms': max(self.pauses),
+            'frames_with_gc': sum(1 for ms in self.pauses if ms > 0),
+        }
+
+    def overlay_lines(self) -> List[str]:
+        """Return text lines for the debug overlay"""
+        stats = self.stats()
+        state = 'on' if self.enabled else 'off'
+        return [f"gc policy {state}: max {stats['max_ms']:.2f} ms  "
+                f"mean {stats['mean_ms']:.3f} ms  frames {stats['frames_with_gc']}"]
@@ -0,0 +1,83 @@
+"""
+Level hot-reload: polls level files on a background thread and parses the ones that change
+"""
+import json
+import os
+import queue
+import threading
+from typing import List, Optional, Tuple
+from settings import *
+
+Stamp = Optional[Tuple[int, int]]  # (mtime in ns, size), or None for a missing file
+Change = Tuple[int, List[str]]  # Level index and its new layout
+
+
+def level_path(level_index: int) -> str:
+    """Return the absolute path of a level file"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(root, LEVEL_FILES[level_index])
+
+
+def _stamp(path: str) -> Stamp:
+    """Return what identifies the current version of a file"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LevelWatcher(threading.Thread):
+    """Watches the level files so designers see their edits without restarting.
+
+    The thread only stats files and parses the JSON of changed ones; the game
+    drains `changes` between steps and applies the layouts itself. A file that
+    doesn't parse (e.g. caught mid-save) is skipped until it changes again.
+    """
+
+    def __init__(self, paths: List[str], interval: float = LEVEL_WATCH_INTERVAL) -> None:
+        """Prepare to watch `paths` (indexed like LEVEL_FILES); call start() to begin"""
+        super().__init__(name="level-watcher", daemon=True)
+        self.paths = list(paths)
+        self.interval = interval
+        self.changes: "queue.SimpleQueue[Change]" = queue.SimpleQueue()
+        self._stamps = [_stamp(path) for path in self.paths]
+        self._stop_event = threading.Event()
+
+    def poll(self) -> int:
+        """Check every file once and queue the layouts of changed ones; returns how many"""
+        queued = 0
+        for index, path in enumerate(self.paths):
+            stamp = _stamp(path)
+            if stamp == self._stamps[index]:
+                continue
+            self._stamps[index] = stamp
+            try:
+                with open(path, 'r') as f:
+                    layout = json.load(f).get('layout', [])
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Warning: Could not reload {path}: {e}")
+                continue
+            self.changes.put((index, layout))
+            queued += 1
+        return queued
+
+    def pending(self) -> List[Change]:
+        """Take every queued change, oldest first"""
+        changes = []
+        while True:
+            try:
+                changes.append(self.changes.get_nowait())
+            except queue.Empty:
+                return changes
+
+    def run(self) -> None:
+        """Poll until stopped"""
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to finish"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
@@ -2,13 +2,103 @@
 """
 Brick Breaker Game - Main Entry Point
 """
+import argparse
 import pygame
 import sys
 import os
+import time
+from typing import List, Optional
 from settings import *
+from renderers import create_renderer
+from pipeline import RENDER_KEYS, SimulationThread, SnapshotBuffer
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Brick Breaker")
+    parser.add_argument('--profile', action='store_true',
+                        help="sample the main loop from startup and write a profile on exit")
+    parser.add_argument('--profile-format', choices=['collapsed', 'speedscope'],
+                        default='collapsed', help="profile output format")
+    parser.add_argument('--render-scale', type=float, default=RENDER_SCALE,
+                        help="internal render resolution as a fraction of the window, e.g. 0.5")
+    parser.add_argument('--no-native-hud', dest='native_hud', action='store_false',
+                        default=NATIVE_HUD, help="draw HUD text at the internal resolution too")
+    parser.add_argument('--sdl-scaled', action='store_true',
+                        help="let SDL upscale an internal-size window (pygame.SCALED)")
+    parser.add_argument('--renderer', choices=['surface', 'sdl2', 'sdl2-software'], default=RENDERER,
+                        help="drawing backend; sdl2 draws cached GPU textures")
+    parser.add_argument('--pipelined', action='store_true', default=PIPELINED,
+                        help="simulate on a worker thread and render its frame snapshots")
+    parser.add_argument('--turbo', type=int, default=TURBO, metavar='N',
+                        help="run N updates per displayed frame (fast-forward)")
+    parser.add_argument('--chaos', action='store_true',
+                        help="balls collide with each other and MULTI adds %d balls" % CHAOS_MULTI_BALL_COUNT)
+    parser.add_argument('--endless', type=int, nargs='?', const=ENDLESS_SEED, metavar='SEED',
+                        help="play endless procedural rows generated from SEED")
+    parser.add_argument('--watch-levels', action='store_true', default=LEVEL_WATCH,
+                        help="reload level files when they are edited")
+    parser.add_argument('--autopilot', action='store_true', default=AUTOPILOT,
+                        help="let the paddle play itself (soak runs, demos)")
+    return parser.parse_args(argv)
+
+def quit_game(game) -> None:
+    """Write pending profiles and exit"""
+    game.profiler.stop()
+    game.alloc_tracker.stop()
+    if game.level_watcher is not None:
+        game.level_watcher.stop()
+    pygame.quit()
+    sys.exit()
+
+def run_pipelined(game, renderer) -> None:
+    """Render snapshots on this thread while a worker thread simulates"""
+    buffer = SnapshotBuffer()
+    simulation = SimulationThread(game, buffer)
+    simulation.start()
+    snapshot = buffer.latest()
+    timer = game.frame_timer
+    alloc_tracker = game.alloc_tracker
+    
+    while True:
+        frame_start = time.perf_counter()
+        timer.begin_frame()
+        alloc_tracker.begin_frame()
+        
+        # Events must be pumped on the main thread; the simulation applies them
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                simulation.stop()
+                quit_game(game)
+            if event.type == pygame.KEYDOWN and event.key in RENDER_KEYS:
+                game.handle_events(event)
+            else:
+                simulation.post(event)
+        if simulation.error is not None:
+            raise RuntimeError("simulation thread stopped") from simulation.error
+        timer.lap('events')
+        
+        # Wait for the next simulated frame; this paces rendering to the tick rate
+        wait_start = time.perf_counter()
+        snapshot = buffer.wait_newer(snapshot.tick, 1 / IDLE_FPS)
+        wait_ms = (time.perf_counter() - wait_start) * 1000
+        timer.lap('wait')
+        
+        renderer.draw(game, snapshot)
+        renderer.present()
+        timer.lap('flip')
+        timer.end_frame()
+        alloc_tracker.end_frame()
+        
+        if game.turbo == 1:
+            game.quality.observe((time.perf_counter() - frame_start) * 1000 - wait_ms)
 
 def main() -> None:
     """Main function to run the game"""
+    args = parse_args()
+    
+    # Fix the mixer's output format before init, so sounds are converted to it once at load
+    pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_STEREO, MIXER_BUFFER)
+    
     # Initialize pygame
     pygame.init()
     
@@ -20,8 +110,9 @@ def main() -> None:
     
     pygame.display.set_caption("Brick Breaker")
     
-    # Create the game window
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Create the game window with the chosen drawing backend
+    renderer = create_renderer(args.renderer, args.render_scale, args.sdl_scaled)
+    screen = renderer.screen
     clock = pygame.time.Clock()
     
     # Create a default font before importing game
@@ -31,32 +122,71 @@ def main() -> None:
     from game import Game
     
     # Create game instance
-    game = Game(screen)
+    game = Game(screen, args.render_scale, args.native_hud)
     game.font = default_font  # Ensure we have a valid font
     
+    timer = game.frame_timer
+    alloc_tracker = game.alloc_tracker
+    
+    # Profile the whole session if requested
+    game.profiler.output_format = args.profile_format
+    if args.profile:
+        game.profiler.start()
+    
+    game.turbo = max(1, args.turbo)
+    if args.chaos:
+        game.ball_collisions = True
+        game.multi_ball_count = CHAOS_MULTI_BALL_COUNT
+    
+    if args.endless is not None:
+        game.endless.enabled = True
+        game.endless.seed = args.endless
+        game.load_endless()
+    
+    if args.watch_levels:
+        game.watch_levels()
+    
+    # Unattended play skips the instructions screen
+    if args.autopilot:
+        game.autopilot.enabled = True
+        game.show_instructions = False
+    
+    if args.pipelined:
+        run_pipelined(game, renderer)
+    
     # Main game loop
     while True:
+        frame_start = time.perf_counter()
+        timer.begin_frame()
+        alloc_tracker.begin_frame()
+        
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game(game)
             
             # Pass events to game
             game.handle_events(event)
         
-        # Fill the screen with background color
-        screen.fill(BG_COLOR)
+        timer.lap('events')
         
-        # Update and render game
-        game.update()
-        game.render()
+        # Update (several times in turbo) and render the last state
+        game.advance()
+        renderer.draw(game)
         
         # Update the display
-        pygame.display.flip()
+        renderer.present()
+        timer.lap('flip')
+        timer.end_frame()
+        alloc_tracker.end_frame()
+        
+        # Feed the frame's work time (excluding the tick sleep) to the governor;
+        # turbo frames are long by design and would only degrade the effects
+        if game.turbo == 1:
+            game.quality.observe((time.perf_counter() - frame_start) * 1000)
         
-        # Cap the frame rate
-        clock.tick(FPS)
+        # Cap the frame rate, lower on frozen screens to save CPU
+        clock.tick(IDLE_FPS if game.idle_screen() else FPS)
 
 if __name__ == "__main__":
     main()
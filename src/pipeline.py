@@ -0,0 +1,183 @@
+"""
+Pipelined game loop: simulation on a worker thread, rendering from frame snapshots
+"""
+import copy
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+import pygame
+from frame_timer import FrameTimer
+from settings import *
+
+# Keys for the instruments the render thread owns; they're handled where they're drawn
+RENDER_KEYS = frozenset((pygame.K_F3, pygame.K_F4, pygame.K_F6))
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """Everything render() reads, captured at the end of one simulation step.
+
+    Field names match Game's attributes so render code can take either;
+    aim_preview_dots holds what Game.aim_dots() returned, traced against the
+    live brick grid.
+    """
+    tick: int
+    paddle: Any
+    balls: Tuple[Any, ...]
+    bricks: Tuple[Any, ...]
+    powerups: Tuple[Any, ...]
+    particles: Tuple[Any, ...]
+    score: int
+    lives: int
+    level: int
+    paused: bool
+    show_instructions: bool
+    game_over: bool
+    level_complete: bool
+    shake_amount: int
+    shake_time: int
+    turbo: int = 1
+    rows_cleared: Optional[int] = None
+    camera_offset: Tuple[int, int] = (0, 0)
+    aim_preview_dots: Tuple[Tuple[int, int], ...] = ()
+
+
+def _freeze_sprite(sprite: pygame.sprite.Sprite) -> pygame.sprite.Sprite:
+    """Return a detached copy of a moving sprite; copies never enter the game's stores or pools"""
+    clone = copy.copy(sprite)
+    clone.rect = sprite.rect.copy()
+    return clone
+
+
+def capture_snapshot(game, tick: int = 0) -> FrameSnapshot:
+    """Copy the drawable state of `game` so the simulation can keep mutating it"""
+    balls = []
+    for ball in game.balls:
+        clone = _freeze_sprite(ball)
+        clone.trail = list(ball.trail)
+        balls.append(clone)
+    return FrameSnapshot(
+        tick=tick,
+        paddle=_freeze_sprite(game.paddle),
+        balls=tuple(balls),
+        # Only bricks in view are drawn. They swap in a new image when redrawn,
+        # so they are shared unless endless rows move them
+        bricks=tuple(_freeze_sprite(brick) for brick in game.visible_bricks()) if game.endless.enabled
+        else tuple(game.visible_bricks()),
+        powerups=tuple(_freeze_sprite(powerup) for powerup in game.powerups),
+        particles=tuple(copy.copy(particle) for particle in game.particles),
+        score=game.score,
+        lives=game.lives,
+        level=game.level,
+        paused=game.paused,
+        show_instructions=game.show_instructions,
+        game_over=game.game_over,
+        level_complete=game.level_complete,
+        shake_amount=game.shake_amount,
+        shake_time=game.shake_time,
+        turbo=game.turbo,
+        rows_cleared=game.rows_cleared,
+        camera_offset=game.camera_offset,
+        aim_preview_dots=tuple(game.aim_dots()),
+    )
+
+
+class SnapshotBuffer:
+    """Hands the newest snapshot from the simulation thread to the render thread.
+
+    Snapshots are immutable, so the double buffer is a reference swap: the
+    renderer keeps drawing its front snapshot while the next one is built.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer"""
+        self._condition = threading.Condition()
+        self._latest: Optional[FrameSnapshot] = None
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """Make `snapshot` the newest frame and wake a waiting renderer"""
+        with self._condition:
+            self._latest = snapshot
+            self._condition.notify_all()
+
+    def latest(self) -> Optional[FrameSnapshot]:
+        """Return the newest snapshot without waiting"""
+        return self._latest
+
+    def wait_newer(self, tick: int, timeout: float) -> Optional[FrameSnapshot]:
+        """Wait up to `timeout` seconds for a snapshot newer than `tick`"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._latest is not None and self._latest.tick > tick,
+                                     timeout)
+            return self._latest
+
+
+class SimulationThread(threading.Thread):
+    """Runs Game.update() at a fixed rate and publishes a snapshot after each step.
+
+    The game's frame timer belongs to the render thread, so updates are timed
+    on the thread's own timer, switched on and off with it.
+    """
+
+    def __init__(self, game, buffer: SnapshotBuffer, tick_rate: int = FPS,
+                 idle_tick_rate: int = IDLE_FPS) -> None:
+        """Prepare to simulate `game`; call start() to begin"""
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.buffer = buffer
+        self.step_seconds = 1 / tick_rate
+        self.idle_step_seconds = 1 / idle_tick_rate
+        self.tick = 0
+        self.events: "queue.SimpleQueue[pygame.event.Event]" = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.timer = FrameTimer()
+        game.update_timer = self.timer
+        buffer.publish(capture_snapshot(game, self.tick))
+
+    def post(self, event: pygame.event.Event) -> None:
+        """Queue an input event for the simulation; events are pumped on the main thread"""
+        self.events.put(event)
+
+    def step(self) -> None:
+        """Handle queued events, advance the game one tick (turbo updates) and publish it"""
+        while True:
+            try:
+                self.game.handle_events(self.events.get_nowait())
+            except queue.Empty:
+                break
+        timer = self.timer
+        if timer.enabled != self.game.frame_timer.enabled:
+            timer.toggle()
+        timer.begin_frame()
+        self.game.advance()
+        timer.end_frame()
+        self.tick += 1
+        self.buffer.publish(capture_snapshot(self.game, self.tick))
+
+    def run(self) -> None:
+        """Step on a fixed schedule until stopped, independent of render speed"""
+        next_step = time.perf_counter()
+        try:
+            while not self._stop_event.is_set():
+                self.step()
+                # Frozen screens tick slower to save CPU
+                next_step += self.idle_step_seconds if self.game.idle_screen() else self.step_seconds
+                delay = next_step - time.perf_counter()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                elif delay < -self.step_seconds * 5:
+                    # Far behind (e.g. a long GC pause): drop the backlog instead of spiralling
+                    next_step = time.perf_counter()
+        except BaseException as e:
+            self.error = e
+            raise
+
+    def stop(self) -> None:
+        """Stop the thread and wait for the current step to finish"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        self.game.update_timer = self.game.frame_timer
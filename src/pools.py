@@ -0,0 +1,39 @@
+"""
+Object pools so balls, power-ups and particles are reused instead of rebuilt
+"""
+from typing import Callable, Generic, Iterable, List, TypeVar
+
+T = TypeVar('T')
+
+
+class Pool(Generic[T]):
+    """Free list of pre-built objects that are recycled through their reset() method.
+
+    Building a ball or power-up allocates and draws a Surface; taking one from
+    the pool only resets a few attributes. The pool grows when it runs dry and
+    keeps everything released to it, so steady play stops allocating.
+    """
+
+    def __init__(self, factory: Callable[[], T], size: int = 0) -> None:
+        """Pre-build `size` objects with `factory`"""
+        self.factory = factory
+        self.free: List[T] = [factory() for _ in range(size)]
+        self.created = size  # Objects built so far, for tuning the pre-built size
+
+    def acquire(self, *args, **kwargs) -> T:
+        """Take a free object (building one if none are left) and reset it with the arguments"""
+        if self.free:
+            item = self.free.pop()
+        else:
+            item = self.factory()
+            self.created += 1
+        item.reset(*args, **kwargs)
+        return item
+
+    def release(self, item: T) -> None:
+        """Return an object that is no longer in play"""
+        self.free.append(item)
+
+    def release_all(self, items: Iterable[T]) -> None:
+        """Return several objects at once"""
+        self.free.extend(items)
@@ -0,0 +1,130 @@
+"""
+In-process sampling profiler with collapsed-stack and speedscope output
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, Optional, Tuple
+from settings import *
+
+
+class SamplingProfiler:
+    """Samples the call stack of one thread from a background thread"""
+
+    def __init__(self, interval: float = PROFILER_INTERVAL, output_dir: str = PROFILE_DIR,
+                 output_format: str = "collapsed") -> None:
+        """Initialize a stopped profiler"""
+        self.interval = interval
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._labels: Dict[CodeType, str] = {}
+        self._target_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the profiler is currently sampling"""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start sampling the calling thread"""
+        if self.running:
+            return
+        self.stacks.clear()
+        self.samples = 0
+        self._target_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler",
+                                        daemon=True)
+        self._thread.start()
+        print("Profiler started")
+
+    def stop(self) -> Optional[str]:
+        """Stop sampling and write the profile; return the output path"""
+        if not self.running:
+            return None
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        if self.output_format == "speedscope":
+            path = os.path.join(self.output_dir, f"profile-{stamp}.speedscope.json")
+            self.write_speedscope(path)
+        else:
+            path = os.path.join(self.output_dir, f"profile-{stamp}.folded")
+            self.write_collapsed(path)
+        print(f"Profiler stopped: {self.samples} samples written to {path}")
+        return path
+
+    def toggle(self) -> None:
+        """Start the profiler if stopped, otherwise stop it and write output"""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def _sample_loop(self) -> None:
+        """Collect stacks until asked to stop"""
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            if frame is not None:
+                self.stacks[self._stack_of(frame)] += 1
+                self.samples += 1
+
+    def _stack_of(self, frame: FrameType) -> Tuple[str, ...]:
+        """Return the stack as labels ordered from the root to the leaf"""
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+    def _label(self, code: CodeType) -> str:
+        """Return a `module:Qualified.name` label for a code object"""
+        label = self._labels.get(code)
+        if label is None:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{module}:{name}"
+            self._labels[code] = label
+        return label
+
+    def write_collapsed(self, path: str) -> None:
+        """Write stacks in the collapsed format used by flamegraph.pl and speedscope"""
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def write_speedscope(self, path: str) -> None:
+        """Write stacks as a speedscope sampled profile"""
+        frame_index: Dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.stacks.items():
+            samples.append([frame_index.setdefault(label, len(frame_index)) for label in stack])
+            weights.append(count * self.interval * 1000)
+        data = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": label} for label in frame_index]},
+            "profiles": [{
+                "type": "sampled",
+                "name": "Brick Breaker",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
@@ -0,0 +1,86 @@
+"""
+Adaptive quality governor driven by the frame budget
+"""
+from typing import List
+from settings import *
+
+# Quality levels, best first; each level also keeps every degradation before it
+QUALITY_LEVELS = [
+    "full",
+    "fewer particles",
+    "short trails",
+    "no glow",
+    "thin starfield",
+    "no shadows",
+]
+
+
+class QualityGovernor:
+    """Steps effects down when frames run over budget and back up with headroom"""
+
+    def __init__(self, budget_ms: float = 1000 / FPS, enabled: bool = QUALITY_GOVERNOR_ENABLED) -> None:
+        """Initialize the governor at full quality"""
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.level = 0
+        self.estimate_ms = 0.0  # Rolling (exponential moving average) frame time
+        self._over_frames = 0
+        self._under_frames = 0
+
+    @property
+    def level_name(self) -> str:
+        """Human-readable name of the current level"""
+        return QUALITY_LEVELS[self.level]
+
+    def observe(self, frame_ms: float) -> None:
+        """Feed the work time of one frame and adjust the quality level"""
+        if not self.enabled:
+            return
+        self.estimate_ms += QUALITY_EMA_ALPHA * (frame_ms - self.estimate_ms)
+
+        # Hysteresis: separate thresholds and a sustained streak before acting
+        if self.estimate_ms > self.budget_ms * QUALITY_DEGRADE_RATIO:
+            self._over_frames += 1
+            self._under_frames = 0
+            if self._over_frames >= QUALITY_DEGRADE_FRAMES and self.level < len(QUALITY_LEVELS) - 1:
+                self.level += 1
+                self._over_frames = 0
+        elif self.estimate_ms < self.budget_ms * QUALITY_RESTORE_RATIO:
+            self._under_frames += 1
+            self._over_frames = 0
+            if self._under_frames >= QUALITY_RESTORE_FRAMES and self.level > 0:
+                self.level -= 1
+                self._under_frames = 0
+        else:
+            self._over_frames = 0
+            self._under_frames = 0
+
+    @property
+    def particle_scale(self) -> float:
+        """Multiplier applied to particle counts"""
+        return 1.0 if self.level < 1 else 0.4
+
+    @property
+    def trail_length(self) -> int:
+        """Number of trail positions kept per ball"""
+        return 5 if self.level < 2 else 2
+
+    @property
+    def glow(self) -> bool:
+        """Whether balls and power-ups draw their glow pass"""
+        return self.level < 3
+
+    @property
+    def star_stride(self) -> int:
+        """Draw every n-th star of the starfield"""
+        return 1 if self.level < 4 else 3
+
+    @property
+    def shadows(self) -> bool:
+        """Whether the paddle and bricks draw drop shadows"""
+        return self.level < 5
+
+    def overlay_lines(self) -> List[str]:
+        """Return text lines for the debug overlay"""
+        state = '' if self.enabled else ' (off)'
+        return [f"quality {self.level}: {self.level_name}{state}  est {self.estimate_ms:.2f} ms"]
@@ -0,0 +1,36 @@
+"""
+Helpers for rendering the scene at a lower internal resolution
+"""
+from typing import Tuple, Union
+import pygame
+from settings import *
+
+
+def internal_size(render_scale: float) -> Tuple[int, int]:
+    """Return the internal render size for a scale of the logical screen"""
+    return max(1, int(SCREEN_WIDTH * render_scale)), max(1, int(SCREEN_HEIGHT * render_scale))
+
+
+def scale_rect(rect: pygame.Rect, scale: float) -> pygame.Rect:
+    """Map a rect in logical coordinates onto the internal surface"""
+    if scale == 1:
+        return rect
+    return pygame.Rect(int(rect.x * scale), int(rect.y * scale),
+                       max(1, int(rect.width * scale)), max(1, int(rect.height * scale)))
+
+
+class ScaledTarget:
+    """Blit target taking logical coordinates and drawing onto a smaller surface"""
+
+    def __init__(self, surface: pygame.Surface, scale: float) -> None:
+        """Wrap `surface`, which is `scale` times the logical screen size"""
+        self.surface = surface
+        self.scale = scale
+
+    def blit(self, source: pygame.Surface, dest: Union[pygame.Rect, Tuple[int, int]]) -> None:
+        """Scale `source` down and blit it at the mapped position"""
+        width, height = source.get_size()
+        scaled = pygame.transform.scale(source, (max(1, int(width * self.scale)),
+                                                 max(1, int(height * self.scale))))
+        x, y = dest.topleft if isinstance(dest, pygame.Rect) else dest
+        self.surface.blit(scaled, (int(x * self.scale), int(y * self.scale)))
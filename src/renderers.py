@@ -0,0 +1,279 @@
+"""
+Pluggable renderer backends: software Surfaces or SDL2 textures
+"""
+import math
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+import pygame
+from settings import *
+from camera import visible_area
+from render_scale import internal_size
+from sprites import draw_rounded_rect
+from pipeline import FrameSnapshot
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame built without SDL2 video bindings
+    Renderer = Texture = Window = None
+
+BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+
+class SurfaceRenderer:
+    """Software backend: Game.render() blits onto the display Surface"""
+    name = "surface"
+
+    def __init__(self, display: pygame.Surface) -> None:
+        """Wrap an existing display surface"""
+        self.screen = display
+
+    @classmethod
+    def open(cls, render_scale: float = RENDER_SCALE, sdl_scaled: bool = False) -> 'SurfaceRenderer':
+        """Create the game window"""
+        if sdl_scaled and render_scale != 1:
+            # SDL stretches the small window surface to the window on present
+            display = pygame.display.set_mode(internal_size(render_scale), pygame.SCALED)
+        else:
+            display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        return cls(display)
+
+    def draw(self, game, snapshot: Optional[FrameSnapshot] = None) -> None:
+        """Draw one frame, from a frame snapshot if given"""
+        game.render(snapshot)
+
+    def present(self) -> None:
+        """Show the finished frame"""
+        pygame.display.flip()
+
+
+class _TextureBlitTarget:
+    """Stands in for a Surface so Game's HUD code can blit onto a TextureRenderer"""
+
+    def __init__(self, owner: 'TextureRenderer') -> None:
+        self.owner = owner
+
+    def get_size(self) -> Tuple[int, int]:
+        return SCREEN_WIDTH, SCREEN_HEIGHT
+
+    def blit(self, source: pygame.Surface, dest: Union[pygame.Rect, Tuple[int, int]]) -> None:
+        if not source.get_width() or not source.get_height():
+            return  # e.g. a rendered empty string; SDL can't make a 0-sized texture
+        x, y = dest.topleft if isinstance(dest, pygame.Rect) else dest
+        texture = self.owner.upload(source)
+        texture.draw(dstrect=(int(x), int(y), source.get_width(), source.get_height()))
+
+
+class TextureRenderer:
+    """SDL2 backend: images are uploaded once as textures and drawn with
+    per-draw alpha and rotation instead of per-frame alpha surfaces"""
+    name = "sdl2"
+
+    def __init__(self, window: 'Window', accelerated: int = -1) -> None:
+        """Create a rendering context for `window`; accelerated=0 forces SDL's software renderer"""
+        if Renderer is None:
+            raise pygame.error("pygame._sdl2.video is not available")
+        self.window = window
+        self.renderer = Renderer(window, accelerated=accelerated)
+        self.renderer.draw_blend_mode = BLENDMODE_BLEND
+        # Game still needs a Surface for its own (unused) software targets
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._textures: Dict[Hashable, 'Texture'] = {}
+        # Surfaces uploaded this frame and last, so repeated blits of one Surface are reused
+        self._uploads: Dict[int, Tuple[pygame.Surface, 'Texture']] = {}
+        self._uploads_used: Dict[int, Tuple[pygame.Surface, 'Texture']] = {}
+        self._ui_target = _TextureBlitTarget(self)
+        self._debug_surface: Optional[pygame.Surface] = None
+
+    @classmethod
+    def open(cls, title: str = "Brick Breaker", accelerated: int = -1,
+             hidden: bool = False) -> 'TextureRenderer':
+        """Create a window and a renderer for it"""
+        if Window is None:
+            raise pygame.error("pygame._sdl2.video is not available")
+        window = Window(title, size=(SCREEN_WIDTH, SCREEN_HEIGHT), hidden=hidden)
+        return cls(window, accelerated)
+
+    def texture(self, key: Hashable, factory: Callable[[], pygame.Surface]) -> 'Texture':
+        """Return the cached texture for `key`, uploading factory()'s Surface on first use"""
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, factory())
+            texture.blend_mode = BLENDMODE_BLEND
+            self._textures[key] = texture
+        return texture
+
+    def upload(self, surface: pygame.Surface) -> 'Texture':
+        """Upload a transient Surface, reusing the texture if it was seen last frame"""
+        entry = self._uploads.get(id(surface)) or self._uploads_used.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            entry = (surface, Texture.from_surface(self.renderer, surface))
+            entry[1].blend_mode = BLENDMODE_BLEND
+        self._uploads_used[id(surface)] = entry
+        return entry[1]
+
+    def draw(self, game, snapshot: Optional[FrameSnapshot] = None) -> None:
+        """Draw one frame of `game`, from a frame snapshot if given"""
+        view = game if snapshot is None else snapshot
+        timer = game.frame_timer
+        timer.lap('update')
+        renderer = self.renderer
+        renderer.draw_color = (*BG_COLOR, 255)
+        renderer.clear()
+        dx, dy = game._shake_offset(snapshot)
+
+        self._draw_starfield(game, dx, dy)
+        for key, image, x, y in game.background.sprites(
+                view.paddle.rect.centerx + view.camera_offset[0] - SCREEN_WIDTH // 2, 0):
+            self.texture(key, lambda: image).draw(
+                dstrect=(int(x) + dx, int(y) + dy, image.get_width(), image.get_height()))
+        timer.lap('background')
+
+        # World objects are drawn shifted by the camera as well as the shake
+        dx += view.camera_offset[0]
+        dy += view.camera_offset[1]
+        shadows = game.quality.shadows
+        glow = game.quality.glow
+        paddle = view.paddle
+        if shadows:
+            renderer.draw_color = (0, 0, 0, 100)
+            renderer.fill_rect(paddle.rect.move(dx + 5, dy + 5))
+        self.texture(('paddle', paddle.width), lambda: self._paddle_surface(paddle.width)).draw(
+            dstrect=paddle.rect.move(dx, dy))
+        timer.lap('paddle_draw')
+
+        for ball in view.balls:
+            self._draw_ball(ball, glow, dx, dy)
+        renderer.draw_color = (*AIM_DOT_COLOR, 255)
+        for x, y in game.aim_dots() if snapshot is None else snapshot.aim_preview_dots:
+            renderer.fill_rect((x - 2 + dx, y - 2 + dy, 4, 4))
+        timer.lap('balls')
+
+        for brick in game.visible_bricks() if snapshot is None else view.bricks:
+            if shadows:
+                renderer.draw_color = (0, 0, 0, 50)
+                renderer.fill_rect(brick.rect.move(dx + 3, dy + 3))
+            # Every brick of a type looks the same, intact or damaged
+            damaged = brick.hits_left != brick.brick_type.hits
+            key = ('brick', brick.brick_type.id, damaged)
+            self.texture(key, lambda: brick.image).draw(dstrect=brick.rect.move(dx, dy))
+        timer.lap('bricks')
+
+        for powerup in view.powerups:
+            self._draw_powerup(powerup, glow, dx, dy)
+        timer.lap('powerup_draw')
+
+        visible = visible_area(view.camera_offset)
+        for particle in view.particles:
+            if not visible.collidepoint(particle.x, particle.y):
+                continue
+            alpha = max(0, min(255, int(255 * (particle.lifetime / 40))))
+            size = particle.size
+            renderer.draw_color = (*particle.color, alpha)
+            renderer.fill_rect((int(particle.x) - size // 2 + dx, int(particle.y) - size // 2 + dy,
+                                size, size))
+        timer.lap('particle_draw')
+
+        # Reuse Game's HUD and state-screen code through a blit target (unshaken, like the native HUD)
+        ui_screen, ui_surface = game.ui_screen, game.ui_surface
+        game.ui_screen = game.ui_surface = self._ui_target
+        try:
+            game._draw_ui(snapshot)
+        finally:
+            game.ui_screen, game.ui_surface = ui_screen, ui_surface
+        self._uploads, self._uploads_used = self._uploads_used, {}
+
+        self._draw_debug_overlay(game)
+        timer.lap('debug_overlay')
+
+    def present(self) -> None:
+        """Show the finished frame"""
+        self.renderer.present()
+
+    def _draw_starfield(self, game, dx: int, dy: int) -> None:
+        """Draw the twinkling starfield with one tinted texture per star size"""
+        now = time.time()
+        stars = game.background_stars[::game.quality.star_stride]
+        for x, y, size, brightness in stars:
+            texture = self.texture(('star', size), lambda: self._circle_surface(size, (255, 255, 255, 255)))
+            level = int(255 * brightness * (0.8 + 0.2 * math.sin(now * 2 + x * y)))
+            texture.color = (level, level, level)
+            texture.draw(dstrect=(x - size + dx, y - size + dy, size * 2, size * 2))
+
+    def _draw_ball(self, ball, glow: bool, dx: int, dy: int) -> None:
+        """Draw a ball, its glow and its trail from two cached textures"""
+        radius = ball.radius
+        texture = self.texture(('ball', radius), lambda: self._circle_surface(radius, (255, 255, 255, 255)))
+        for i, (x, y) in enumerate(ball.trail):
+            size = int(radius * (i + 1) / (ball.trail_length + 1))
+            texture.alpha = int(255 * (i + 1) / (ball.trail_length + 1))
+            texture.draw(dstrect=(x - size + dx, y - size + dy, size * 2, size * 2))
+        texture.alpha = 255
+
+        if glow:
+            glow_radius = int(radius * 1.5)
+            glow_texture = self.texture(('ball_glow', radius),
+                                        lambda: self._circle_surface(glow_radius, (255, 255, 255, 100)))
+            glow_texture.draw(dstrect=(ball.rect.centerx - glow_radius + dx, ball.rect.centery - glow_radius + dy,
+                                       glow_radius * 2, glow_radius * 2))
+        texture.draw(dstrect=(ball.rect.centerx - radius + dx, ball.rect.centery - radius + dy,
+                              radius * 2, radius * 2))
+
+    def _draw_powerup(self, powerup, glow: bool, dx: int, dy: int) -> None:
+        """Draw a power-up rotated on the GPU instead of with transform.rotate"""
+        size = powerup.size
+        centerx, centery = powerup.rect.centerx + dx, powerup.rect.centery + dy
+        if glow:
+            glow_texture = self.texture(('powerup_glow', powerup.type), lambda: self._powerup_glow_surface(powerup))
+            glow_radius = glow_texture.width // 2
+            glow_texture.draw(dstrect=(centerx - glow_radius, centery - glow_radius,
+                                       glow_texture.width, glow_texture.height))
+        # SDL rotates clockwise, pygame.transform.rotate counter-clockwise
+        self.texture(('powerup', powerup.type), lambda: powerup.image).draw(
+            dstrect=(centerx - size // 2, centery - size // 2, size, size), angle=-powerup.angle)
+
+    def _draw_debug_overlay(self, game) -> None:
+        """Draw the frame timer overlay through a reused Surface"""
+        if not game.frame_timer.enabled:
+            return
+        if self._debug_surface is None:
+            self._debug_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._debug_surface.fill((0, 0, 0, 0))
+        game.frame_timer.draw_overlay(self._debug_surface)
+        texture = Texture.from_surface(self.renderer, self._debug_surface)
+        texture.blend_mode = BLENDMODE_BLEND
+        texture.draw(dstrect=(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @staticmethod
+    def _circle_surface(radius: int, color: Tuple[int, int, int, int]) -> pygame.Surface:
+        """Build a filled circle image"""
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        return surface
+
+    @staticmethod
+    def _paddle_surface(width: int) -> pygame.Surface:
+        """Build the rounded paddle image"""
+        surface = pygame.Surface((width, PADDLE_HEIGHT), pygame.SRCALPHA)
+        draw_rounded_rect(surface, surface.get_rect(), WHITE, 5)
+        return surface
+
+    @staticmethod
+    def _powerup_glow_surface(powerup) -> pygame.Surface:
+        """Build the translucent glow drawn behind a power-up"""
+        size = powerup.size
+        glow_radius = int(size * 1.5)
+        surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (*powerup.color, 100),
+                         (glow_radius - size // 2, glow_radius - size // 2, size, size), 0, 8)
+        return surface
+
+
+def create_renderer(name: str = RENDERER, render_scale: float = RENDER_SCALE,
+                    sdl_scaled: bool = False):
+    """Open a window with the named backend, falling back to Surfaces if SDL2 textures fail"""
+    if name in ("sdl2", "sdl2-software"):
+        try:
+            return TextureRenderer.open(accelerated=0 if name == "sdl2-software" else -1)
+        except pygame.error as e:
+            print(f"Warning: SDL2 renderer unavailable ({e}); using Surface renderer.")
+    return SurfaceRenderer.open(render_scale, sdl_scaled)
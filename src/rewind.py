@@ -0,0 +1,239 @@
+"""
+Rewind buffer built on packed game state snapshots
+"""
+from array import array
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from settings import *
+
+# Header layout: score, lives, level, level_complete, game_over,
+# original ball index, ball count, brick count, power-up count,
+# paddle x, paddle width, is_wide, is_sticky, wide/sticky time left
+HEADER_SIZE = 15
+# Fixed ball fields: x, y, dx, dy, speed, is_active, is_stuck,
+# stick_offset, is_slow, slow time left, trail length
+BALL_FIELDS = 11
+# Power-up fields: type index, centerx, centery, angle
+POWERUP_FIELDS = 4
+POWERUP_IDS = list(POWERUPS.keys())
+
+Delta = Tuple[array, array]
+
+
+def capture_state(game) -> array:
+    """Pack the rewindable game state into a flat array of doubles"""
+    timers = game.timers
+    paddle = game.paddle
+    balls = game.balls.sprites()
+    powerups = game.powerups.sprites()
+    original = balls.index(game.original_ball) if game.original_ball in balls else -1
+
+    state = array('d', (
+        game.score, game.lives, game.level, game.level_complete, game.game_over,
+        original, len(balls), len(game.level_bricks), len(powerups),
+        paddle.rect.x, paddle.width, paddle.is_wide, paddle.is_sticky,
+        timers.remaining((paddle, "WIDE")), timers.remaining((paddle, "STICKY")),
+    ))
+
+    for ball in balls:
+        state.extend((
+            ball.rect.x, ball.rect.y, ball.dx, ball.dy, ball.speed,
+            ball.is_active, ball.is_stuck, ball.stick_offset,
+            ball.is_slow, timers.remaining((ball, "SLOW")), len(ball.trail),
+        ))
+        for x, y in ball.trail:
+            state.append(x)
+            state.append(y)
+
+    # Endless rows are placed from the scroll position alone
+    if game.endless.enabled:
+        state.extend((game.endless.scroll, game.endless.rows_cleared))
+
+    bricks = game.bricks
+    state.extend(brick.hits_left if bricks.has(brick) else 0 for brick in game.level_bricks)
+
+    for powerup in powerups:
+        state.extend((POWERUP_IDS.index(powerup.type), powerup.rect.centerx,
+                      powerup.rect.centery, powerup.angle))
+    return state
+
+
+def restore_state(game, state: array) -> None:
+    """Apply a packed state array back onto the live game objects"""
+    (score, lives, level, level_complete, game_over, original, ball_count,
+     brick_count, powerup_count, paddle_x, paddle_width, is_wide, is_sticky,
+     wide_left, sticky_left) = state[:HEADER_SIZE]
+
+    game.score = int(score)
+    game.lives = int(lives)
+    game.level = int(level)
+    game.level_complete = bool(level_complete)
+    game.game_over = bool(game_over)
+
+    # Paddle
+    paddle = game.paddle
+    if paddle.width != int(paddle_width):
+        paddle.width = int(paddle_width)
+        paddle._resize_paddle()
+    paddle.rect.x = int(paddle_x)
+    paddle.is_wide = bool(is_wide)
+    paddle.is_sticky = bool(is_sticky)
+    _restore_timer(game, paddle, "WIDE", paddle.is_wide, wide_left)
+    _restore_timer(game, paddle, "STICKY", paddle.is_sticky, sticky_left)
+
+    # Balls, reusing existing sprites where possible
+    balls = game.balls.sprites()
+    while len(balls) < ball_count:
+        ball = game.ball_pool.acquire()
+        game.balls.add(ball)
+        balls.append(ball)
+    for ball in balls[int(ball_count):]:
+        game.balls.remove(ball)
+        game.ball_pool.release(ball)
+
+    offset = HEADER_SIZE
+    for ball in balls[:int(ball_count)]:
+        (x, y, dx, dy, speed, is_active, is_stuck, stick_offset,
+         is_slow, slow_left, trail_len) = state[offset:offset + BALL_FIELDS]
+        offset += BALL_FIELDS
+        ball.rect.x = int(x)
+        ball.rect.y = int(y)
+        ball.dx = dx
+        ball.dy = dy
+        ball.speed = speed
+        ball.is_active = bool(is_active)
+        ball.is_stuck = bool(is_stuck)
+        ball.stick_offset = int(stick_offset)
+        ball.is_slow = bool(is_slow)
+        _restore_timer(game, ball, "SLOW", ball.is_slow, slow_left)
+        trail_end = offset + int(trail_len) * 2
+        coords = state[offset:trail_end]
+        ball.trail = [(int(coords[i]), int(coords[i + 1])) for i in range(0, len(coords), 2)]
+        offset = trail_end
+    game.original_ball = balls[int(original)] if original >= 0 else None
+
+    # Bricks, after moving the endless rows back into place
+    if game.endless.enabled:
+        scroll, rows_cleared = state[offset:offset + 2]
+        offset += 2
+        game.endless.restore(game.bricks, game.brick_grid, scroll, int(rows_cleared))
+    for brick, hits_left in zip(game.level_bricks, state[offset:offset + int(brick_count)]):
+        hits_left = int(hits_left)
+        if hits_left == 0:
+            game.bricks.remove(brick)
+            game.brick_grid.remove(brick)
+        else:
+            brick.set_hits_left(hits_left)
+            game.bricks.add(brick)
+            game.brick_grid.add(brick)
+    offset += int(brick_count)
+    if game.endless.enabled:
+        game.endless.recount(game.bricks)
+
+    # Power-ups, recreated only when the type no longer matches
+    powerups = game.powerups.sprites()
+    for i in range(int(powerup_count)):
+        type_index, centerx, centery, angle = state[offset:offset + POWERUP_FIELDS]
+        offset += POWERUP_FIELDS
+        powerup_type = POWERUP_IDS[int(type_index)]
+        if i < len(powerups) and powerups[i].type == powerup_type:
+            powerup = powerups[i]
+        else:
+            if i < len(powerups):
+                game.powerups.remove(powerups[i])
+                game.powerup_pool.release(powerups[i])
+            powerup = game.powerup_pool.acquire(int(centerx), int(centery), powerup_type)
+            game.powerups.add(powerup)
+        powerup.rect.center = (int(centerx), int(centery))
+        powerup.angle = angle
+    for powerup in powerups[int(powerup_count):]:
+        game.powerups.remove(powerup)
+        game.powerup_pool.release(powerup)
+
+
+def _restore_timer(game, target, powerup_type: str, active: bool, time_left: float) -> None:
+    """Restart a power-up's timer with the time it had left, or drop it if the power-up was off"""
+    if active:
+        game.time_powerup(target, powerup_type, time_left)
+    else:
+        game.timers.cancel((target, powerup_type))
+
+
+def encode_delta(previous: array, current: array) -> Optional[Delta]:
+    """Encode the changed slots of current against previous, or None if the layouts differ"""
+    if len(previous) != len(current):
+        return None
+    indices = array('I', [i for i, (old, new) in enumerate(zip(previous, current)) if old != new])
+    values = array('d', [current[i] for i in indices])
+    return indices, values
+
+
+def apply_delta(state: array, delta: Delta) -> None:
+    """Apply a delta in place"""
+    indices, values = delta
+    for i, value in zip(indices, values):
+        state[i] = value
+
+
+class RewindBuffer:
+    """Ring buffer of recent game states stored as keyframes plus deltas"""
+
+    def __init__(self, seconds: float = REWIND_SECONDS, fps: int = FPS,
+                 keyframe_interval: int = REWIND_KEYFRAME_INTERVAL) -> None:
+        """Initialize an empty buffer holding roughly `seconds` of frames"""
+        self.capacity = int(seconds * fps)
+        self.keyframe_interval = keyframe_interval
+        # Each segment is a keyframe followed by the deltas recorded after it
+        self._segments: Deque[Tuple[array, List[Delta]]] = deque()
+        self._latest: Optional[array] = None
+        self._frames = 0
+
+    def __len__(self) -> int:
+        """Number of frames currently held"""
+        return self._frames
+
+    def clear(self) -> None:
+        """Drop every stored frame"""
+        self._segments.clear()
+        self._latest = None
+        self._frames = 0
+
+    def record(self, game) -> None:
+        """Capture the current game state as the newest frame"""
+        state = capture_state(game)
+        delta = None
+        if self._latest is not None and len(self._segments[-1][1]) < self.keyframe_interval - 1:
+            delta = encode_delta(self._latest, state)
+
+        if delta is None:
+            self._segments.append((state, []))
+        else:
+            self._segments[-1][1].append(delta)
+        self._latest = state
+        self._frames += 1
+
+        # Evict whole segments once the oldest is no longer needed
+        while self._frames - (len(self._segments[0][1]) + 1) >= self.capacity:
+            dropped = self._segments.popleft()
+            self._frames -= len(dropped[1]) + 1
+
+    def step_back(self, game) -> bool:
+        """Restore the frame before the newest one; return False when empty"""
+        if self._frames <= 1:
+            return False
+
+        keyframe, deltas = self._segments[-1]
+        if deltas:
+            deltas.pop()
+        else:
+            self._segments.pop()
+            keyframe, deltas = self._segments[-1]
+        self._frames -= 1
+
+        # Rebuild the new newest frame from its segment's keyframe
+        state = array('d', keyframe)
+        for delta in deltas:
+            apply_delta(state, delta)
+        self._latest = state
+        restore_state(game, state)
+        return True
@@ -0,0 +1,73 @@
+"""
+Simulation clock with a heap of timed callbacks, used for power-up durations
+"""
+import heapq
+from itertools import count
+from typing import Callable, Dict, Hashable, List, Tuple
+from settings import *
+
+Timer = Tuple[float, int, Callable, tuple]  # Deadline, serial, callback, arguments
+
+
+class Scheduler:
+    """Runs callbacks when the simulation clock reaches their deadlines.
+
+    The clock only moves when advance() is called, once per simulated step,
+    so timers stop while the game is paused or rewinding and keep pace with
+    turbo: a duration always spans the same number of steps. Timers are
+    keyed, and scheduling a key again replaces its timer, which is how a
+    repeated power-up restarts its duration. Replaced and cancelled timers
+    are left in the heap and skipped when they come up.
+    """
+
+    def __init__(self, step_ms: float = 1000 / FPS) -> None:
+        """Initialize a clock at zero with no timers"""
+        self.step_ms = step_ms
+        self.now = 0.0  # Simulated milliseconds
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._timers: Dict[Hashable, Timer] = {}
+        self._serial = count()
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable, *args) -> None:
+        """Call callback(*args) `delay` simulated ms from now, replacing any timer under `key`"""
+        serial = next(self._serial)
+        deadline = self.now + delay
+        self._timers[key] = (deadline, serial, callback, args)
+        heapq.heappush(self._heap, (deadline, serial, key))
+        # Drop the skipped entries once they outnumber the live ones
+        if len(self._heap) > 2 * len(self._timers) + 32:
+            self._heap = [(timer[0], timer[1], key) for key, timer in self._timers.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key: Hashable) -> None:
+        """Forget the timer under `key`, if any"""
+        self._timers.pop(key, None)
+
+    def remaining(self, key: Hashable) -> float:
+        """Return the simulated ms left on the timer under `key` (0 if there is none)"""
+        timer = self._timers.get(key)
+        return 0.0 if timer is None else max(0.0, timer[0] - self.now)
+
+    def advance(self, ms: float = None) -> int:
+        """Move the clock on by one step (or `ms`) and run the timers now due; returns how many ran"""
+        self.now += self.step_ms if ms is None else ms
+        heap = self._heap
+        ran = 0
+        while heap and heap[0][0] <= self.now:
+            _, serial, key = heapq.heappop(heap)
+            timer = self._timers.get(key)
+            if timer is None or timer[1] != serial:
+                continue  # Replaced or cancelled
+            del self._timers[key]
+            timer[2](*timer[3])
+            ran += 1
+        return ran
+
+    def clear(self) -> None:
+        """Forget every timer"""
+        self._heap.clear()
+        self._timers.clear()
+
+    def __len__(self) -> int:
+        """Return the number of pending timers"""
+        return len(self._timers)
@@ -9,6 +9,11 @@ import pygame
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+IDLE_FPS = 20  # Tick rate while paused, on the instructions or on the game over screen
+RENDER_SCALE = 1.0  # Internal render resolution as a fraction of the screen size
+NATIVE_HUD = True  # Draw HUD text at full resolution when RENDER_SCALE < 1
+RENDERER = "surface"  # "surface", "sdl2" (GPU textures) or "sdl2-software"
+PIPELINED = False  # Simulate on a worker thread and render frame snapshots
 
 # Colors (R, G, B)
 BLACK = (0, 0, 0)
@@ -59,13 +64,21 @@ INITIAL_LIVES = 3
 # Power-up settings
 POWERUP_SIZE = 30
 POWERUP_SPEED = 3
-POWERUP_DURATION = {
+POWERUP_DURATION = {  # Milliseconds on the simulation clock, which stops while paused
     "WIDE": 20000,  # 20 seconds
     "STICKY": 15000,  # 15 seconds
     "SLOW": 10000,  # 10 seconds
 }
 POWERUP_DROP_CHANCE = 0.2  # 20% chance
 
+# Audio mixer settings
+MIXER_FREQUENCY = 44100  # Output format every sound is converted to when it's decoded
+MIXER_SIZE = -16
+MIXER_STEREO = 2
+MIXER_BUFFER = 512
+SOUND_CHANNEL_POOLS = {"impact": 4, "event": 2}  # Channels reserved for each sound category
+SOUND_PREDECODE = True  # Decode every sound at startup instead of on its first play
+
 # Background settings
 STAR_COUNT = 150
 METEOR_COUNT = 5
@@ -74,6 +87,87 @@ METEOR_SPEED_MAX = 5
 NEBULA_COUNT = 3
 NEBULA_DRIFT_SPEED = 0.2
 STAR_TWINKLE_SPEED = 2
+METEOR_TRAIL_LENGTH = 10  # Trail positions baked into each meteor streak
+NEBULA_PARALLAX = 0.03  # Layer shift per pixel of paddle offset from the centre
+METEOR_PARALLAX = 0.08
+
+# Aim preview settings
+AIM_PREVIEW = False  # Show the launch path of a waiting ball (toggle with A)
+AIM_PREVIEW_BOUNCES = 3
+AIM_DOT_SPACING = 14
+AIM_DOT_COLOR = (255, 255, 255)
+
+# Autopilot settings
+AUTOPILOT = False  # Let the paddle play itself (toggle with O)
+AUTOPILOT_AIM = True  # Angle returns towards breakable bricks
+AUTOPILOT_BOUNCES = 8  # Reflections traced when predicting a landing
+AUTOPILOT_AIM_BOUNCES = 2  # Wall reflections followed when looking for a brick to aim at
+AUTOPILOT_AIM_OFFSETS = (0.0, -0.2, 0.2, -0.4, 0.4, -0.6, 0.6)  # Paddle hit offsets tried in order
+
+# Ball collision settings
+BALL_COLLISIONS = False  # Balls bounce off each other (toggle with C)
+MULTI_BALL_COUNT = 2  # Balls added by the MULTI power-up
+CHAOS_MULTI_BALL_COUNT = 100  # ...in chaos mode (--chaos), which also turns on ball collisions
+CROWD_BALL_COUNT = 200  # With more balls than this in play...
+CROWD_TRAIL_LENGTH = 2  # ...trails are kept this short, whatever the quality level
+BALL_BLIT_BATCH = 256  # Ball and trail images drawn per Surface.blits() call
+
+# Object pool sizes, built up front; pools grow past them when needed
+BALL_POOL_SIZE = 16
+POWERUP_POOL_SIZE = 8
+PARTICLE_POOL_SIZE = 512
+
+# Effect queue settings
+EFFECT_PARTICLE_BUDGET = 300  # Most particles spawned per step; busier steps thin every burst
+
+# Camera settings, for levels larger than the screen
+WORLD_MARGIN = 40  # Space between a wide level's outer bricks and the side walls
+WORLD_CLEARANCE = 400  # Space below a tall level's lowest bricks, for the paddle
+CAMERA_EASE = 0.12  # Fraction of the way to its target the camera moves each frame
+CULL_MARGIN = 64  # Pixels beyond the viewport where bricks and particles are still drawn and kept
+
+# Endless mode settings
+ENDLESS = False  # Stream procedural brick rows instead of loading levels (toggle with E)
+ENDLESS_SEED = 0  # Seed for the generated rows; the same seed gives the same rows
+ENDLESS_ROWS = 13  # Row slots in the field, recycled as rows scroll off
+ENDLESS_SCROLL_SPEED = 0.25  # Pixels per frame the rows move down
+ENDLESS_FLOOR_Y = 400  # A row is recycled to the top once it scrolls below this line
+ENDLESS_FILL = 0.7  # Chance of a brick in each cell of a generated row
+ENDLESS_UNBREAKABLE_CHANCE = 0.04  # Chance a generated brick is unbreakable
+ENDLESS_ROWS_PER_TIER = 6  # Rows between each step up in the toughest brick type
+ENDLESS_ROW_BONUS = 100  # Points for breaking the last breakable brick of a row
+
+# Level hot-reload settings
+LEVEL_WATCH = False  # Reload level files when they are edited (--watch-levels)
+LEVEL_WATCH_INTERVAL = 0.5  # Seconds between checks of the level files' modification times
+
+# Turbo settings
+TURBO = 1  # Updates per displayed frame
+TURBO_LEVELS = (1, 10, 100)  # Speeds cycled with T
+
+# Rewind settings
+REWIND_SECONDS = 5  # How much history the rewind buffer keeps
+REWIND_KEYFRAME_INTERVAL = 30  # Frames per full snapshot; the rest are deltas
+
+# Debug instrumentation settings
+FRAME_TIMER_HISTORY = 240  # Frames of samples kept for rolling percentiles
+FRAME_TIMER_REFRESH = 15  # Frames between overlay text refreshes
+FRAME_TIMER_GRAPH_HEIGHT = 60
+FRAME_TIMES_FILE = "frame_times.json"
+PROFILER_INTERVAL = 0.001  # Seconds between stack samples
+PROFILE_DIR = "profiles"
+
+# Garbage-collector policy
+GC_POLICY_ENABLED = True  # Defer collections during play, collect on idle screens
+GC_YOUNG_LIMIT = 20000  # Young-generation allocations allowed before a quick gen-0 pass
+
+# Adaptive quality governor
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_EMA_ALPHA = 0.1  # Weight of the newest frame in the rolling estimate
+QUALITY_DEGRADE_RATIO = 0.9  # Degrade when the estimate exceeds this share of the budget...
+QUALITY_DEGRADE_FRAMES = 30  # ...for this many frames in a row
+QUALITY_RESTORE_RATIO = 0.5  # Restore when below this share of the budget...
+QUALITY_RESTORE_FRAMES = 180  # ...for this many frames in a row
 
 @dataclass
 class PowerUpType:
@@ -122,6 +216,23 @@ SOUNDS = {
     "level_complete": "level_complete.wav",
 }
 
+@dataclass
+class SoundMix:
+    """How the mixer plays a sound"""
+    category: str  # Channel pool the sound plays on
+    priority: int  # A full pool cuts off its oldest voice of lower or equal priority
+    min_interval: int  # Milliseconds before the same sound may start again
+
+# Mixing rules per sound: frequent impacts share a small pool and are rate
+# limited, so multiball can't crowd out the rarer event sounds
+SOUND_MIX = {
+    "bounce": SoundMix("impact", 0, 50),
+    "brick_break": SoundMix("impact", 1, 30),
+    "powerup": SoundMix("event", 2, 0),
+    "game_over": SoundMix("event", 3, 0),
+    "level_complete": SoundMix("event", 3, 0),
+}
+
 # Level file paths
 LEVEL_FILES = [
     "levels/level1.json",
@@ -1,12 +1,85 @@
 """
-Game sprites (Paddle, Ball, Brick, PowerUp)
+Game sprites (Paddle, Ball, Brick, PowerUp) and particles
 """
 import pygame
 import random
 import math
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from settings import *
+from render_scale import scale_rect
+
+# Brick faces, as bit flags for Brick.exposed_faces
+FACE_LEFT = 1
+FACE_RIGHT = 2
+FACE_TOP = 4
+FACE_BOTTOM = 8
+ALL_FACES = FACE_LEFT | FACE_RIGHT | FACE_TOP | FACE_BOTTOM
+
+# Translucent white discs for ball glows and trails, keyed by (radius, alpha)
+_discs: Dict[Tuple[float, int], pygame.Surface] = {}
+
+def _disc(radius: float, alpha: int) -> pygame.Surface:
+    """Return a shared translucent white disc, drawing it the first time it's asked for"""
+    disc = _discs.get((radius, alpha))
+    if disc is None:
+        disc = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (255, 255, 255, alpha), (radius, radius), radius)
+        _discs[(radius, alpha)] = disc
+    return disc
+
+# Trail discs with their radii, oldest first, keyed by (ball radius, trail length)
+_trails: Dict[Tuple[float, int], List[Tuple[pygame.Surface, int]]] = {}
+
+def _trail_discs(radius: float, length: int) -> List[Tuple[pygame.Surface, int]]:
+    """Return the disc and radius drawn at each trail position, fading and shrinking with age"""
+    discs = _trails.get((radius, length))
+    if discs is None:
+        discs = []
+        for i in range(length):
+            size = int(radius * (i + 1) / (length + 1))
+            discs.append((_disc(size, int(255 * (i + 1) / (length + 1))), size))
+        _trails[(radius, length)] = discs
+    return discs
+
+# Ball images (the glow disc under a white core), keyed by (radius, glow)
+_ball_images: Dict[Tuple[float, bool], Tuple[pygame.Surface, float]] = {}
+
+def _ball_image(radius: float, glow: bool) -> Tuple[pygame.Surface, float]:
+    """Return the shared image of a ball and the distance from its corner to the ball's centre"""
+    entry = _ball_images.get((radius, glow))
+    if entry is None:
+        half = radius * 1.5 if glow else radius
+        image = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        if glow:
+            image.blit(_disc(half, 100), (0, 0))
+        pygame.draw.circle(image, WHITE, (half, half), radius)
+        entry = _ball_images[(radius, glow)] = (image, half)
+    return entry
+
+def draw_balls(surface: pygame.Surface, balls: Iterable['Ball'], glow: bool = True, scale: float = 1,
+               offset: Tuple[int, int] = (0, 0)) -> None:
+    """Draw balls and their trails in batched blits, shifted by the camera `offset`"""
+    ox, oy = offset
+    looks = {}  # (radius, trail length) -> (trail discs, image, half size), looked up once per call
+    batch = []
+    for ball in balls:
+        look = looks.get((ball.radius, ball.trail_length))
+        if look is None:
+            radius = ball.radius * scale
+            look = looks[(ball.radius, ball.trail_length)] = (_trail_discs(radius, ball.trail_length),
+                                                              *_ball_image(radius, glow))
+        trail_discs, image, half = look
+        if ball.trail:
+            batch.extend([(disc, ((x + ox) * scale - size, (y + oy) * scale - size))
+                          for (x, y), (disc, size) in zip(ball.trail, trail_discs)])
+        x, y = ball.rect.center
+        batch.append((image, ((x + ox) * scale - half, (y + oy) * scale - half)))
+        # Flushed in chunks so a crowd doesn't hold thousands of blit entries at once
+        if len(batch) >= BALL_BLIT_BATCH:
+            surface.blits(batch, False)
+            batch.clear()
+    surface.blits(batch, False)
 
 def draw_rounded_rect(surface: pygame.Surface, rect: pygame.Rect, color: Tuple[int, int, int], 
                      corner_radius: int) -> None:
@@ -45,66 +118,68 @@ class Paddle(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = SCREEN_WIDTH // 2
         self.rect.bottom = SCREEN_HEIGHT - 20
+        self.world = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)  # Playfield the paddle rides along
         self.speed = PADDLE_SPEED
         self.velocity = 0
         
-        # Power-up states
+        # Power-up states; the game's scheduler ends them (see end_powerup)
         self.is_wide = False
         self.is_sticky = False
-        self.wide_timer = 0
-        self.sticky_timer = 0
     
-    def update(self) -> None:
-        """Update paddle position based on keyboard input"""
-        keys = pygame.key.get_pressed()
+    def update(self, target_x: Optional[float] = None) -> None:
+        """Update paddle position from keyboard input, or steer towards `target_x`"""
         self.velocity = 0
         
-        if keys[pygame.K_LEFT]:
-            self.velocity = -self.speed
-            # Apply acceleration for smoother movement
-            if self.velocity > -self.speed:
-                self.velocity -= 0.5
-        if keys[pygame.K_RIGHT]:
-            self.velocity = self.speed
-            # Apply acceleration for smoother movement
-            if self.velocity < self.speed:
-                self.velocity += 0.5
+        if target_x is not None:
+            # Autopilot: close the gap to the target centre at full speed
+            self.velocity = max(-self.speed, min(self.speed, round(target_x - self.rect.centerx)))
+        else:
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_LEFT]:
+                self.velocity = -self.speed
+                # Apply acceleration for smoother movement
+                if self.velocity > -self.speed:
+                    self.velocity -= 0.5
+            if keys[pygame.K_RIGHT]:
+                self.velocity = self.speed
+                # Apply acceleration for smoother movement
+                if self.velocity < self.speed:
+                    self.velocity += 0.5
             
         # Update position
         self.rect.x += self.velocity
         
-        # Keep paddle on screen
+        # Keep paddle inside the playfield
         if self.rect.left < 0:
             self.rect.left = 0
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
-            
-        # Handle power-up timers
-        current_time = pygame.time.get_ticks()
-        
-        # Wide paddle timer
-        if self.is_wide and current_time > self.wide_timer:
-            self.is_wide = False
-            self.width = PADDLE_WIDTH
-            self._resize_paddle()
-            
-        # Sticky paddle timer
-        if self.is_sticky and current_time > self.sticky_timer:
-            self.is_sticky = False
+        if self.rect.right > self.world.right:
+            self.rect.right = self.world.right
+    
+    def place(self, world: pygame.Rect) -> None:
+        """Move the paddle to the bottom centre of a new playfield"""
+        self.world = world
+        self.rect.centerx = world.centerx
+        self.rect.bottom = world.bottom - 20
     
     def apply_powerup(self, powerup_type: str) -> None:
         """Apply a power-up effect to the paddle"""
-        current_time = pygame.time.get_ticks()
-        
         if powerup_type == "WIDE":
             self.is_wide = True
-            self.wide_timer = current_time + POWERUP_DURATION["WIDE"]
             self.width = WIDE_PADDLE_WIDTH
             self._resize_paddle()
             
         elif powerup_type == "STICKY":
             self.is_sticky = True
-            self.sticky_timer = current_time + POWERUP_DURATION["STICKY"]
+    
+    def end_powerup(self, powerup_type: str) -> None:
+        """End a power-up effect once its duration is over"""
+        if powerup_type == "WIDE" and self.is_wide:
+            self.is_wide = False
+            self.width = PADDLE_WIDTH
+            self._resize_paddle()
+            
+        elif powerup_type == "STICKY":
+            self.is_sticky = False
     
     def _resize_paddle(self) -> None:
         """Resize the paddle while maintaining position"""
@@ -116,59 +191,33 @@ class Paddle(pygame.sprite.Sprite):
         self.rect.centerx = center
         self.rect.bottom = bottom
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the paddle"""
+    def draw(self, surface: pygame.Surface, scale: float = 1, offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the paddle, shifted by the camera `offset`"""
         # Draw paddle with rounded corners
-        draw_rounded_rect(surface, self.rect, WHITE, 5)
+        draw_rounded_rect(surface, scale_rect(self.rect.move(offset), scale), WHITE, max(1, int(5 * scale)))
 
 
-class Ball(pygame.sprite.Sprite):
+class Ball:
+    # Pooled and updated in bulk: fixed attributes keep instances small and lookups fast
+    __slots__ = ('radius', 'image', 'rect', 'speed', 'dx', 'dy', 'is_active', 'is_stuck',
+                 'stick_offset', 'launch_angle', 'is_slow', 'trail', 'trail_length')
+    
     def __init__(self, x: int = None, y: int = None) -> None:
         """Initialize the ball"""
-        super().__init__()
         self.radius = BALL_RADIUS
         self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(self.image, WHITE, (self.radius, self.radius), self.radius)
         self.rect = self.image.get_rect()
-        
-        # Position
-        if x is None or y is None:
-            self.rect.centerx = SCREEN_WIDTH // 2
-            self.rect.centery = SCREEN_HEIGHT // 2
-        else:
-            self.rect.centerx = x
-            self.rect.centery = y
-            
-        # Speed and direction
-        self.speed = BALL_SPEED
-        self.dx = random.choice([-1, 1]) * self.speed
-        self.dy = -self.speed
-        
-        # State
-        self.is_active = False
-        self.is_stuck = False
-        self.stick_offset = 0
-        self.is_slow = False
-        self.slow_timer = 0
-        
-        # Trail effect
         self.trail = []
-        self.trail_length = 5
+        self.reset(x, y)
     
-    def update(self, paddle: Paddle = None) -> None:
-        """Update ball position and handle collisions"""
+    def update(self, paddle: Paddle = None, world: Optional[pygame.Rect] = None) -> None:
+        """Update ball position and handle collisions with the walls of `world` (default: the screen)"""
         # Store position for trail effect if active
         if self.is_active:
             self.trail.append((self.rect.centerx, self.rect.centery))
             if len(self.trail) > self.trail_length:
-                self.trail.pop(0)
-                
-        # Handle slow-motion timer
-        current_time = pygame.time.get_ticks()
-        if self.is_slow and current_time > self.slow_timer:
-            self.is_slow = False
-            self.speed = BALL_SPEED
-            self._adjust_velocity()
+                del self.trail[:-self.trail_length]
         
         # If ball is stuck to paddle, update position with paddle
         if self.is_stuck and paddle:
@@ -193,8 +242,9 @@ class Ball(pygame.sprite.Sprite):
             self.dx = abs(self.dx)
             return True  # Collision occurred
             
-        if self.rect.right >= SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
+        right = SCREEN_WIDTH if world is None else world.right
+        if self.rect.right >= right:
+            self.rect.right = right
             self.dx = -abs(self.dx)
             return True  # Collision occurred
             
@@ -235,27 +285,37 @@ class Ball(pygame.sprite.Sprite):
         if not self.rect.colliderect(brick.rect):
             return False
             
-        # Determine which side of the brick was hit
-        # Calculate distances from ball center to brick edges
-        left_dist = abs(self.rect.right - brick.rect.left)
-        right_dist = abs(self.rect.left - brick.rect.right)
-        top_dist = abs(self.rect.bottom - brick.rect.top)
-        bottom_dist = abs(self.rect.top - brick.rect.bottom)
-        
-        # Find the minimum distance to determine collision side
-        min_dist = min(left_dist, right_dist, top_dist, bottom_dist)
+        # Determine which side of the brick was hit: the nearest exposed face.
+        # Faces covered by a neighbouring brick can't be reached first
+        faces = brick.exposed_faces or ALL_FACES
+        side = 0
+        min_dist = float('inf')
+        if faces & FACE_LEFT:
+            side, min_dist = FACE_LEFT, abs(self.rect.right - brick.rect.left)
+        if faces & FACE_RIGHT:
+            right_dist = abs(self.rect.left - brick.rect.right)
+            if right_dist < min_dist:
+                side, min_dist = FACE_RIGHT, right_dist
+        if faces & FACE_TOP:
+            top_dist = abs(self.rect.bottom - brick.rect.top)
+            if top_dist < min_dist:
+                side, min_dist = FACE_TOP, top_dist
+        if faces & FACE_BOTTOM:
+            bottom_dist = abs(self.rect.top - brick.rect.bottom)
+            if bottom_dist < min_dist:
+                side = FACE_BOTTOM
         
         # Adjust ball direction based on collision side
-        if min_dist == left_dist:
+        if side == FACE_LEFT:
             self.dx = -abs(self.dx)  # Hit from right, bounce left
             self.rect.right = brick.rect.left - 1
-        elif min_dist == right_dist:
+        elif side == FACE_RIGHT:
             self.dx = abs(self.dx)  # Hit from left, bounce right
             self.rect.left = brick.rect.right + 1
-        elif min_dist == top_dist:
+        elif side == FACE_TOP:
             self.dy = -abs(self.dy)  # Hit from bottom, bounce up
             self.rect.bottom = brick.rect.top - 1
-        elif min_dist == bottom_dist:
+        else:
             self.dy = abs(self.dy)  # Hit from top, bounce down
             self.rect.top = brick.rect.bottom + 1
             
@@ -266,18 +326,23 @@ class Ball(pygame.sprite.Sprite):
         if self.is_stuck or not self.is_active:
             self.is_stuck = False
             self.is_active = True
-            # Set initial direction slightly randomized
-            angle = random.uniform(-math.pi/4, math.pi/4)  # -45 to 45 degrees
+            # Set initial direction slightly randomized (-45 to 45 degrees)
+            angle = self.launch_angle
+            self.launch_angle = random.uniform(-math.pi/4, math.pi/4)
             self.dx = math.sin(angle) * self.speed
             self.dy = -math.cos(angle) * self.speed
     
     def apply_powerup(self, powerup_type: str) -> None:
         """Apply a power-up effect to the ball"""
-        current_time = pygame.time.get_ticks()
-        
         if powerup_type == "SLOW":
             self.is_slow = True
-            self.slow_timer = current_time + POWERUP_DURATION["SLOW"]
+    
+    def end_powerup(self, powerup_type: str) -> None:
+        """End a power-up effect once its duration is over"""
+        if powerup_type == "SLOW" and self.is_slow:
+            self.is_slow = False
+            self.speed = BALL_SPEED
+            self._adjust_velocity()
     
     def _adjust_velocity(self) -> None:
         """Adjust velocity to maintain direction but change speed"""
@@ -294,7 +359,8 @@ class Ball(pygame.sprite.Sprite):
         self.dy = (self.dy / magnitude) * self.speed
     
     def reset(self, x: int = None, y: int = None) -> None:
-        """Reset the ball to initial state"""
+        """Reset the ball to the state of a new one, so pooled balls can be reused"""
+        # Position
         if x is None or y is None:
             self.rect.centerx = SCREEN_WIDTH // 2
             self.rect.centery = SCREEN_HEIGHT // 2
@@ -302,31 +368,32 @@ class Ball(pygame.sprite.Sprite):
             self.rect.centerx = x
             self.rect.centery = y
             
+        # Speed and direction
+        self.speed = BALL_SPEED
         self.dx = random.choice([-1, 1]) * self.speed
         self.dy = -self.speed
+        
+        # State
         self.is_active = False
         self.is_stuck = False
+        self.stick_offset = 0
+        self.launch_angle = random.uniform(-math.pi/4, math.pi/4)  # Rolled ahead so it can be previewed
         self.is_slow = False
-        self.trail = []
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the ball with trail effect"""
-        # Draw trail
-        for i, (x, y) in enumerate(self.trail):
-            alpha = int(255 * (i + 1) / (self.trail_length + 1))
-            size = int(self.radius * (i + 1) / (self.trail_length + 1))
-            trail_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surf, (255, 255, 255, alpha), (size, size), size)
-            surface.blit(trail_surf, (x - size, y - size))
-            
-        # Draw ball with glow effect
-        glow_radius = self.radius * 1.5
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (255, 255, 255, 100), (glow_radius, glow_radius), glow_radius)
-        surface.blit(glow_surf, (self.rect.centerx - glow_radius, self.rect.centery - glow_radius))
         
-        # Draw main ball
-        pygame.draw.circle(surface, WHITE, self.rect.center, self.radius)
+        # Trail effect
+        self.trail.clear()
+        self.trail_length = 5
+    
+    def draw(self, surface: pygame.Surface, glow: bool = True, scale: float = 1,
+             offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the ball with trail effect, shifted by the camera `offset`"""
+        draw_balls(surface, (self,), glow, scale, offset)
+
+
+# Brick images shared by every brick with the same look, keyed by (type id, damaged),
+# and their scaled copies keyed by (type id, damaged, scale); never drawn on once built
+_brick_images: Dict[Tuple[str, bool], pygame.Surface] = {}
+_scaled_brick_images: Dict[Tuple[str, bool, float], pygame.Surface] = {}
 
 
 class Brick(pygame.sprite.Sprite):
@@ -336,35 +403,54 @@ class Brick(pygame.sprite.Sprite):
         self.brick_type = BRICK_TYPES[brick_type]
         self.width = BRICK_WIDTH
         self.height = BRICK_HEIGHT
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         self.hits_left = self.brick_type.hits
         self.points = self.brick_type.points
         self.is_breakable = self.hits_left > 0
+        self.exposed_faces = ALL_FACES  # Narrowed by BrickGrid for bricks in a layout
         self._draw_brick()
     
+    @property
+    def _look(self) -> Tuple[str, bool]:
+        """Return what the brick's image depends on: its type and whether it's damaged"""
+        return self.brick_type.id, self.hits_left != self.brick_type.hits
+    
+    def _shared_image(self, draw) -> None:
+        """Swap in the shared image for the brick's look, drawing it with `draw` the first time.
+        
+        Images are never drawn on once shared, so frame snapshots holding one
+        never see it change, and recycled bricks allocate nothing.
+        """
+        look = self._look
+        image = _brick_images.get(look)
+        if image is None:
+            image = _brick_images[look] = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            draw(image)
+        self.image = image
+    
     def _draw_brick(self) -> None:
         """Draw the brick with a 3D effect"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparency
+        self._shared_image(self._paint_intact)
+    
+    def _paint_intact(self, image: pygame.Surface) -> None:
+        """Paint an intact brick of this type onto `image`"""
         
         # Draw main brick with rounded corners
-        draw_rounded_rect(self.image, pygame.Rect(0, 0, self.width, self.height), 
+        draw_rounded_rect(image, pygame.Rect(0, 0, self.width, self.height), 
                          self.brick_type.color, BRICK_CORNER_RADIUS)
         
         # Add 3D effect
         # Top and left edges (lighter)
-        pygame.draw.line(self.image, self.brick_type.highlight_color, 
+        pygame.draw.line(image, self.brick_type.highlight_color, 
                        (BRICK_CORNER_RADIUS, 2), (self.width - BRICK_CORNER_RADIUS, 2), 2)
-        pygame.draw.line(self.image, self.brick_type.highlight_color, 
+        pygame.draw.line(image, self.brick_type.highlight_color, 
                        (2, BRICK_CORNER_RADIUS), (2, self.height - BRICK_CORNER_RADIUS), 2)
         
         # Bottom and right edges (darker)
-        pygame.draw.line(self.image, self.brick_type.edge_color, 
+        pygame.draw.line(image, self.brick_type.edge_color, 
                        (BRICK_CORNER_RADIUS, self.height - 2), 
                        (self.width - BRICK_CORNER_RADIUS, self.height - 2), 2)
-        pygame.draw.line(self.image, self.brick_type.edge_color, 
+        pygame.draw.line(image, self.brick_type.edge_color, 
                        (self.width - 2, BRICK_CORNER_RADIUS), 
                        (self.width - 2, self.height - BRICK_CORNER_RADIUS), 2)
     
@@ -377,84 +463,159 @@ class Brick(pygame.sprite.Sprite):
         
         # Update appearance based on remaining hits
         if self.hits_left > 0:
-            # Darken the brick to show damage
-            darker_color = tuple(max(0, c - 50) for c in self.brick_type.color)
-            self.image.fill((0, 0, 0, 0))  # Clear
-            draw_rounded_rect(self.image, pygame.Rect(0, 0, self.width, self.height), 
-                            darker_color, BRICK_CORNER_RADIUS)
+            self._draw_damaged()
             return False
         else:
             return True
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the brick"""
-        surface.blit(self.image, self.rect)
+    def _draw_damaged(self) -> None:
+        """Draw the brick darkened to show damage"""
+        self._shared_image(self._paint_damaged)
+    
+    def _paint_damaged(self, image: pygame.Surface) -> None:
+        """Paint a damaged brick of this type onto `image`"""
+        darker_color = tuple(max(0, c - 50) for c in self.brick_type.color)
+        draw_rounded_rect(image, pygame.Rect(0, 0, self.width, self.height), 
+                        darker_color, BRICK_CORNER_RADIUS)
+    
+    def reset(self, x: int, y: int, brick_type: str) -> None:
+        """Reuse this brick as an intact one of `brick_type` at (x, y)"""
+        self.rect.topleft = (x, y)
+        self.exposed_faces = ALL_FACES
+        if brick_type != self.brick_type.id:
+            self.brick_type = BRICK_TYPES[brick_type]
+            self.hits_left = self.brick_type.hits
+            self.points = self.brick_type.points
+            self.is_breakable = self.hits_left > 0
+            self._draw_brick()
+        else:
+            self.set_hits_left(self.brick_type.hits)
+
+    def set_hits_left(self, hits_left: int) -> None:
+        """Set the remaining hits and redraw the brick to match"""
+        if hits_left == self.hits_left:
+            return
+        self.hits_left = hits_left
+        if hits_left == self.brick_type.hits:
+            self._draw_brick()
+        elif hits_left > 0:
+            self._draw_damaged()
+    
+    def draw(self, surface: pygame.Surface, scale: float = 1, offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the brick, shifted by the camera `offset`"""
+        if scale == 1:
+            surface.blit(self.image, self.rect.move(offset))
+            return
+            
+        # Scale each look once, shared like the full-size images
+        key = self._look + (scale,)
+        scaled = _scaled_brick_images.get(key)
+        if scaled is None:
+            size = scale_rect(self.rect, scale).size
+            scaled = _scaled_brick_images[key] = pygame.transform.smoothscale(self.image, size)
+        surface.blit(scaled, (int((self.rect.x + offset[0]) * scale), int((self.rect.y + offset[1]) * scale)))
 
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp:
+    __slots__ = ('type', 'color', 'size', 'image', 'rect', 'speed', 'angle')
+    
     def __init__(self, x: int, y: int, powerup_type: str) -> None:
         """Initialize a power-up"""
-        super().__init__()
-        self.type = powerup_type
-        self.color = POWERUPS[powerup_type].color
         self.size = POWERUP_SIZE
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.type = None  # Forces reset() to draw the first icon
+        self.reset(x, y, powerup_type)
+    
+    def reset(self, x: int, y: int, powerup_type: str) -> None:
+        """Reset to a new power-up, redrawing the icon only if the type changes"""
+        if powerup_type != self.type:
+            self.type = powerup_type
+            self.color = POWERUPS[powerup_type].color
+            self._draw_powerup()
         self.rect.centerx = x
         self.rect.centery = y
         self.speed = POWERUP_SPEED
         self.angle = 0  # For rotation effect
-        self._draw_powerup()
     
     def _draw_powerup(self) -> None:
         """Draw the power-up with a distinctive look"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparency
+        # Draw onto a new surface and swap it in, so frame snapshots never see a half-drawn icon
+        image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
         
         # Draw rounded square
-        draw_rounded_rect(self.image, pygame.Rect(0, 0, self.size, self.size), 
+        draw_rounded_rect(image, pygame.Rect(0, 0, self.size, self.size), 
                          self.color, 8)
         
         # Add icon based on power-up type
         if self.type == "WIDE":
             # Draw wide paddle icon
-            pygame.draw.rect(self.image, WHITE, (5, self.size//2 + 2, self.size - 10, 5))
+            pygame.draw.rect(image, WHITE, (5, self.size//2 + 2, self.size - 10, 5))
         elif self.type == "STICKY":
             # Draw sticky paddle icon
-            pygame.draw.rect(self.image, WHITE, (5, self.size//2 + 5, self.size - 10, 5))
-            pygame.draw.circle(self.image, WHITE, (self.size//2, self.size//2 - 5), 5)
+            pygame.draw.rect(image, WHITE, (5, self.size//2 + 5, self.size - 10, 5))
+            pygame.draw.circle(image, WHITE, (self.size//2, self.size//2 - 5), 5)
         elif self.type == "MULTI":
             # Draw multi-ball icon
-            pygame.draw.circle(self.image, WHITE, (self.size//2, self.size//2), 5)
-            pygame.draw.circle(self.image, WHITE, (self.size//2 - 7, self.size//2 + 5), 4)
-            pygame.draw.circle(self.image, WHITE, (self.size//2 + 7, self.size//2 + 5), 4)
+            pygame.draw.circle(image, WHITE, (self.size//2, self.size//2), 5)
+            pygame.draw.circle(image, WHITE, (self.size//2 - 7, self.size//2 + 5), 4)
+            pygame.draw.circle(image, WHITE, (self.size//2 + 7, self.size//2 + 5), 4)
         elif self.type == "SLOW":
             # Draw slow-motion icon
-            pygame.draw.circle(self.image, WHITE, (self.size//2, self.size//2), 8, 2)
-            pygame.draw.line(self.image, WHITE, (self.size//2, self.size//2), 
+            pygame.draw.circle(image, WHITE, (self.size//2, self.size//2), 8, 2)
+            pygame.draw.line(image, WHITE, (self.size//2, self.size//2), 
                            (self.size//2, self.size//2 - 6), 2)
-            pygame.draw.line(self.image, WHITE, (self.size//2, self.size//2), 
+            pygame.draw.line(image, WHITE, (self.size//2, self.size//2), 
                            (self.size//2 + 4, self.size//2), 2)
+        self.image = image
     
     def update(self) -> None:
         """Update power-up position and rotation"""
         self.rect.y += self.speed
         self.angle = (self.angle + 2) % 360
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the power-up with rotation and glow effect"""
+    def draw(self, surface: pygame.Surface, glow: bool = True, scale: float = 1,
+             offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the power-up with rotation and glow effect, shifted by the camera `offset`"""
+        center = (int((self.rect.centerx + offset[0]) * scale), int((self.rect.centery + offset[1]) * scale))
+        
         # Draw glow effect
-        glow_radius = int(self.size * 1.5)
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        glow_color = (*self.color, 100)  # Semi-transparent color
-        pygame.draw.rect(glow_surf, glow_color, 
-                       (glow_radius - self.size//2, glow_radius - self.size//2, 
-                        self.size, self.size), 0, 8)
-        surface.blit(glow_surf, 
-                   (self.rect.centerx - glow_radius, self.rect.centery - glow_radius))
+        if glow:
+            size = int(self.size * scale)
+            glow_radius = int(self.size * 1.5 * scale)
+            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            glow_color = (*self.color, 100)  # Semi-transparent color
+            pygame.draw.rect(glow_surf, glow_color, 
+                           (glow_radius - size//2, glow_radius - size//2, 
+                            size, size), 0, max(1, int(8 * scale)))
+            surface.blit(glow_surf, 
+                       (center[0] - glow_radius, center[1] - glow_radius))
         
-        # Rotate image
-        rotated = pygame.transform.rotate(self.image, self.angle)
-        rotated_rect = rotated.get_rect(center=self.rect.center)
+        # Rotate image (and scale it down for a smaller render target)
+        if scale == 1:
+            rotated = pygame.transform.rotate(self.image, self.angle)
+        else:
+            rotated = pygame.transform.rotozoom(self.image, self.angle, scale)
+        rotated_rect = rotated.get_rect(center=center)
         
         # Draw power-up
         surface.blit(rotated, rotated_rect)
+
+
+class Particle:
+    """A short-lived square spark; pooled, so it is reset rather than recreated"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'size', 'color', 'lifetime')
+    
+    def __init__(self) -> None:
+        """Initialize a spent particle"""
+        self.reset(0, 0, 0, 0, 1, WHITE, 0)
+    
+    def reset(self, x: float, y: float, vx: float, vy: float, size: int,
+              color: Tuple[int, int, int], lifetime: int) -> None:
+        """Start the particle over at (x, y)"""
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+        self.color = color
+        self.lifetime = lifetime
@@ -0,0 +1,96 @@
+"""
+Ball trajectory prediction against the walls, the brick grid and the paddle
+"""
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import pygame
+from settings import *
+from sprites import Brick, FACE_LEFT, FACE_RIGHT
+from brick_grid import BrickGrid
+
+
+@dataclass
+class PathPoint:
+    """Where the ball centre changes course, and what it touched there"""
+    x: float
+    y: float
+    kind: str  # "start", "wall", "brick", "paddle" or "floor"
+    brick: Optional[Brick] = None
+
+
+def trace_path(grid: BrickGrid, origin: Tuple[float, float], velocity: Tuple[float, float],
+               radius: float, bounces: int, paddle_rect: Optional[pygame.Rect] = None,
+               floor_y: float = SCREEN_HEIGHT + BALL_RADIUS,
+               width: float = SCREEN_WIDTH) -> List[PathPoint]:
+    """Follow a ball through up to `bounces` reflections off walls and bricks.
+
+    The side walls are `width` apart. The path ends early on the paddle or
+    where the centre reaches `floor_y`.
+    Bricks reflect like walls; breaking them isn't simulated.
+    """
+    x, y = origin
+    dx, dy = velocity
+    path = [PathPoint(x, y, "start")]
+    if dx == 0 and dy == 0:
+        return path
+
+    for _ in range(bounces + 1):
+        # Nearest wall plane the centre can reach (ball.update bounces the rect on these)
+        t, kind, flip_x = math.inf, "wall", False
+        if dx < 0:
+            t, flip_x = (radius - x) / dx, True
+        elif dx > 0:
+            t, flip_x = (width - radius - x) / dx, True
+        if dy < 0 and (radius - y) / dy < t:
+            t, flip_x = (radius - y) / dy, False
+        elif dy > 0:
+            # Leaving through the bottom, or meeting the paddle on the way
+            floor_t = max(0.0, (floor_y - y) / dy)
+            if floor_t < t:
+                t, kind = floor_t, "floor"
+            if paddle_rect is not None:
+                paddle_t = (paddle_rect.top - radius - y) / dy
+                paddle_x = x + dx * paddle_t
+                if (0 <= paddle_t < t and
+                        paddle_rect.left - radius <= paddle_x <= paddle_rect.right + radius):
+                    t, kind = paddle_t, "paddle"
+
+        brick = None
+        hit = grid.raycast((x, y), (dx, dy), radius, t)
+        if hit is not None:
+            t, face, brick = hit
+            kind, flip_x = "brick", face in (FACE_LEFT, FACE_RIGHT)
+
+        x, y = x + dx * t, y + dy * t
+        path.append(PathPoint(x, y, kind, brick))
+        if kind in ("paddle", "floor"):
+            break
+        if flip_x:
+            dx = -dx
+        else:
+            dy = -dy
+    return path
+
+
+def landing_x(grid: BrickGrid, origin: Tuple[float, float], velocity: Tuple[float, float],
+              radius: float, landing_y: float, bounces: int = 8) -> Optional[float]:
+    """Return where the ball centre will cross `landing_y` heading down, if within `bounces`"""
+    end = trace_path(grid, origin, velocity, radius, bounces, floor_y=landing_y)[-1]
+    return end.x if end.kind == "floor" else None
+
+
+def path_dots(path: List[PathPoint], spacing: float) -> List[Tuple[int, int]]:
+    """Return evenly spaced points along a path, for drawing it dotted"""
+    dots = []
+    carry = spacing  # Distance into the current segment of the next dot; skip the start
+    for start, end in zip(path, path[1:]):
+        length = math.hypot(end.x - start.x, end.y - start.y)
+        distance = carry
+        while distance < length:
+            fraction = distance / length
+            dots.append((int(start.x + (end.x - start.x) * fraction),
+                         int(start.y + (end.y - start.y) * fraction)))
+            distance += spacing
+        carry = distance - length
+    return dots
@@ -0,0 +1,78 @@
+"""
+Tests for the allocation tracker
+"""
+import unittest
+import json
+import tempfile
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.alloc_tracker import AllocationTracker
+from src.sprites import Ball
+
+class TestAllocationTracker(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.directory = tempfile.TemporaryDirectory()
+        self.tracker = AllocationTracker(output_dir=self.directory.name)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.tracker.stop()
+        self.directory.cleanup()
+        pygame.quit()
+
+    def test_surfaces_are_counted_per_call_site(self):
+        """Test that Surfaces created during a frame are attributed to their caller"""
+        original = pygame.Surface
+        self.tracker.start()
+        self.tracker.begin_frame()
+        ball = Ball()
+        ball.draw(pygame.Surface((100, 100)))
+        self.tracker.end_frame()
+
+        frame = self.tracker.history[-1]
+        self.assertGreaterEqual(frame['surfaces'], 3)
+        self.assertTrue(any('sprites.py' in site for site in self.tracker.site_counts))
+
+        self.tracker.stop()
+        self.assertIs(pygame.Surface, original)
+
+    def test_scaling_into_a_surface_is_not_counted(self):
+        """Test that only transform.scale calls without a destination count as new Surfaces"""
+        source = pygame.Surface((10, 10))
+        dest = pygame.Surface((20, 20))
+        self.tracker.start()
+        self.tracker.begin_frame()
+        pygame.transform.scale(source, (20, 20), dest)
+        pygame.transform.scale(source, (20, 20), dest_surface=dest)
+        pygame.transform.scale(source, (20, 20))
+        self.tracker.end_frame()
+        self.assertEqual(self.tracker.history[-1]['surfaces'], 1)
+
+    def test_report_is_written(self):
+        """Test that stopping writes a JSON session report"""
+        self.tracker.start()
+        self.tracker.begin_frame()
+        pygame.Surface((10, 10))
+        self.tracker.end_frame()
+        path = self.tracker.stop()
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data['frames'], 1)
+        self.assertEqual(data['surface_sites'][0]['per_frame'], 1)
+
+    def test_disabled_tracker_ignores_frames(self):
+        """Test that frame hooks do nothing while disabled"""
+        self.tracker.begin_frame()
+        self.tracker.end_frame()
+        self.assertEqual(len(self.tracker.history), 0)
+        self.assertEqual(self.tracker.overlay_lines(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for the voice-limited mixer
+"""
+import shutil
+import tempfile
+import unittest
+import wave
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.audio import Mixer
+from src.settings import SoundMix
+
+MIX = {
+    "bounce": SoundMix("impact", 0, 50),
+    "brick_break": SoundMix("impact", 1, 0),
+    "game_over": SoundMix("event", 3, 0),
+}
+
+class TestMixer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        if not pygame.mixer.get_init():
+            self.skipTest("no audio device")
+        self.directory = tempfile.mkdtemp()
+        for name in MIX:
+            self._write_wav(name)
+        self.mixer = Mixer({"impact": 2, "event": 1}, MIX, predecode=True)
+        self.mixer.load({name: name + ".wav" for name in MIX}, self.directory)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        pygame.quit()
+
+    def _write_wav(self, name):
+        """Write a second of silence as a WAV file"""
+        with wave.open(os.path.join(self.directory, name + ".wav"), 'wb') as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(22050)
+            f.writeframes(bytes(22050 * 2))
+
+    def _playing(self, category):
+        """Return the sounds playing on a pool's channels"""
+        return [pygame.mixer.Channel(i).get_sound() for i in self.mixer.pools[category]
+                if pygame.mixer.Channel(i).get_busy()]
+
+    def test_pools_are_reserved_channels(self):
+        """Test that each category gets its own reserved channels"""
+        self.assertEqual(self.mixer.pools, {"impact": [0, 1], "event": [2]})
+        self.assertIn("bounce", self.mixer)
+        self.assertNotIn("powerup", self.mixer)
+        self.assertFalse(self.mixer.play("powerup", now=0))
+
+    def test_repeats_are_rate_limited(self):
+        """Test that a sound can't restart within its minimum interval"""
+        self.assertTrue(self.mixer.play("bounce", now=1000))
+        self.assertFalse(self.mixer.play("bounce", now=1020))
+        self.assertTrue(self.mixer.play("bounce", now=1050))
+        self.assertEqual(self.mixer.dropped, 1)
+
+    def test_full_pool_steals_lower_priority_voices(self):
+        """Test that a full pool cuts off its oldest voice the new sound outranks"""
+        self.mixer.play("bounce", now=0)
+        self.mixer.play("brick_break", now=10)
+        self.assertEqual(len(self._playing("impact")), 2)
+
+        # The bounce is cut off for the break
+        self.assertTrue(self.mixer.play("brick_break", now=20))
+        breaks = self.mixer.sounds["brick_break"]
+        self.assertEqual(self._playing("impact"), [breaks, breaks])
+
+        # A bounce can't cut off breaks
+        self.assertFalse(self.mixer.play("bounce", now=100))
+        self.assertEqual(len(self._playing("impact")), 2)
+
+    def test_impacts_never_take_event_channels(self):
+        """Test that a storm of impacts leaves the event pool free"""
+        for now in range(0, 1000, 10):
+            self.mixer.play("brick_break", now=now)
+        self.assertEqual(self._playing("event"), [])
+        self.assertTrue(self.mixer.play("game_over", now=1000))
+
+    def test_lazy_decoding(self):
+        """Test that without predecode a sound is decoded on its first play"""
+        mixer = Mixer({"impact": 2, "event": 1}, MIX, predecode=False)
+        mixer.load({"bounce": "bounce.wav"}, self.directory)
+        self.assertEqual(mixer.sounds, {})
+        self.assertIn("bounce", mixer)
+        self.assertTrue(mixer.play("bounce", now=0))
+        self.assertIn("bounce", mixer.sounds)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for the autopilot paddle controller
+"""
+import random
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.autopilot import Autopilot
+from src.brick_grid import BrickGrid
+from src.sprites import Ball, Paddle
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, PADDLE_SPEED
+
+class TestAutopilot(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.autopilot = Autopilot(aim=False)
+        self.paddle = Paddle()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _falling_ball(self, x, y, dx, dy):
+        """Create an active ball moving by (dx, dy) per frame"""
+        ball = Ball(x, y)
+        ball.is_active = True
+        ball.dx, ball.dy = dx, dy
+        return ball
+
+    def test_step_velocity_matches_rect_rounding(self):
+        """Test that predicted steps match how Rect rounds float moves"""
+        for dx in (1.5, -1.5, 2.5, -0.6, 0.4, 3.49):
+            ball = self._falling_ball(200, 200, dx, 7)
+            x = ball.rect.x
+            ball.update()
+            self.assertEqual(self.autopilot.step_velocity(ball)[0], ball.rect.x - x)
+
+    def test_plans_landing_after_wall_bounce(self):
+        """Test that the target is where the ball will meet the paddle"""
+        ball = self._falling_ball(100, 300, -3, 6)
+        target = self.autopilot.plan(self.paddle, [ball], BrickGrid(), 0)
+
+        # Run the ball down and check it lands on the predicted spot
+        while ball.rect.bottom < self.paddle.rect.top:
+            ball.update()
+        self.assertAlmostEqual(target, ball.rect.centerx, delta=3)
+
+    def test_plan_is_cached_along_a_segment(self):
+        """Test that a ball on the same straight line reuses its plan"""
+        ball = self._falling_ball(640, 300, 2, 6)
+        grid = BrickGrid()
+        self.autopilot.plan(self.paddle, [ball], grid, 0)
+        plan = self.autopilot._plans[ball]
+        ball.update()
+        self.autopilot.plan(self.paddle, [ball], grid, 0)
+        self.assertIs(self.autopilot._plans[ball], plan)
+
+    def test_paddle_steers_within_speed(self):
+        """Test that the paddle closes on its target at paddle speed"""
+        start = self.paddle.rect.centerx
+        self.paddle.update(start + 100)
+        self.assertEqual(self.paddle.rect.centerx, start + PADDLE_SPEED)
+        self.paddle.update(start + PADDLE_SPEED + 3)
+        self.assertEqual(self.paddle.rect.centerx, start + PADDLE_SPEED + 3)
+
+    def test_soak_keeps_lives(self):
+        """Test that an unattended game doesn't lose a ball"""
+        random.seed(5)
+        game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        game.show_instructions = False
+        game.autopilot.enabled = True
+        for _ in range(3000):
+            game.update()
+        self.assertEqual(game.lives, 3)
+        self.assertGreater(game.score, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for the parallax background
+"""
+import math
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.background import ParallaxBackground
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, NEBULA_PARALLAX
+
+def make_meteor(x, y, size=4, speed=3.0, angle=math.pi / 2):
+    """Build a meteor dict like Game._create_meteors does"""
+    return {'x': x, 'y': y, 'size': size, 'speed': speed, 'angle': angle, 'trail': []}
+
+def make_nebula(x, y, size=100):
+    """Build a square nebula dict like Game._create_nebulas does"""
+    points = [(0, -size / 2), (size / 2, 0), (0, size / 2), (-size / 2, 0)]
+    return {'x': x, 'y': y, 'size': size, 'color': (30, 0, 60, 30),
+            'drift_x': 0.2, 'drift_y': 0.0, 'points': points}
+
+class TestParallaxBackground(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_images_are_reused_between_frames(self):
+        """Test that drawing never re-renders nebulas or streaks"""
+        meteors = [make_meteor(100, 100), make_meteor(300, 50)]
+        background = ParallaxBackground(meteors, [make_nebula(400, 300)])
+        first = [image for _, image, _, _ in background.sprites()]
+        background.update()
+        second = [image for _, image, _, _ in background.sprites()]
+        self.assertEqual(len(first), 3)
+        for a, b in zip(first, second):
+            self.assertIs(a, b)
+        # Meteors with the same size, speed and heading share one streak
+        self.assertIs(first[1], first[2])
+
+    def test_meteor_head_is_drawn_at_its_position(self):
+        """Test that the streak is placed with its head on the meteor"""
+        background = ParallaxBackground([make_meteor(200, 200)], [])
+        background.draw(self.surface)
+        self.assertEqual(self.surface.get_at((200, 200))[:3], (255, 255, 255))
+        # The trail lies behind the meteor, which falls straight down
+        self.assertNotEqual(self.surface.get_at((200, 195))[:3], (0, 0, 0))
+        self.assertEqual(self.surface.get_at((200, 215))[:3], (0, 0, 0))
+
+    def test_layers_shift_with_the_view(self):
+        """Test that the nebula layer moves by its parallax factor"""
+        background = ParallaxBackground([], [make_nebula(400, 300)])
+        _, _, x0, _ = next(background.sprites(0, 0))
+        _, _, x1, _ = next(background.sprites(100, 0))
+        self.assertAlmostEqual(x0 - x1, 100 * NEBULA_PARALLAX)
+
+    def test_meteors_respawn_above_the_screen(self):
+        """Test that meteors leaving the screen start over at the top"""
+        meteor = make_meteor(200, SCREEN_HEIGHT + 49)
+        background = ParallaxBackground([meteor], [])
+        background.update()
+        self.assertLess(meteor['y'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
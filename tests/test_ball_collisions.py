@@ -0,0 +1,138 @@
+"""
+Tests for ball-to-ball collisions and the spatial hash broadphase
+"""
+import math
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ball_collisions import SpatialHash, collide_balls, collide_pair
+from src.game import Game
+from src.sprites import Ball, draw_balls
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS, CROWD_BALL_COUNT, CROWD_TRAIL_LENGTH
+
+class TestBallCollisions(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _ball(self, x, y, dx, dy):
+        """Create an active ball centred at (x, y) moving at (dx, dy)"""
+        ball = Ball(x, y)
+        ball.rect.center = (x, y)
+        ball.dx, ball.dy = dx, dy
+        ball.is_active = True
+        ball.is_stuck = False
+        return ball
+
+    def test_head_on_balls_swap_velocities(self):
+        """Test that equal balls meeting head on bounce straight back"""
+        a = self._ball(100, 100, 5, 0)
+        b = self._ball(100 + BALL_RADIUS, 100, -5, 0)
+        self.assertTrue(collide_pair(a, b))
+        self.assertAlmostEqual(a.dx, -5)
+        self.assertAlmostEqual(b.dx, 5)
+        self.assertAlmostEqual(a.dy, 0)
+        self.assertAlmostEqual(b.dy, 0)
+
+    def test_speeds_are_preserved(self):
+        """Test that each ball keeps its own speed after a glancing hit"""
+        a = self._ball(200, 200, 4, 3)
+        b = self._ball(208, 205, -1, 0)
+        collide_pair(a, b)
+        self.assertAlmostEqual(math.hypot(a.dx, a.dy), 5)
+        self.assertAlmostEqual(math.hypot(b.dx, b.dy), 1)
+
+    def test_overlapping_balls_are_separated(self):
+        """Test that overlapping balls are pushed apart to touching distance"""
+        a = self._ball(300, 300, 0, 5)
+        b = self._ball(304, 300, 0, 5)
+        collide_pair(a, b)
+        distance = math.dist(a.rect.center, b.rect.center)
+        self.assertGreaterEqual(distance, 2 * BALL_RADIUS - 1)
+
+    def test_stacked_balls_are_separated(self):
+        """Test that balls spawned on the same spot don't stay stuck together"""
+        a = self._ball(300, 300, 3, -4)
+        b = self._ball(300, 300, -3, -4)
+        collide_pair(a, b)
+        self.assertNotEqual(a.rect.center, b.rect.center)
+
+    def test_receding_balls_keep_velocities(self):
+        """Test that balls already moving apart are only separated"""
+        a = self._ball(100, 100, -5, 0)
+        b = self._ball(110, 100, 5, 0)
+        collide_pair(a, b)
+        self.assertEqual((a.dx, b.dx), (-5, 5))
+
+    def test_distant_balls_do_not_collide(self):
+        """Test that balls further apart than a diameter are untouched"""
+        a = self._ball(100, 100, 5, 0)
+        b = self._ball(100 + 2 * BALL_RADIUS + 1, 100, -5, 0)
+        self.assertFalse(collide_pair(a, b))
+        self.assertEqual((a.dx, b.dx), (5, -5))
+
+    def test_hash_pairs_only_nearby_balls(self):
+        """Test that the broadphase reports each close pair once and skips far ones"""
+        close = [self._ball(100, 100, 1, 1), self._ball(110, 105, 1, 1)]
+        across_cells = [self._ball(2 * BALL_RADIUS * 10 - 2, 300, 1, 1),
+                        self._ball(2 * BALL_RADIUS * 10 + 2, 300, 1, 1)]
+        far = self._ball(600, 600, 1, 1)
+        spatial_hash = SpatialHash()
+        spatial_hash.rebuild(close + across_cells + [far])
+        pairs = {frozenset(pair) for pair in spatial_hash.pairs()}
+        self.assertEqual(pairs, {frozenset(close), frozenset(across_cells)})
+        self.assertEqual(len(spatial_hash.pairs()), 2)
+
+    def test_hash_skips_stuck_and_inactive_balls(self):
+        """Test that balls on the paddle or out of play are never paired"""
+        a = self._ball(100, 100, 1, 1)
+        b = self._ball(105, 100, 1, 1)
+        b.is_stuck = True
+        c = self._ball(100, 105, 1, 1)
+        c.is_active = False
+        self.assertEqual(collide_balls([a, b, c], SpatialHash()), 0)
+
+    def test_toggle_with_c(self):
+        """Test that C turns ball collisions on and off"""
+        game = Game(self.screen)
+        enabled = game.ball_collisions
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c)
+        game.handle_events(event)
+        self.assertEqual(game.ball_collisions, not enabled)
+        game.handle_events(event)
+        self.assertEqual(game.ball_collisions, enabled)
+
+    def test_batched_draw_matches_drawing_each_ball(self):
+        """Test that drawing a crowd in batches looks like drawing its balls one by one"""
+        balls = [self._ball(40 + 13 * i, 100 + 7 * (i % 30), 3, -3) for i in range(60)]
+        for ball in balls:
+            for _ in range(6):
+                ball.update(None, pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        one_by_one = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for ball in balls:
+            ball.draw(one_by_one, True, 0.5, (10, 20))
+        draw_balls(self.screen, balls, True, 0.5, (10, 20))
+        self.assertEqual(pygame.image.tostring(self.screen, 'RGB'), pygame.image.tostring(one_by_one, 'RGB'))
+
+    def test_crowds_keep_short_trails(self):
+        """Test that trails are cut short while more than CROWD_BALL_COUNT balls are in play"""
+        game = Game(self.screen)
+        game.show_instructions = False
+        while len(game.balls) <= CROWD_BALL_COUNT:
+            game._apply_powerup("MULTI")
+        for _ in range(10):
+            game.update()
+        self.assertTrue(all(len(ball.trail) <= CROWD_TRAIL_LENGTH for ball in game.balls))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Tests for the benchmark harness
+"""
+import unittest
+import sys
+import os
+
+# Add the benchmarks directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+from benchmark import compare
+
+class TestBenchmark(unittest.TestCase):
+    def test_regression_is_reported(self):
+        """Test that a slowdown beyond tolerance and noise floor is reported"""
+        baseline = {'multiball_200': {'update_ms': 2.0, 'render_ms': 5.0, 'alloc_kb': 100.0}}
+        results = {'multiball_200': {'update_ms': 4.0, 'render_ms': 5.1, 'alloc_kb': 100.0}}
+        regressions = compare(results, baseline, tolerance=0.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('multiball_200.update_ms', regressions[0])
+
+    def test_noise_is_ignored(self):
+        """Test that tiny absolute changes never count as regressions"""
+        baseline = {'constant_shake': {'update_ms': 0.1, 'render_ms': 3.0, 'alloc_kb': 8.0}}
+        results = {'constant_shake': {'update_ms': 0.3, 'render_ms': 3.0, 'alloc_kb': 8.0}}
+        self.assertEqual(compare(results, baseline, tolerance=0.5), [])
+
+    def test_unknown_scenarios_are_reported(self):
+        """Test that scenarios missing from the baseline are reported, not silently passed"""
+        results = {'new_scenario': {'update_ms': 9.0, 'render_ms': 9.0, 'alloc_kb': 9.0}}
+        regressions = compare(results, {}, tolerance=0.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('new_scenario: no baseline', regressions[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for exposed-face tracking in the brick grid
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.sprites import Ball, FACE_LEFT, FACE_RIGHT, FACE_TOP, FACE_BOTTOM, ALL_FACES
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestBrickGrid(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        self.game.load_layout(["333", "333"])
+        self.bricks = self.game.level_bricks  # Row-major: top row, then bottom row
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_shared_faces_are_hidden(self):
+        """Test that faces touching a neighbour are not exposed"""
+        top_middle, bottom_left = self.bricks[1], self.bricks[3]
+        self.assertEqual(top_middle.exposed_faces, FACE_TOP)
+        self.assertEqual(bottom_left.exposed_faces, FACE_LEFT | FACE_BOTTOM)
+
+    def test_breaking_exposes_neighbours(self):
+        """Test that removing a brick exposes the faces around its cell"""
+        grid = self.game.brick_grid
+        grid.remove(self.bricks[4])  # Bottom middle
+        self.assertEqual(self.bricks[1].exposed_faces, FACE_TOP | FACE_BOTTOM)
+        self.assertTrue(self.bricks[3].exposed_faces & FACE_RIGHT)
+        self.assertTrue(self.bricks[5].exposed_faces & FACE_LEFT)
+        grid.add(self.bricks[4])
+        self.assertEqual(self.bricks[1].exposed_faces, FACE_TOP)
+        self.assertEqual(self.bricks[4].exposed_faces, FACE_BOTTOM)
+
+    def test_off_grid_brick_keeps_all_faces(self):
+        """Test that a brick off the layout pitch can be hit on any side"""
+        brick = self.bricks[0]
+        self.game.brick_grid.remove(brick)
+        brick.rect.x += 7
+        self.game.brick_grid.add(brick)
+        self.assertEqual(brick.exposed_faces, ALL_FACES)
+
+    def test_seam_hit_bounces_off_exposed_face(self):
+        """Test that a ball rising into the seam between two bricks bounces down"""
+        left, right = self.bricks[3], self.bricks[4]
+        ball = Ball(left.rect.right, left.rect.bottom + 5)
+        ball.rect.right = left.rect.right + 2  # Overlaps the left brick's covered right face
+        ball.dx, ball.dy = 1, -5
+        self.assertTrue(ball.check_brick_collision(left))
+        self.assertGreater(ball.dy, 0)
+        self.assertEqual(ball.dx, 1)
+
+    def test_query_returns_bricks_in_rect(self):
+        """Test that a rect query finds just the bricks whose cells it overlaps, row by row"""
+        grid = self.game.brick_grid
+        top_left, top_middle, bottom_left = self.bricks[0], self.bricks[1], self.bricks[3]
+        self.assertEqual(grid.query(top_left.rect), [top_left])
+        self.assertEqual(grid.query(top_left.rect.union(bottom_left.rect)), [top_left, bottom_left])
+        self.assertEqual(grid.query(top_left.rect.union(top_middle.rect)), [top_left, top_middle])
+        self.assertEqual(grid.query(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)), self.bricks)
+        self.assertEqual(grid.query(pygame.Rect(0, SCREEN_HEIGHT - 10, 10, 10)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Tests for oversized levels, the camera and view culling
+"""
+import tempfile
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.alloc_tracker import AllocationTracker
+from src.camera import visible_area
+from src.game import Game
+from src.pipeline import capture_snapshot
+from src.settings import (SCREEN_WIDTH, SCREEN_HEIGHT, BRICK_WIDTH, BRICK_PADDING,
+                          WORLD_MARGIN, CULL_MARGIN)
+
+class TestCamera(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.font = pygame.font.Font(None, 24)
+        self.game.show_instructions = False
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _load_huge_level(self):
+        """Load a level 40 bricks wide and 40 rows tall"""
+        self.game.load_layout(["1" * 40] * 40)
+
+    def _launch(self, x, y, dx, dy):
+        """Put the first ball in flight at (x, y)"""
+        ball = self.game.balls.first()
+        ball.launch()
+        ball.rect.center = (x, y)
+        ball.dx, ball.dy = dx, dy
+        return ball
+
+    def test_screen_sized_level_keeps_the_camera_still(self):
+        """Test that a level that fits the screen plays without a camera offset"""
+        game = self.game
+        game.load_layout(["111", "222"])
+        self.assertEqual(game.world.size, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._launch(100, 400, 5, -5)
+        for _ in range(30):
+            game.update()
+        self.assertEqual(game.camera_offset, (0, 0))
+
+    def test_wide_level_gets_a_larger_world(self):
+        """Test that a level wider than the screen is laid out inside a wider playfield"""
+        self._load_huge_level()
+        world = self.game.world
+        self.assertGreater(world.width, SCREEN_WIDTH)
+        self.assertGreater(world.height, SCREEN_HEIGHT)
+        lefts = [brick.rect.left for brick in self.game.bricks]
+        rights = [brick.rect.right for brick in self.game.bricks]
+        self.assertEqual(min(lefts), WORLD_MARGIN)
+        self.assertEqual(world.right - max(rights), WORLD_MARGIN)
+        self.assertEqual(self.game.paddle.rect.bottom, world.bottom - 20)
+        self.assertEqual(self.game.paddle.rect.centerx, world.centerx)
+
+    def test_camera_follows_the_ball_inside_the_world(self):
+        """Test that the view eases towards the ball and never leaves the world"""
+        self._load_huge_level()
+        game = self.game
+        ball = self._launch(game.world.right - 30, game.world.bottom - 200, 0, 0)
+        for _ in range(200):
+            ball.rect.center = (game.world.right - 30, game.world.bottom - 200)
+            game.camera.follow(game.balls, game.paddle)
+        view = game.camera.view
+        self.assertEqual(view.right, game.world.right)
+        self.assertTrue(game.world.contains(view))
+        self.assertTrue(view.collidepoint(ball.rect.center))
+
+    def test_ball_bounces_off_the_world_wall(self):
+        """Test that the right wall of a wide level is the world's, not the screen's"""
+        self._load_huge_level()
+        game = self.game
+        ball = self._launch(SCREEN_WIDTH + 100, game.world.bottom - 200, 7, 0)
+        ball.update(game.paddle, game.world)
+        self.assertGreater(ball.dx, 0)
+        ball.rect.right = game.world.right - 1
+        ball.update(game.paddle, game.world)
+        self.assertLess(ball.dx, 0)
+
+    def test_aim_preview_returns_to_a_low_paddle(self):
+        """Test that the launch path in a tall level isn't cut off at the screen's height"""
+        self._load_huge_level()
+        game = self.game
+        game.aim_preview = True
+        paddle_top = game.paddle.rect.top
+        self.assertGreater(paddle_top, SCREEN_HEIGHT)
+        dots = game.aim_dots()
+        ys = [y for _, y in dots]
+        top = ys.index(min(ys))
+        self.assertLess(ys[top], paddle_top - 200)
+        # After bouncing off the bricks the path comes back down towards the paddle
+        self.assertGreater(max(ys[top:]), ys[top] + 200)
+
+    def test_only_visible_bricks_are_drawn(self):
+        """Test that culling keeps just the bricks near the view"""
+        self._load_huge_level()
+        visible = list(self.game.visible_bricks())
+        self.assertGreater(len(visible), 0)
+        self.assertLess(len(visible), len(self.game.bricks) // 4)
+        area = self.game.camera.visible.inflate(BRICK_WIDTH + BRICK_PADDING, BRICK_WIDTH + BRICK_PADDING)
+        self.assertTrue(all(area.colliderect(brick.rect) for brick in visible))
+        self.assertEqual(len(capture_snapshot(self.game).bricks), len(visible))
+        self.game.render()
+
+    def test_particles_out_of_view_are_skipped(self):
+        """Test that bursts far outside the view add no particles"""
+        self._load_huge_level()
+        view = self.game.camera.view
+        self.game._add_particles(view.right + CULL_MARGIN + 50, view.centery, (255, 0, 0), 10)
+        self.assertEqual(self.game.particles, [])
+        self.game._add_particles(view.centerx, view.centery, (255, 0, 0), 10)
+        self.assertGreater(len(self.game.particles), 0)
+
+    def test_particles_are_culled_and_dropped(self):
+        """Test that particles out of view aren't drawn and those out of the world are dropped"""
+        self._load_huge_level()
+        game = self.game
+        view = game.camera.view
+        game._add_particles(view.centerx, view.centery, (255, 0, 0), 10)
+        count = len(game.particles)
+        for particle in game.particles:
+            particle.x = visible_area(game.camera_offset).right + 50
+        self.assertLess(game.particles[0].x, game.world.right)
+
+        with tempfile.TemporaryDirectory() as directory:
+            tracker = AllocationTracker(output_dir=directory)
+            tracker.start()
+            tracker.begin_frame()
+            game._draw_particles(offset=game.camera_offset)
+            tracker.end_frame()
+            tracker.stop()
+        self.assertEqual(tracker.history[-1]['surfaces'], 0)
+
+        game._update_particles()
+        self.assertEqual(len(game.particles), count)
+        for particle in game.particles:
+            particle.x = game.world.right + 10
+        game._update_particles()
+        self.assertEqual(game.particles, [])
+
+    def test_snapshot_carries_camera_offset(self):
+        """Test that pipelined frames are drawn from the camera position they were captured at"""
+        self._load_huge_level()
+        self.assertEqual(capture_snapshot(self.game).camera_offset, self.game.camera_offset)
+        self.assertNotEqual(self.game.camera_offset, (0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
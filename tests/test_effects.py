@@ -0,0 +1,111 @@
+"""
+Tests for the batched effect queue
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.effects import EffectQueue
+from src.game import Game
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestEffectQueue(unittest.TestCase):
+    def test_sounds_and_shakes_merge(self):
+        """Test that repeated sounds play once and the strongest shake wins"""
+        queue = EffectQueue()
+        for _ in range(20):
+            queue.sound('bounce')
+        queue.sound('brick_break')
+        queue.sound('bounce')
+        queue.shake(3, 100)
+        queue.shake(2, 150)
+
+        self.assertEqual(list(queue.sounds), ['bounce', 'brick_break'])
+        self.assertEqual((queue.shake_amount, queue.shake_duration), (3, 150))
+
+    def test_bursts_within_budget_are_untouched(self):
+        """Test that a quiet step keeps every particle"""
+        queue = EffectQueue(particle_budget=100)
+        queue.burst(10, 20, (255, 0, 0), 15)
+        queue.burst(30, 40, (0, 255, 0), 5)
+        self.assertEqual(queue.coalesced_bursts(), [(10, 20, (255, 0, 0), 15), (30, 40, (0, 255, 0), 5)])
+
+    def test_bursts_are_thinned_to_the_budget(self):
+        """Test that a busy step spends at most the particle budget"""
+        queue = EffectQueue(particle_budget=100)
+        for i in range(50):
+            queue.burst(i, i, (255, 0, 0), 15)
+        bursts = queue.coalesced_bursts()
+        self.assertLessEqual(sum(count for _, _, _, count in bursts), 100)
+        self.assertTrue(all(count >= 1 for _, _, _, count in bursts))
+        self.assertEqual(bursts[0][:2], (0, 0))
+
+    def test_clear_empties_the_queue(self):
+        """Test that a cleared queue is falsy"""
+        queue = EffectQueue()
+        queue.burst(0, 0, (0, 0, 0), 1)
+        queue.sound('bounce')
+        queue.shake(3, 100)
+        self.assertTrue(queue)
+        queue.clear()
+        self.assertFalse(queue)
+        self.assertEqual(queue.coalesced_bursts(), [])
+
+class TestGameEffects(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.show_instructions = False
+        self.played = []
+        self.game._play_sound = self.played.append
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _queue_hits(self, hits):
+        """Queue what `hits` brick breaks in one step would ask for"""
+        fx = self.game.effect_queue
+        for i in range(hits):
+            fx.burst(100 + i, 100, (255, 0, 0), 15)
+            fx.shake(3, 100)
+            fx.sound('brick_break')
+
+    def test_step_applies_effects_once(self):
+        """Test that many hits in one step give one sound and bounded particles"""
+        self._queue_hits(100)
+        self.game._apply_effects()
+
+        self.assertEqual(self.played, ['brick_break'])
+        self.assertEqual(self.game.shake_amount, 3)
+        self.assertLessEqual(len(self.game.particles), self.game.effect_queue.particle_budget)
+        self.assertGreater(len(self.game.particles), 0)
+        self.assertFalse(self.game.effect_queue)
+
+    def test_skipped_update_drops_effects(self):
+        """Test that effects queued by an undrawn turbo update are discarded"""
+        self.game.effects = False
+        self._queue_hits(3)
+        self.game._apply_effects()
+
+        self.assertEqual(self.played, [])
+        self.assertEqual(self.game.particles, [])
+        self.assertEqual(self.game.shake_amount, 0)
+        self.assertFalse(self.game.effect_queue)
+
+    def test_level_complete_sound_plays_once(self):
+        """Test that the level-complete sound isn't restarted on every step after the level ends"""
+        self.game.load_layout(["X"])
+        for _ in range(10):
+            self.game.update()
+        self.assertTrue(self.game.level_complete)
+        self.assertEqual(self.played.count('level_complete'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
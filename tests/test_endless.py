@@ -0,0 +1,154 @@
+"""
+Tests for endless mode
+"""
+import random
+import tempfile
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.alloc_tracker import AllocationTracker
+from src.game import Game
+from src.rewind import capture_state, restore_state
+from src.settings import (SCREEN_WIDTH, SCREEN_HEIGHT, ENDLESS_FLOOR_Y, ENDLESS_ROW_BONUS,
+                          BRICK_HEIGHT, BRICK_PADDING)
+
+class TestEndless(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _make_game(self, seed=0):
+        """Create a game in endless mode"""
+        random.seed(5)
+        game = Game(self.screen)
+        game.show_instructions = False
+        game.endless.enabled = True
+        game.endless.seed = seed
+        game.load_endless()
+        return game
+
+    def _rows(self, game):
+        """Return the live bricks as (position, type) pairs"""
+        return sorted((brick.rect.topleft, brick.brick_type.id) for brick in game.bricks)
+
+    def _scroll(self, game, pixels):
+        """Scroll the field without playing"""
+        game.endless.update(game.bricks, game.brick_grid, pixels)
+        game.bricks.flush()
+
+    def test_same_seed_same_rows(self):
+        """Test that a seed always generates the same rows"""
+        first = self._make_game(seed=42)
+        second = self._make_game(seed=42)
+        other = self._make_game(seed=43)
+        self.assertEqual(self._rows(first), self._rows(second))
+        self.assertNotEqual(self._rows(first), self._rows(other))
+
+    def test_rows_are_recycled_not_reallocated(self):
+        """Test that scrolling for a long time reuses the same bricks"""
+        game = self._make_game()
+        bricks = list(game.level_bricks)
+        for _ in range(200):
+            self._scroll(game, 20)
+        self.assertGreater(game.endless.bottom, 100)
+        self.assertEqual(len(game.level_bricks), len(bricks))
+        self.assertTrue(all(a is b for a, b in zip(game.level_bricks, bricks)))
+        # Every row in play is still above the floor
+        self.assertTrue(all(brick.rect.top <= ENDLESS_FLOOR_Y for brick in game.bricks))
+
+    def test_recycled_rows_allocate_no_surfaces(self):
+        """Test that once every brick type has been seen, recycling rows builds no images"""
+        game = self._make_game()
+        for _ in range(100):
+            self._scroll(game, 20)
+        with tempfile.TemporaryDirectory() as directory:
+            tracker = AllocationTracker(output_dir=directory)
+            tracker.start()
+            tracker.begin_frame()
+            for _ in range(100):
+                self._scroll(game, 20)
+            tracker.end_frame()
+            tracker.stop()
+        self.assertEqual(tracker.history[-1]['surfaces'], 0)
+
+    def test_scrolled_rows_match_fresh_generation(self):
+        """Test that a recycled field equals one placed straight at the same scroll"""
+        scrolled = self._make_game(seed=7)
+        for _ in range(50):
+            self._scroll(scrolled, 13)
+        placed = self._make_game(seed=7)
+        placed.endless.restore(placed.bricks, placed.brick_grid, scrolled.endless.scroll, 0)
+        placed.bricks.flush()
+        self.assertEqual(self._rows(scrolled), self._rows(placed))
+
+    def test_grid_follows_the_scroll(self):
+        """Test that the brick grid still finds every live brick after scrolling"""
+        game = self._make_game()
+        for _ in range(30):
+            self._scroll(game, 3)
+        for brick in game.bricks:
+            cell = game.brick_grid.cell_of(brick)
+            self.assertIs(game.brick_grid.cells.get(cell), brick)
+
+    def test_clearing_a_row_scores_a_bonus(self):
+        """Test that breaking a row's last breakable brick counts the row"""
+        game = self._make_game()
+        endless = game.endless
+        slot = next(slot for slot in range(endless.rows) if endless.remaining[slot] > 0)
+        row = [brick for brick in endless.bricks[slot * endless.columns:(slot + 1) * endless.columns]
+               if brick.is_breakable and brick in game.bricks]
+        bonus = 0
+        for brick in row:
+            bonus += endless.brick_broken(brick)
+        self.assertEqual(bonus, ENDLESS_ROW_BONUS)
+        self.assertEqual(endless.rows_cleared, 1)
+        self.assertEqual(game.rows_cleared, 1)
+
+    def test_never_completes_a_level(self):
+        """Test that breaking every brick doesn't end the game in endless mode"""
+        game = self._make_game()
+        for brick in list(game.bricks):
+            game.bricks.remove(brick)
+            game.brick_grid.remove(brick)
+        game.update()
+        self.assertFalse(game.level_complete)
+
+    def test_rewind_restores_recycled_rows(self):
+        """Test that restoring a state puts back rows recycled since"""
+        game = self._make_game()
+        self._scroll(game, 100)
+        state = capture_state(game)
+        rows = self._rows(game)
+        remaining = list(game.endless.remaining)
+        for _ in range(20):
+            self._scroll(game, BRICK_HEIGHT + BRICK_PADDING)
+        self.assertNotEqual(self._rows(game), rows)
+        restore_state(game, state)
+        game.bricks.flush()
+        self.assertEqual(self._rows(game), rows)
+        self.assertEqual(game.endless.remaining, remaining)
+
+    def test_toggle_with_e(self):
+        """Test that E switches between levels and endless mode"""
+        game = Game(self.screen)
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e)
+        game.handle_events(event)
+        self.assertTrue(game.endless.enabled)
+        self.assertIs(game.level_bricks, game.endless.bricks)
+        self.assertIsNotNone(game.rows_cleared)
+        game.handle_events(event)
+        self.assertFalse(game.endless.enabled)
+        self.assertIsNone(game.rows_cleared)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the entity store
+"""
+import unittest
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.entities import EntityStore
+
+class Entity:
+    """Hashable stand-in for a sprite"""
+
+class TestEntityStore(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.entities = [Entity() for _ in range(5)]
+        self.store = EntityStore(self.entities)
+
+    def test_removal_is_deferred_until_flush(self):
+        """Test that removed entities stop counting at once but keep their slots"""
+        a, b = self.entities[:2]
+        self.store.remove(a)
+        self.assertNotIn(a, self.store)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(len(self.store._items), 5)
+        self.assertNotIn(a, list(self.store))
+
+        self.store.flush()
+        self.assertEqual(len(self.store._items), 4)
+        self.assertEqual(self.store.first(), self.entities[4])  # The last moved into slot 0
+        self.assertIn(b, self.store)
+
+    def test_iteration_survives_removal_and_addition(self):
+        """Test that iterating while removing and adding visits each original entity once"""
+        seen = []
+        for entity in self.store:
+            seen.append(entity)
+            self.store.remove(entity)
+            self.store.add(Entity())
+        self.assertEqual(seen, self.entities)
+        self.store.flush()
+        self.assertEqual(len(self.store), 5)
+        self.assertFalse(any(entity in self.store for entity in self.entities))
+
+    def test_removal_ahead_of_the_cursor_is_skipped(self):
+        """Test that an entity removed mid-pass isn't reached, even when nothing else was dead"""
+        seen = []
+        for entity in self.store:
+            seen.append(entity)
+            if entity is self.entities[1]:
+                self.store.remove(self.entities[3])
+        self.assertEqual(seen, [e for e in self.entities if e is not self.entities[3]])
+
+    def test_add_revives_pending_removal(self):
+        """Test that re-adding an entity before the flush keeps it"""
+        entity = self.entities[2]
+        self.store.remove(entity)
+        self.store.add(entity)
+        self.store.flush()
+        self.assertTrue(self.store.has(entity))
+        self.assertEqual(len(self.store), 5)
+
+    def test_empty(self):
+        """Test that empty() drops everything, pending or not"""
+        self.store.remove(self.entities[0])
+        self.store.empty()
+        self.assertFalse(self.store)
+        self.assertIsNone(self.store.first())
+        self.assertEqual(self.store.sprites(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the frame timer
+"""
+import unittest
+import json
+import tempfile
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.frame_timer import FrameTimer, percentile
+from src.game import Game
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestFrameTimer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_disabled_timer_records_nothing(self):
+        """Test that a disabled timer collects no samples"""
+        timer = FrameTimer()
+        timer.begin_frame()
+        timer.lap('paddle')
+        timer.end_frame()
+        self.assertEqual(len(timer.frame_times), 0)
+        self.assertEqual(timer.phases, {})
+
+    def test_game_phases_are_recorded(self):
+        """Test that update and render phases show up once enabled"""
+        game = Game(self.screen)
+        game.font = pygame.font.Font(None, 24)
+        game.show_instructions = False
+        game.frame_timer.toggle()
+        for _ in range(3):
+            game.frame_timer.begin_frame()
+            game.update()
+            game.render()
+            game.frame_timer.end_frame()
+
+        stats = game.frame_timer.stats()
+        for phase in ('paddle', 'ball_move', 'brick_collision', 'background', 'bricks', 'hud'):
+            self.assertIn(phase, stats)
+        self.assertEqual(len(game.frame_timer.frame_times), 3)
+
+    def test_percentile(self):
+        """Test percentile selection on sorted samples"""
+        samples = [float(i) for i in range(100)]
+        self.assertEqual(percentile(samples, 0.5), 50.0)
+        self.assertEqual(percentile(samples, 0.99), 99.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_export_json(self):
+        """Test that the JSON export contains the summary"""
+        timer = FrameTimer()
+        timer.toggle()
+        timer.begin_frame()
+        timer.lap('flip')
+        timer.end_frame()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'frames.json')
+            timer.export_json(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(data['frames'], 1)
+        self.assertIn('flip', data['stats'])
+
+if __name__ == '__main__':
+    unittest.main()
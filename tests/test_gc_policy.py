@@ -0,0 +1,53 @@
+"""
+Tests for the garbage-collector policy
+"""
+import unittest
+import gc
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gc_policy import GCPolicy, PAUSE_MONITOR
+
+class TestGCPolicy(unittest.TestCase):
+    def tearDown(self):
+        """Restore CPython's default collector behaviour"""
+        gc.unfreeze()
+        gc.enable()
+
+    def test_collection_deferred_during_play(self):
+        """Test that automatic collection is off while playing"""
+        policy = GCPolicy(enabled=True)
+        policy.step(active=True)
+        self.assertFalse(gc.isenabled())
+        self.assertTrue(policy.deferred)
+
+    def test_idle_collects_and_reenables(self):
+        """Test that idle screens run a collection and re-enable the collector"""
+        policy = GCPolicy(enabled=True)
+        policy.step(active=True)
+        policy.step(active=False)
+        self.assertTrue(gc.isenabled())
+        self.assertFalse(policy.deferred)
+        self.assertGreater(PAUSE_MONITOR.pending_collections, 0)
+
+    def test_pauses_are_recorded_per_frame(self):
+        """Test that pause time is attributed to the next frame"""
+        policy = GCPolicy(enabled=False)
+        PAUSE_MONITOR.claim()
+        gc.collect()
+        policy.step(active=True)
+        self.assertEqual(len(policy.pauses), 1)
+        self.assertGreater(policy.pauses[-1], 0)
+        self.assertEqual(policy.stats()['max_ms'], policy.pauses[-1])
+
+    def test_disabled_policy_leaves_gc_alone(self):
+        """Test that a disabled policy never turns the collector off"""
+        policy = GCPolicy(enabled=False)
+        policy.step(active=True)
+        self.assertTrue(gc.isenabled())
+
+if __name__ == '__main__':
+    unittest.main()
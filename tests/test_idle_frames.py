@@ -0,0 +1,85 @@
+"""
+Tests for frame reuse on frozen screens
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.render_scale import internal_size
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestIdleFrames(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.font = pygame.font.Font(None, 24)
+        self.game.show_instructions = False
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_idle_screen_names(self):
+        """Test which states count as frozen screens"""
+        self.assertIsNone(self.game.idle_screen())
+        self.game.paused = True
+        self.assertEqual(self.game.idle_screen(), "paused")
+        self.game.game_over = True
+        self.assertEqual(self.game.idle_screen(), "game_over")
+        self.game.show_instructions = True
+        self.assertEqual(self.game.idle_screen(), "instructions")
+
+    def test_paused_frame_is_reused(self):
+        """Test that a paused scene isn't redrawn from the game objects"""
+        self.game.paused = True
+        self.game.render()
+        self.game.paddle.rect.x += 300  # Would move on a full redraw
+        old_center = (self.game.paddle.rect.centerx - 300, self.game.paddle.rect.centery)
+        self.game.render()
+        self.assertEqual(self.screen.get_at(old_center)[:3], (255, 255, 255))
+
+    def test_leaving_idle_redraws(self):
+        """Test that the cached frame is dropped once play resumes"""
+        self.game.paused = True
+        self.game.render()
+        self.game.paused = False
+        self.game.paddle.rect.x += 300
+        self.game.render()
+        self.assertIsNone(self.game._idle_key)
+        self.assertEqual(self.screen.get_at(self.game.paddle.rect.center)[:3], (255, 255, 255))
+
+    def test_game_over_keeps_prompt_animating(self):
+        """Test that the prompt is still drawn over the reused frame"""
+        self.game.game_over = True
+        self.game.render()
+        self.game.render()
+        self.assertEqual(self.game._idle_key[0], "game_over")
+        self.assertTrue(self.game._prompt_surfaces)
+
+    def test_prompt_shows_on_an_internal_size_display(self):
+        """Test that the prompt is scaled onto a display at the internal resolution"""
+        display = pygame.Surface(internal_size(0.5))
+        game = Game(display, 0.5, True)
+        game.font = pygame.font.Font(None, 24)
+        game.show_instructions = False
+        game.game_over = True
+        game.render()
+        game.render()
+
+        # The prompt is the only difference from the frozen frame
+        center = (SCREEN_WIDTH // 4, (SCREEN_HEIGHT // 2 + 30) // 2)
+        area = pygame.Rect(0, 0, 60, 10)
+        area.center = center
+        changed = [(x, y) for x in range(area.left, area.right) for y in range(area.top, area.bottom)
+                   if display.get_at((x, y)) != game._idle_frame.get_at((x, y))]
+        self.assertTrue(changed)
+
+if __name__ == '__main__':
+    unittest.main()
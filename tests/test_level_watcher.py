@@ -0,0 +1,148 @@
+"""
+Tests for level hot-reload
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import pygame
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.level_watcher import LevelWatcher
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+LAYOUT = [
+    "1111",
+    "2222",
+    "X  X",
+]
+
+class TestLevelWatcher(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "level.json")
+        self._write(LAYOUT)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.directory)
+        pygame.quit()
+
+    def _write(self, layout, text=None):
+        """Save a level file and give it a fresh modification time"""
+        with open(self.path, 'w') as f:
+            f.write(json.dumps({"layout": layout}) if text is None else text)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _make_game(self):
+        """Create a game playing LAYOUT"""
+        game = Game(self.screen)
+        game.show_instructions = False
+        game.load_layout(LAYOUT)
+        return game
+
+    def _cells(self, game):
+        """Return the live bricks keyed by position"""
+        return {brick.rect.topleft: brick for brick in game.bricks}
+
+    def test_poll_queues_changed_files_only(self):
+        """Test that only edited files are parsed and queued"""
+        watcher = LevelWatcher([self.path])
+        self.assertEqual(watcher.poll(), 0)
+        self._write(["1"])
+        self.assertEqual(watcher.poll(), 1)
+        self.assertEqual(watcher.pending(), [(0, ["1"])])
+        self.assertEqual(watcher.poll(), 0)
+        self.assertEqual(watcher.pending(), [])
+
+    def test_unparsable_file_is_skipped(self):
+        """Test that a half-written file is ignored until it changes again"""
+        watcher = LevelWatcher([self.path])
+        self._write(None, text='{"layout": ["11')
+        self.assertEqual(watcher.poll(), 0)
+        self._write(["11"])
+        self.assertEqual(watcher.poll(), 1)
+
+    def test_watcher_thread_stops(self):
+        """Test that the polling thread picks up edits and stops cleanly"""
+        watcher = LevelWatcher([self.path], interval=0.01)
+        watcher.start()
+        self._write(["3"])
+        change = watcher.changes.get(timeout=2)
+        watcher.stop()
+        self.assertEqual(change, (0, ["3"]))
+        self.assertFalse(watcher.is_alive())
+
+    def test_reload_only_touches_changed_cells(self):
+        """Test that unchanged bricks, balls and score survive an edit"""
+        game = self._make_game()
+        before = self._cells(game)
+        damaged = game._layout_cells[(1, 0)]
+        damaged.hits_left = 1
+        broken = game._layout_cells[(0, 3)]
+        game.bricks.remove(broken)
+        game.brick_grid.remove(broken)
+        game.score = 120
+        ball = game.balls.first()
+        removed = game._layout_cells[(0, 1)]
+
+        game.reload_layout(["1 11", "2232", "X1 X"])
+        game.bricks.flush()
+        after = self._cells(game)
+
+        # Edited cells: removed, retyped and added
+        self.assertNotIn(removed, game.bricks)
+        self.assertNotIn(removed, game.level_bricks)
+        self.assertEqual(game._layout_cells[(1, 2)].brick_type.id, "3")
+        self.assertEqual(game._layout_cells[(1, 2)].hits_left, 3)
+        self.assertEqual(game._layout_cells[(2, 1)].brick_type.id, "1")
+        self.assertIn(game._layout_cells[(2, 1)], game.level_bricks)
+
+        # Untouched cells keep their brick, its damage and its broken state
+        self.assertIs(game._layout_cells[(1, 0)], damaged)
+        self.assertEqual(damaged.hits_left, 1)
+        self.assertNotIn(broken, game.bricks)
+        for position in set(before) & set(after):
+            self.assertIs(before[position], after[position])
+        self.assertEqual(len(after), 9)
+        self.assertEqual(len(game.brick_grid.cells), len(game.bricks))
+        self.assertEqual(game.score, 120)
+        self.assertIs(game.balls.first(), ball)
+        self.assertEqual(game.level_layout, ["1 11", "2232", "X1 X"])
+
+    def test_resized_layout_rebuilds_the_field(self):
+        """Test that a change of width falls back to a full load"""
+        game = self._make_game()
+        game.score = 50
+        old = set(game.bricks)
+
+        game.reload_layout(["11111", "22222"])
+
+        self.assertEqual(len(game.bricks), 10)
+        self.assertFalse(old & set(game.bricks))
+        self.assertEqual(game.score, 50)
+
+    def test_step_applies_edits_to_the_current_level(self):
+        """Test that a watched edit reaches the field on the next update"""
+        game = self._make_game()
+        game.level_watcher = LevelWatcher([self.path])
+        game.level = 0
+        self._write(["1111", "2222", "XXXX"])
+        game.level_watcher.poll()
+
+        game.update()
+
+        self.assertEqual(game.level_layout, ["1111", "2222", "XXXX"])
+        self.assertEqual(len(game.bricks), 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the pipelined simulation thread and frame snapshots
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.pipeline import SimulationThread, SnapshotBuffer, capture_snapshot
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.font = pygame.font.Font(None, 24)
+        self.game.show_instructions = False
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_snapshot_is_detached_from_game(self):
+        """Test that later simulation steps don't change a captured snapshot"""
+        ball = next(iter(self.game.balls))
+        ball.launch()
+        snapshot = capture_snapshot(self.game)
+        position = snapshot.balls[0].rect.center
+        for _ in range(5):
+            self.game.update()
+        self.assertNotEqual(ball.rect.center, position)
+        self.assertEqual(snapshot.balls[0].rect.center, position)
+        self.assertEqual(len(snapshot.bricks), len(self.game.level_bricks))
+
+    def test_render_from_snapshot(self):
+        """Test that rendering a snapshot draws its state, not the live game's"""
+        snapshot = capture_snapshot(self.game)
+        self.game.paddle.rect.x += 200
+        self.game.render(snapshot)
+        self.assertEqual(self.screen.get_at(snapshot.paddle.rect.center)[:3], (255, 255, 255))
+
+    def test_brick_redraw_swaps_image(self):
+        """Test that damaging a brick leaves the snapshot's image untouched"""
+        brick = next(b for b in self.game.level_bricks if b.hits_left > 1)
+        image = brick.image
+        brick.hit()
+        self.assertIsNot(brick.image, image)
+
+    def test_simulation_thread_applies_events_and_publishes(self):
+        """Test that queued events reach the game and each step is published"""
+        buffer = SnapshotBuffer()
+        simulation = SimulationThread(self.game, buffer)
+        simulation.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        simulation.start()
+        snapshot = buffer.wait_newer(0, 1.0)
+        simulation.stop()
+        self.assertIsNone(simulation.error)
+        self.assertGreater(snapshot.tick, 0)
+        self.assertTrue(snapshot.paused)
+
+    def test_render_from_snapshot_reads_no_brick_grid(self):
+        """Test that the aim preview is traced when the snapshot is captured"""
+        self.game.aim_preview = True
+        snapshot = capture_snapshot(self.game)
+        self.assertTrue(snapshot.aim_preview_dots)
+        self.assertEqual(list(snapshot.aim_preview_dots), self.game.aim_dots())
+        self.game.brick_grid = None
+        self.game.render(snapshot)
+
+    def test_simulation_thread_times_updates_separately(self):
+        """Test that updates on the worker thread don't lap the render thread's timer"""
+        self.game.frame_timer.toggle()
+        self.game.frame_timer.begin_frame()
+        simulation = SimulationThread(self.game, SnapshotBuffer())
+        simulation.start()
+        simulation.buffer.wait_newer(2, 1.0)
+        simulation.stop()
+        self.assertIsNone(simulation.error)
+        self.assertTrue(simulation.timer.frame_times)
+        self.assertIn('paddle', simulation.timer.phases)
+        self.assertNotIn('paddle', self.game.frame_timer._current)
+        self.assertIs(self.game.update_timer, self.game.frame_timer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for object pools and the pooled sprites
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.pools import Pool
+from src.sprites import Ball, PowerUp, Particle
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_SPEED, BALL_POOL_SIZE
+
+class TestPools(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_pool_reuses_released_objects(self):
+        """Test that a released object comes back reset instead of a new one being built"""
+        pool = Pool(Particle, 1)
+        particle = pool.acquire(1, 2, 0, 0, 3, (255, 0, 0), 10)
+        pool.release(particle)
+        again = pool.acquire(5, 6, 0, 0, 3, (0, 255, 0), 20)
+        self.assertIs(again, particle)
+        self.assertEqual((again.x, again.y, again.lifetime), (5, 6, 20))
+
+        pool.acquire(0, 0, 0, 0, 1, (0, 0, 0), 1)  # Pool is dry: builds one more
+        self.assertEqual(pool.created, 2)
+
+    def test_ball_reset_matches_new_ball(self):
+        """Test that reset() clears everything a ball picks up in play"""
+        ball = Ball(100, 100)
+        image = ball.image
+        ball.is_active = ball.is_slow = True
+        ball.speed = BALL_SPEED / 2
+        ball.trail.append((1, 2))
+        ball.reset(300, 400)
+        self.assertEqual(ball.rect.center, (300, 400))
+        self.assertFalse(ball.is_active or ball.is_slow or ball.trail)
+        self.assertEqual(ball.speed, BALL_SPEED)
+        self.assertIs(ball.image, image)
+
+    def test_powerup_redraws_only_on_type_change(self):
+        """Test that reusing a power-up keeps its surface unless the type changes"""
+        powerup = PowerUp(0, 0, "WIDE")
+        image = powerup.image
+        powerup.angle = 90
+        powerup.reset(50, 60, "WIDE")
+        self.assertIs(powerup.image, image)
+        self.assertEqual((powerup.rect.center, powerup.angle), ((50, 60), 0))
+
+        # A new type is drawn on a new surface; the old one, which a frame
+        # snapshot may still be drawing, is left as it was
+        pixels = pygame.image.tobytes(image, 'RGBA')
+        powerup.reset(50, 60, "SLOW")
+        self.assertIsNot(powerup.image, image)
+        self.assertEqual(pygame.image.tobytes(image, 'RGBA'), pixels)
+        self.assertEqual(powerup.type, "SLOW")
+
+    def test_sprites_use_slots(self):
+        """Test that pooled objects carry no per-instance dict"""
+        for item in (Ball(), PowerUp(0, 0, "WIDE"), Particle()):
+            self.assertFalse(hasattr(item, '__dict__'))
+
+    def test_game_recycles_lost_balls(self):
+        """Test that a lost ball goes back to the pool and MULTI takes it out again"""
+        game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        game.show_instructions = False
+        self.assertEqual(len(game.ball_pool.free), BALL_POOL_SIZE - 1)
+        game._apply_powerup("MULTI")
+        lost = next(ball for ball in game.balls if ball is not game.original_ball)
+        lost.rect.top = SCREEN_HEIGHT + 20
+        game.update()
+        self.assertIn(lost, game.ball_pool.free)
+
+        game._apply_powerup("MULTI")
+        self.assertIn(lost, game.balls)
+        self.assertEqual(game.ball_pool.created, BALL_POOL_SIZE)
+
+    def test_game_recycles_particles(self):
+        """Test that expired particles return to the pool"""
+        game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        game._add_particles(100, 100, (255, 255, 255), 10)
+        spawned = list(game.particles)
+        for _ in range(41):  # Longest lifetime is 40 frames
+            game._update_particles()
+        self.assertEqual(game.particles, [])
+        self.assertTrue(all(particle in game.particle_pool.free for particle in spawned))
+
+if __name__ == '__main__':
+    unittest.main()
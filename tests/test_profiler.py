@@ -0,0 +1,64 @@
+"""
+Tests for the sampling profiler
+"""
+import unittest
+import json
+import tempfile
+import time
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.profiler import SamplingProfiler
+
+def busy_loop(seconds):
+    """Spin for the given time"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.directory.cleanup()
+
+    def test_collapsed_output_names_functions(self):
+        """Test that sampled stacks are attributed to the running function"""
+        profiler = SamplingProfiler(output_dir=self.directory.name)
+        profiler.start()
+        busy_loop(0.2)
+        path = profiler.stop()
+
+        self.assertFalse(profiler.running)
+        self.assertGreater(profiler.samples, 0)
+        with open(path) as f:
+            content = f.read()
+        self.assertIn('test_profiler:busy_loop', content)
+        self.assertIn('test_profiler:TestProfiler.test_collapsed_output_names_functions', content)
+
+    def test_speedscope_output(self):
+        """Test that the speedscope file has one weight per sample"""
+        profiler = SamplingProfiler(output_dir=self.directory.name, output_format='speedscope')
+        profiler.start()
+        busy_loop(0.1)
+        path = profiler.stop()
+
+        with open(path) as f:
+            data = json.load(f)
+        profile = data['profiles'][0]
+        self.assertEqual(len(profile['samples']), len(profile['weights']))
+        names = [frame['name'] for frame in data['shared']['frames']]
+        self.assertIn('test_profiler:busy_loop', names)
+
+    def test_stop_when_not_running(self):
+        """Test that stopping an idle profiler is a no-op"""
+        self.assertIsNone(SamplingProfiler(output_dir=self.directory.name).stop())
+
+if __name__ == '__main__':
+    unittest.main()
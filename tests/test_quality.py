@@ -0,0 +1,54 @@
+"""
+Tests for the adaptive quality governor
+"""
+import unittest
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.quality import QualityGovernor, QUALITY_LEVELS
+from src.settings import QUALITY_DEGRADE_FRAMES, QUALITY_RESTORE_FRAMES
+
+class TestQualityGovernor(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.governor = QualityGovernor(budget_ms=16.0, enabled=True)
+
+    def feed(self, ms, frames):
+        """Observe the same frame time repeatedly"""
+        for _ in range(frames):
+            self.governor.observe(ms)
+
+    def test_degrades_when_over_budget(self):
+        """Test that sustained slow frames lower the quality level"""
+        self.feed(40.0, 200)
+        self.assertGreater(self.governor.level, 0)
+        self.assertLess(self.governor.particle_scale, 1.0)
+
+    def test_single_spike_does_not_degrade(self):
+        """Test that one slow frame is absorbed by the rolling estimate"""
+        self.feed(5.0, 100)
+        self.feed(100.0, 1)
+        self.feed(5.0, QUALITY_DEGRADE_FRAMES)
+        self.assertEqual(self.governor.level, 0)
+
+    def test_restores_with_headroom(self):
+        """Test that quality climbs back once frames are fast again"""
+        self.feed(40.0, 1000)
+        self.assertEqual(self.governor.level, len(QUALITY_LEVELS) - 1)
+        self.assertFalse(self.governor.shadows)
+        self.feed(2.0, QUALITY_RESTORE_FRAMES * (len(QUALITY_LEVELS) + 2))
+        self.assertEqual(self.governor.level, 0)
+        self.assertTrue(self.governor.glow)
+
+    def test_disabled_governor_stays_at_full(self):
+        """Test that a disabled governor ignores frame times"""
+        governor = QualityGovernor(enabled=False)
+        for _ in range(500):
+            governor.observe(100.0)
+        self.assertEqual(governor.level, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for internal render resolution scaling
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.render_scale import ScaledTarget, internal_size, scale_rect
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestRenderScale(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.display = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def make_game(self, scale, native_hud):
+        """Create a game rendering at the given scale"""
+        game = Game(self.display, scale, native_hud)
+        game.font = pygame.font.Font(None, 24)
+        return game
+
+    def test_full_scale_draws_straight_to_display(self):
+        """Test that a scale of 1 keeps a single render target"""
+        game = self.make_game(1.0, True)
+        self.assertIs(game.screen, self.display)
+        self.assertIs(game.ui_screen, self.display)
+
+    def test_half_scale_uses_small_scene(self):
+        """Test that the scene is rendered at the internal size and upscaled"""
+        game = self.make_game(0.5, True)
+        self.assertEqual(game.screen.get_size(), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.assertIs(game.ui_screen, self.display)
+        game.show_instructions = False
+        game.render()
+
+        # A brick drawn on the small scene shows up at its logical position
+        brick = game.level_bricks[0]
+        color = self.display.get_at(brick.rect.center)[:3]
+        self.assertEqual(color, game.screen.get_at((brick.rect.centerx // 2, brick.rect.centery // 2))[:3])
+
+    def test_non_native_hud_draws_on_scene(self):
+        """Test that the HUD can be drawn at internal resolution"""
+        game = self.make_game(0.5, False)
+        self.assertEqual(type(game.ui_screen).__name__, ScaledTarget.__name__)
+        game.render()
+
+    def test_scaled_display_is_used_directly(self):
+        """Test that a display already at the internal size is drawn into directly"""
+        display = pygame.Surface(internal_size(0.5))
+        game = Game(display, 0.5, True)
+        self.assertIs(game.screen, display)
+        self.assertFalse(game.ui_native)
+
+    def test_scale_rect(self):
+        """Test mapping logical rects onto the internal surface"""
+        rect = pygame.Rect(100, 50, 80, 30)
+        self.assertIs(scale_rect(rect, 1), rect)
+        self.assertEqual(scale_rect(rect, 0.5), pygame.Rect(50, 25, 40, 15))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for the renderer backends
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.renderers import SurfaceRenderer, TextureRenderer, Window
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+@unittest.skipIf(Window is None, "pygame._sdl2.video is not available")
+class TestTextureRenderer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.renderer = TextureRenderer.open(accelerated=0, hidden=True)
+        self.game = Game(self.renderer.screen)
+        self.game.font = pygame.font.Font(None, 24)
+        self.game.show_instructions = False
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_bricks_are_drawn(self):
+        """Test that a brick's colour ends up at its centre"""
+        self.renderer.draw(self.game)
+        frame = self.renderer.renderer.to_surface()
+        brick = next(iter(self.game.bricks))
+        expected = brick.image.get_at((brick.rect.width // 2, brick.rect.height // 2))
+        self.assertEqual(frame.get_at(brick.rect.center)[:3], expected[:3])
+
+    def test_textures_are_cached_between_frames(self):
+        """Test that a second frame uploads no new sprite textures"""
+        self.renderer.draw(self.game)
+        count = len(self.renderer._textures)
+        self.renderer.draw(self.game)
+        self.assertEqual(len(self.renderer._textures), count)
+
+    def test_matches_surface_renderer(self):
+        """Test that both backends draw the same brick pixels"""
+        display = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        reference = Game(display)
+        reference.font = pygame.font.Font(None, 24)
+        reference.show_instructions = False
+        SurfaceRenderer(display).draw(reference)
+        self.renderer.draw(self.game)
+        frame = self.renderer.renderer.to_surface()
+        for brick in list(self.game.bricks)[:5]:
+            self.assertEqual(frame.get_at(brick.rect.center), display.get_at(brick.rect.center))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the rewind buffer
+"""
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.rewind import RewindBuffer, capture_state, encode_delta
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestRewind(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.show_instructions = False
+        for ball in self.game.balls:
+            ball.launch()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_step_back_restores_ball_and_score(self):
+        """Test that stepping back restores the previous frame"""
+        self.game.update()
+        ball = self.game.original_ball
+        position = ball.rect.topleft
+        velocity = (ball.dx, ball.dy)
+        score = self.game.score
+
+        self.game.update()
+        self.game.score += 100
+        self.assertTrue(self.game.rewind.step_back(self.game))
+
+        self.assertEqual(self.game.original_ball.rect.topleft, position)
+        self.assertEqual((self.game.original_ball.dx, self.game.original_ball.dy), velocity)
+        self.assertEqual(self.game.score, score)
+
+    def test_broken_brick_is_restored(self):
+        """Test that a brick removed after a snapshot comes back on rewind"""
+        self.game.rewind.record(self.game)
+        brick = self.game.level_bricks[0]
+        hits = brick.hits_left
+        self.game.bricks.remove(brick)
+        self.game.rewind.record(self.game)
+
+        self.game.rewind.step_back(self.game)
+        self.assertTrue(self.game.bricks.has(brick))
+        self.assertEqual(brick.hits_left, hits)
+
+    def test_ring_buffer_is_bounded(self):
+        """Test that old frames are evicted once capacity is reached"""
+        buffer = RewindBuffer(seconds=1, fps=20, keyframe_interval=5)
+        for _ in range(100):
+            buffer.record(self.game)
+        self.assertLessEqual(len(buffer), 20 + 5)
+        self.assertGreaterEqual(len(buffer), 20)
+
+    def test_delta_only_stores_changes(self):
+        """Test that deltas contain only the slots that changed"""
+        before = capture_state(self.game)
+        self.game.score += 10
+        indices, values = encode_delta(before, capture_state(self.game))
+        self.assertEqual(list(indices), [0])
+        self.assertEqual(list(values), [10])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the simulation clock and power-up timers
+"""
+import math
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.rewind import capture_state, restore_state
+from src.scheduler import Scheduler
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, POWERUP_DURATION, PADDLE_WIDTH, WIDE_PADDLE_WIDTH
+
+class TestScheduler(unittest.TestCase):
+    def test_timers_run_in_deadline_order(self):
+        """Test that due timers run once, earliest first"""
+        timers = Scheduler(step_ms=10)
+        ran = []
+        timers.schedule("b", 25, ran.append, "b")
+        timers.schedule("a", 15, ran.append, "a")
+        self.assertEqual(timers.advance(), 0)
+        self.assertEqual(timers.advance(), 1)
+        self.assertEqual(timers.advance(), 1)
+        self.assertEqual(ran, ["a", "b"])
+        self.assertEqual(len(timers), 0)
+
+    def test_rescheduling_replaces_the_timer(self):
+        """Test that scheduling a key again restarts it and the old deadline is skipped"""
+        timers = Scheduler(step_ms=10)
+        ran = []
+        timers.schedule("wide", 20, ran.append, 1)
+        timers.advance()
+        timers.schedule("wide", 20, ran.append, 2)
+        timers.advance()
+        self.assertEqual(ran, [])
+        self.assertEqual(timers.remaining("wide"), 10)
+        timers.advance()
+        self.assertEqual(ran, [2])
+
+    def test_cancel_and_remaining(self):
+        """Test that a cancelled timer never runs and has no time left"""
+        timers = Scheduler(step_ms=10)
+        ran = []
+        timers.schedule("slow", 10, ran.append, 1)
+        timers.cancel("slow")
+        timers.cancel("missing")
+        timers.advance()
+        self.assertEqual(ran, [])
+        self.assertEqual(timers.remaining("slow"), 0)
+
+    def test_heap_stays_bounded(self):
+        """Test that replaced entries are compacted away"""
+        timers = Scheduler()
+        for i in range(1000):
+            timers.schedule("wide", 1000 + i, print)
+        self.assertLess(len(timers._heap), 40)
+
+class TestPowerUpTimers(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game = Game(self.screen)
+        self.game.show_instructions = False
+        self.steps = math.ceil(POWERUP_DURATION["WIDE"] / self.game.timers.step_ms)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_wide_lasts_a_fixed_number_of_steps(self):
+        """Test that a power-up's duration is counted in simulated steps"""
+        self.game._apply_powerup("WIDE")
+        self.assertEqual(self.game.paddle.width, WIDE_PADDLE_WIDTH)
+        for _ in range(self.steps - 1):
+            self.game.update()
+        self.assertTrue(self.game.paddle.is_wide)
+        self.game.update()
+        self.assertFalse(self.game.paddle.is_wide)
+        self.assertEqual(self.game.paddle.width, PADDLE_WIDTH)
+
+    def test_pause_stops_the_clock(self):
+        """Test that paused updates don't use up a power-up"""
+        self.game._apply_powerup("STICKY")
+        self.game.paused = True
+        for _ in range(self.steps * 2):
+            self.game.update()
+        self.assertTrue(self.game.paddle.is_sticky)
+        self.assertEqual(self.game.timers.remaining((self.game.paddle, "STICKY")),
+                         POWERUP_DURATION["STICKY"])
+
+    def test_turbo_ends_power_ups_after_the_same_steps(self):
+        """Test that fast-forward expires a power-up in the same number of updates"""
+        self.game.turbo = 10
+        self.game._apply_powerup("WIDE")
+        self.game.advance(self.steps - 1)
+        self.assertTrue(self.game.paddle.is_wide)
+        self.game.advance(1)
+        self.assertFalse(self.game.paddle.is_wide)
+
+    def test_slow_ends_on_the_clock(self):
+        """Test that slow motion is ended by its timer"""
+        ball = self.game.balls.first()
+        self.game._apply_powerup("SLOW")
+        self.assertTrue(ball.is_slow)
+        self.game.timers.advance(POWERUP_DURATION["SLOW"])
+        self.assertFalse(ball.is_slow)
+
+    def test_rewind_restores_time_left(self):
+        """Test that restoring a state puts back the power-up's remaining time"""
+        self.game._apply_powerup("WIDE")
+        for _ in range(10):
+            self.game.update()
+        state = capture_state(self.game)
+        left = self.game.timers.remaining((self.game.paddle, "WIDE"))
+        for _ in range(20):
+            self.game.update()
+
+        restore_state(self.game, state)
+        self.assertAlmostEqual(self.game.timers.remaining((self.game.paddle, "WIDE")), left)
+
+        # A state without the power-up drops its timer
+        self.game.paddle.is_wide = False
+        restore_state(self.game, capture_state(self.game))
+        self.assertEqual(self.game.timers.remaining((self.game.paddle, "WIDE")), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for grid ray casts and trajectory prediction
+"""
+import math
+import random
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.brick_grid import BrickGrid, _sweep_rect
+from src.sprites import Ball, FACE_BOTTOM
+from src.trajectory import landing_x, path_dots, trace_path
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS
+
+class TestTrajectory(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        self.grid = self.game.brick_grid
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def test_raycast_matches_brute_force(self):
+        """Test that the DDA walk finds the same first brick as testing every brick"""
+        rng = random.Random(3)
+        for _ in range(300):
+            origin = (rng.uniform(0, SCREEN_WIDTH), rng.uniform(200, SCREEN_HEIGHT))
+            angle = rng.uniform(0, 2 * math.pi)
+            direction = (math.cos(angle), math.sin(angle))
+            hits = [(hit[0], brick) for brick in self.game.level_bricks
+                    for hit in [_sweep_rect(*origin, *direction, BALL_RADIUS, brick.rect)] if hit]
+            expected = min(hits, key=lambda h: h[0]) if hits else None
+            result = self.grid.raycast(origin, direction, BALL_RADIUS)
+            if expected is None:
+                self.assertIsNone(result)
+            else:
+                self.assertAlmostEqual(result[0], expected[0])
+
+    def test_ray_up_hits_brick_bottom(self):
+        """Test that a ball fired straight up stops below the lowest brick"""
+        brick = max(self.game.level_bricks, key=lambda b: (b.rect.bottom, -b.rect.x))
+        origin = (brick.rect.centerx, 600)
+        t, face, hit = self.grid.raycast(origin, (0, -1), BALL_RADIUS)
+        self.assertIs(hit, brick)
+        self.assertEqual(face, FACE_BOTTOM)
+        self.assertAlmostEqual(origin[1] - t, brick.rect.bottom + BALL_RADIUS)
+
+    def test_walls_reflect_path(self):
+        """Test that an empty field bounces off the side and top walls"""
+        empty = BrickGrid()
+        path = trace_path(empty, (100, 600), (-1, -1), BALL_RADIUS, 2)
+        # Left wall, top wall, then out through the bottom before reaching the right wall
+        self.assertEqual([p.kind for p in path], ["start", "wall", "wall", "floor"])
+        self.assertAlmostEqual(path[1].x, BALL_RADIUS)
+        self.assertAlmostEqual(path[2].y, BALL_RADIUS)
+
+    def test_path_ends_on_paddle(self):
+        """Test that a falling ball above the paddle ends the path there"""
+        paddle = self.game.paddle.rect
+        path = trace_path(BrickGrid(), (paddle.centerx, 300), (0, 1), BALL_RADIUS, 3, paddle)
+        self.assertEqual(path[-1].kind, "paddle")
+        self.assertAlmostEqual(path[-1].y, paddle.top - BALL_RADIUS)
+
+    def test_landing_x(self):
+        """Test the landing point of a ball reflected off a side wall"""
+        x = landing_x(BrickGrid(), (50, 100), (-1, 1), BALL_RADIUS, 500)
+        # 40 px to the wall, then 360 px back out
+        self.assertAlmostEqual(x, BALL_RADIUS + 360)
+
+    def test_path_dots_are_evenly_spaced(self):
+        """Test that dots follow the path at the requested spacing"""
+        path = trace_path(BrickGrid(), (640, 400), (0, -1), BALL_RADIUS, 0)
+        dots = path_dots(path, 10)
+        self.assertEqual(dots[0], (640, 390))
+        self.assertEqual(dots[1], (640, 380))
+
+    def test_launch_uses_previewed_angle(self):
+        """Test that launching follows the angle the preview showed"""
+        ball = Ball(640, 600)
+        angle = ball.launch_angle
+        ball.launch()
+        self.assertAlmostEqual(math.atan2(ball.dx, -ball.dy), angle)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for turbo (fast-forward) updates
+"""
+import random
+import unittest
+import pygame
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game import Game
+from src.pipeline import capture_snapshot
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, TURBO_LEVELS
+
+class TestTurbo(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        pygame.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        pygame.quit()
+
+    def _make_game(self):
+        """Create a seeded game in play under the autopilot"""
+        random.seed(7)
+        game = Game(self.screen)
+        game.font = pygame.font.Font(None, 24)
+        game.show_instructions = False
+        game.autopilot.enabled = True
+        return game
+
+    def test_turbo_matches_normal_speed(self):
+        """Test that skipping effects and renders doesn't change the simulation"""
+        normal = self._make_game()
+        for _ in range(3000):
+            normal.advance()
+            normal.render()
+        turbo = self._make_game()
+        turbo.turbo = 10
+        for _ in range(300):
+            turbo.advance()
+            turbo.render()
+        self.assertEqual(turbo.score, normal.score)
+        self.assertEqual([b.rect.center for b in turbo.balls], [b.rect.center for b in normal.balls])
+
+    def test_skipped_updates_make_no_effects(self):
+        """Test that only the displayed update spawns particles"""
+        game = self._make_game()
+        game.effects = False
+        game._add_particles(100, 100, (255, 255, 255), 10)
+        self.assertEqual(game.particles, [])
+
+        game.advance(5)
+        self.assertTrue(game.effects)
+
+    def test_hotkey_cycles_turbo(self):
+        """Test that T steps through the turbo levels and wraps around"""
+        game = self._make_game()
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_t)
+        seen = []
+        for _ in range(len(TURBO_LEVELS)):
+            game.handle_events(event)
+            seen.append(game.turbo)
+        self.assertEqual(seen, list(TURBO_LEVELS[1:]) + [TURBO_LEVELS[0]])
+
+    def test_snapshot_carries_turbo(self):
+        """Test that the pipelined HUD can show the turbo factor"""
+        game = self._make_game()
+        game.turbo = 10
+        self.assertEqual(capture_snapshot(game).turbo, 10)
+        game.render(capture_snapshot(game))
+
+if __name__ == '__main__':
+    unittest.main()